@@ -0,0 +1,324 @@
+"""
+auraview/application/config.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import json
+
+from PIL import Image
+
+from auraview.basic_functions.os_funs import get_config_dir
+from auraview.core.memory_governor import physical_memory
+
+CONFIG_FILE = "config.json"
+
+# every tunable and its default (the "workstation" behaviour)
+DEFAULTS = {
+    "image_ext": [
+        ".png", ".jpg", ".jpeg", ".heic", ".gif", ".webp", ".tif", ".tiff",
+        # camera RAW, shown through their embedded JPEG preview
+        ".cr2", ".nef", ".nrw", ".arw", ".sr2", ".dng", ".pef", ".orf", ".rw2",
+    ],
+    "resample": "lanczos",
+    # frames decoded ahead (slideshow lookahead, animation window)
+    "prefetch_depth": 8,
+    "frame_cache_items": 8,
+    "decode_workers": 2,
+    # worker processes decoding frames and thumbnails (0 = threads only)
+    "decode_processes": 0,
+    "thumbnail_workers": 4,
+    "metadata_workers": 8,
+    "stat_workers": 16,
+    "tile_workers": 2,
+    # low priority processes checking files for corruption (0 = off)
+    "verify_workers": 1,
+    # processes converting images in an export (0 = one per CPU)
+    "export_workers": 0,
+    # 0 = a share of physical RAM
+    "memory_mb": 0,
+    "thumbnail_cache_mb": 512,
+    # long edge of the on-disk previews of large images (0 = off)
+    "preview_size": 2560,
+    "preview_cache_mb": 1024,
+    # sub folder levels scanned when opening a folder
+    # (0 = that folder only, -1 = no limit)
+    "scan_depth": -1,
+    # decode through one daemon shared by all viewers (Unix only)
+    "shared_decoder": False,
+    # save the view on exit and reopen the same folder where it was left
+    "restore_session": True,
+}
+
+# smallest accepted value of the integer settings; the worker counts
+# that are optional accept 0 (off), the others need at least one
+MINIMUMS = {
+    "prefetch_depth": 1,
+    "frame_cache_items": 1,
+    "decode_workers": 1,
+    "decode_processes": 0,
+    "thumbnail_workers": 1,
+    "metadata_workers": 1,
+    "stat_workers": 1,
+    "tile_workers": 1,
+    "verify_workers": 0,
+    "export_workers": 0,
+    "memory_mb": 0,
+    "thumbnail_cache_mb": 1,
+    "preview_size": 0,
+    "preview_cache_mb": 1,
+    "scan_depth": -1,
+}
+
+PROFILES = {
+    "kiosk": {
+        "resample": "bilinear",
+        "prefetch_depth": 2,
+        "frame_cache_items": 3,
+        "decode_workers": 1,
+        "decode_processes": 0,
+        "thumbnail_workers": 1,
+        "metadata_workers": 2,
+        "stat_workers": 4,
+        "tile_workers": 1,
+        "verify_workers": 0,
+        "export_workers": 1,
+        "memory_mb": 256,
+        "thumbnail_cache_mb": 64,
+        "preview_size": 1920,
+        "preview_cache_mb": 256,
+    },
+    "workstation": {},
+    # high latency storage: many requests in flight, keep more on disk
+    "nas": {
+        "prefetch_depth": 8,
+        "frame_cache_items": 12,
+        "thumbnail_workers": 8,
+        "metadata_workers": 32,
+        "stat_workers": 64,
+        "thumbnail_cache_mb": 2048,
+        "preview_cache_mb": 4096,
+        "scan_depth": 3,
+    },
+}
+
+RESAMPLE_FILTERS = {
+    "nearest": Image.NEAREST,
+    "bilinear": Image.BILINEAR,
+    "bicubic": Image.BICUBIC,
+    "lanczos": Image.LANCZOS,
+}
+
+
+class ConfigError(ValueError):
+    """Invalid profile name, setting or value."""
+
+
+def detect_settings():
+    """
+    First-run defaults from the CPU count and the amount of RAM.
+
+    The detected values sit below the profile, so picking another
+    profile (e.g. --profile kiosk) still gets that profile's values.
+
+    :returns: {"profile": name, "detected": {...}, "settings": {}}
+    """
+    cpus = os.cpu_count() or 1
+    ram_mb = (physical_memory() or 0) // 2**20
+
+    if cpus <= 2 or (ram_mb and ram_mb < 3 * 1024):
+        return {"profile": "kiosk", "detected": {}, "settings": {}}
+    return {
+        "profile": "workstation",
+        "settings": {},
+        "detected": {
+            "decode_workers": max(2, min(cpus // 4, 8)),
+            "thumbnail_workers": max(2, min(cpus // 2, 16)),
+            "decode_processes": min(cpus // 2, 8) if cpus >= 4 else 0,
+        },
+    }
+
+
+def _file_section(stored, section):
+    """
+    Validated {key: value} of one section of the config file.
+    """
+    found = stored.get(section, {})
+    if not isinstance(found, dict):
+        raise ConfigError(f"\"{section}\" in config file must be a JSON object")
+    for key, value in found.items():
+        if key not in DEFAULTS:
+            raise ConfigError(f"unknown setting {key!r} in config file")
+        try:
+            check_value(key, value)
+        except ConfigError as e:
+            raise ConfigError(f"config file: {e}") from None
+    return found
+
+
+def parse_value(key, text):
+    """
+    Convert a --set value to the type of the setting's default.
+
+    :param key: Setting name
+    :param text: Value as typed on the command line
+    """
+    if key not in DEFAULTS:
+        raise ConfigError(f"unknown setting {key!r}")
+    default = DEFAULTS[key]
+    if isinstance(default, list):
+        return [v.strip() for v in text.split(",") if v.strip()]
+    # bool before int: bool is a subclass of int
+    if isinstance(default, bool):
+        if text.lower() in ("1", "true", "yes", "on"):
+            return True
+        if text.lower() in ("0", "false", "no", "off"):
+            return False
+        raise ConfigError(f"{key} expects true or false, got {text!r}")
+    if isinstance(default, int):
+        try:
+            return int(text)
+        except ValueError:
+            raise ConfigError(f"{key} expects an integer, got {text!r}") from None
+    return text
+
+
+def check_value(key, value):
+    """
+    Raise ConfigError unless value has the type of the setting's default
+    and, for integers, is within MINIMUMS.
+
+    :param key: Setting name
+    :param value: Parsed value (from the config file or parse_value)
+    """
+    default = DEFAULTS[key]
+    if isinstance(default, list):
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ConfigError(f"{key} expects a list of strings, got {value!r}")
+    elif isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ConfigError(f"{key} expects true or false, got {value!r}")
+    elif isinstance(default, int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ConfigError(f"{key} expects an integer, got {value!r}")
+        if value < MINIMUMS[key]:
+            raise ConfigError(f"{key} must be at least {MINIMUMS[key]}, got {value}")
+    elif not isinstance(value, str):
+        raise ConfigError(f"{key} expects a string, got {value!r}")
+
+
+class Settings:
+    """
+    Effective configuration, read as attributes (settings.decode_workers).
+
+    Layers, later ones winning: DEFAULTS, the "detected" values of the
+    config file, the profile, the "settings" of the config file, command
+    line overrides. The file is created on first run with an auto-detected
+    profile and worker counts.
+    """
+
+    def __init__(self):
+        self.profile = "workstation"
+        self._values = dict(DEFAULTS)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["_values"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def resample_filter(self):
+        """
+        PIL resampling filter for display scaling.
+        """
+        return RESAMPLE_FILTERS[self._values["resample"]]
+
+    def load(self, profile=None, overrides=(), path=None):
+        """
+        (Re)build the settings.
+
+        :param profile: Profile name overriding the file's choice
+        :param overrides: Iterable of "key=value" strings
+        :param path: Config file (default: user config dir)
+        """
+        stored = read_config_file(path)
+        name = profile or stored.get("profile") or "workstation"
+        if name not in PROFILES:
+            raise ConfigError(
+                f"unknown profile {name!r} (choose from {', '.join(PROFILES)})"
+            )
+
+        detected = _file_section(stored, "detected")
+        file_settings = _file_section(stored, "settings")
+        if "detected" not in stored and file_settings == detect_settings()["detected"]:
+            # written by an older first run, which put the detected values
+            # into "settings", above every profile
+            detected, file_settings = file_settings, {}
+
+        values = dict(DEFAULTS)
+        values.update(detected)
+        values.update(PROFILES[name])
+        values.update(file_settings)
+        for item in overrides:
+            key, sep, text = item.partition("=")
+            if not sep:
+                raise ConfigError(f"expected KEY=VALUE, got {item!r}")
+            value = parse_value(key.strip(), text.strip())
+            check_value(key.strip(), value)
+            values[key.strip()] = value
+
+        if values["resample"] not in RESAMPLE_FILTERS:
+            raise ConfigError(
+                f"resample must be one of {', '.join(RESAMPLE_FILTERS)}"
+            )
+        self.profile = name
+        self._values = values
+        return self
+
+    def restore(self, values):
+        """
+        Adopt the values of another process's as_dict().
+        """
+        self._values = dict(values)
+
+    def as_dict(self):
+        """
+        Copy of the effective values.
+        """
+        return dict(self._values)
+
+
+def config_path():
+    """
+    Path of the user config file.
+    """
+    return os.path.join(get_config_dir(), CONFIG_FILE)
+
+
+def read_config_file(path=None):
+    """
+    Return the stored config, writing auto-detected defaults on first run.
+    """
+    path = path or config_path()
+    if not os.path.exists(path):
+        stored = detect_settings()
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(stored, f, indent=2)
+        except OSError:
+            pass
+        return stored
+    try:
+        with open(path, encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"cannot read {path}: {e}") from None
+    if not isinstance(stored, dict):
+        raise ConfigError(f"{path} must hold a JSON object")
+    return stored
+
+
+# the process-wide settings; main() loads them before the GUI starts
+settings = Settings()
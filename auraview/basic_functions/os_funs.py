@@ -6,6 +6,11 @@ Date: 2025-12-16
 """
 
 import os
+import io
+import sys
+import gzip
+import bz2
+import lzma
 import shutil
 
 import pandas as pd
@@ -83,14 +88,15 @@ def read_excel(file, page_name=None):
         df = pd.read_excel(xls, page_name)
     return df
 
-def read_csv(file):
+def read_csv(file, **kwargs):
     """
     Docstring for read_csv
 
     :param file: Description
+    :param kwargs: Passed to pandas.read_csv (e.g. chunksize, usecols)
     """
     #read a csv file to df
-    return(pd.read_csv(file))
+    return(pd.read_csv(file, **kwargs))
 
 def move(c_path, d_path):
     """
@@ -123,3 +129,90 @@ def get_file_size(file):
     """
     out = round(os.path.getsize(file) / (1024 * 1024), 2)
     return out
+
+def get_cache_dir(*parts):
+    """
+    Return (and create) the per-user cache directory for auraview.
+
+    :param parts: Optional sub directories inside the cache root
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(
+            os.path.join('~', 'AppData', 'Local')
+        )
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(
+            os.path.join('~', '.cache')
+        )
+    out = os.path.join(base, 'auraview', *parts)
+    os.makedirs(out, exist_ok=True)
+    return out
+
+def get_config_dir(*parts):
+    """
+    Return (and create) the per-user configuration directory for auraview.
+
+    :param parts: Optional sub directories inside the config root
+    """
+    if os.name == 'nt':
+        base = os.environ.get('APPDATA') or os.path.expanduser(
+            os.path.join('~', 'AppData', 'Roaming')
+        )
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(
+            os.path.join('~', 'Library', 'Application Support')
+        )
+    else:
+        base = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser(
+            os.path.join('~', '.config')
+        )
+    out = os.path.join(base, 'auraview', *parts)
+    os.makedirs(out, exist_ok=True)
+    return out
+
+# leading bytes of the compressed formats open_text_stream understands
+COMPRESSED_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'BZh': 'bz2',
+    b'\xfd7zXZ\x00': 'xz',
+    b'\x28\xb5\x2f\xfd': 'zstd',
+}
+
+def open_text_stream(file, encoding='utf-8'):
+    """
+    Open a text file for streaming reads, transparently decompressing
+    gzip, bz2 and xz (and zstd where the stdlib provides it).
+    '-' reads from stdin.
+
+    :param file: Path or '-'
+    :param encoding: Text encoding
+    """
+    if file == '-':
+        return sys.stdin
+
+    with open(file, 'rb') as f:
+        head = f.read(6)
+
+    kind = None
+    for magic, name in COMPRESSED_MAGIC.items():
+        if head.startswith(magic):
+            kind = name
+            break
+
+    if kind == 'gzip':
+        return gzip.open(file, 'rt', encoding=encoding, errors='surrogateescape')
+    if kind == 'bz2':
+        return bz2.open(file, 'rt', encoding=encoding, errors='surrogateescape')
+    if kind == 'xz':
+        return lzma.open(file, 'rt', encoding=encoding, errors='surrogateescape')
+    if kind == 'zstd':
+        try:
+            from compression import zstd  # Python 3.14+
+        except ImportError as e:
+            raise OSError('zstd logfiles need Python 3.14 or newer') from e
+        return io.TextIOWrapper(
+            zstd.open(file, 'rb'), encoding=encoding, errors='surrogateescape'
+        )
+    return open(file, 'r', encoding=encoding, errors='surrogateescape')
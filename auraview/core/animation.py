@@ -0,0 +1,172 @@
+"""
+auraview/core/animation.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import threading
+
+from auraview.core.photo_module import fit_size
+from auraview.core.memory_governor import governor, image_bytes
+from auraview.application.config import settings
+
+# decoded frames kept ahead of the playback position
+FRAME_WINDOW = 8
+# window used while the memory governor reports pressure
+MIN_FRAME_WINDOW = 2
+# GIF/WebP frames without a usable duration (browsers use the same rule)
+DEFAULT_DURATION = 100
+MIN_DURATION = 20
+# pages of a multi-page TIFF / HEIF sequence carry no timing
+PAGE_DURATION = 1000
+ANIMATION_FORMATS = {"GIF", "WEBP", "PNG"}
+# MPO is left out: its extra frames are depth maps or previews of one photo
+MULTI_FRAME_FORMATS = ANIMATION_FORMATS | {"TIFF", "HEIF"}
+
+
+def is_multi_frame(im):
+    """
+    True if an opened image has more than one frame to play.
+
+    Uses is_animated, which only looks for a second frame, instead of
+    n_frames, which walks a whole GIF.
+    """
+    if im.format not in MULTI_FRAME_FORMATS:
+        return False
+    return bool(getattr(im, "is_animated", False))
+
+
+def frame_duration(im):
+    """
+    Display time in ms of the frame im is currently seeked to.
+    """
+    if im.format not in ANIMATION_FORMATS:
+        return PAGE_DURATION
+    duration = im.info.get("duration") or 0
+    if duration < MIN_DURATION:
+        return DEFAULT_DURATION
+    return int(duration)
+
+
+class FrameSequence:
+    """
+    Plays the frames of one animated or multi-page image.
+
+    A background thread decodes frames in order (GIF and WebP can only be
+    decoded forwards) and resizes them for display. It stays at most
+    `window` frames ahead of the playback position and frames behind it
+    are dropped, so memory does not depend on the animation length.
+    Frames are keyed by a running counter; at the end of the file the
+    decoder wraps to frame 0 and the counter keeps going, so looping
+    needs no special case.
+    """
+
+    def __init__(self, source, width, height, window=FRAME_WINDOW):
+        self.path = source.path
+        self.width = width
+        self.height = height
+        self.window = window
+        self.position = 0
+        # number of frames, known once the decoder reached the end
+        self.frame_count = None
+        self.frames = {}
+        self._image = source.open_image()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="auraview-frames", daemon=True
+        )
+        self._thread.start()
+
+    # -------------------------------------------------
+    # Playback
+    # -------------------------------------------------
+    def current(self):
+        """
+        Return (image, duration_ms) at the playback position, or None if
+        it is not decoded yet.
+        """
+        with self._cond:
+            return self.frames.get(self.position)
+
+    def advance(self):
+        """
+        Step to the next frame if it is decoded.
+
+        :returns: (image, duration_ms), or None to keep the current frame
+        """
+        with self._cond:
+            frame = self.frames.get(self.position + 1)
+            if frame is None:
+                return None
+            old = self.frames.pop(self.position, None)
+            self.position += 1
+            self._cond.notify_all()
+        if old is not None:
+            governor.charge("animation", -image_bytes(old))
+        return frame
+
+    def frame_index(self):
+        """
+        Index of the displayed frame within the file.
+        """
+        if self.frame_count:
+            return self.position % self.frame_count
+        return self.position
+
+    def close(self):
+        """
+        Stop the decoder and release every frame.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        # at most one frame decode to wait for
+        self._thread.join()
+        governor.charge("animation", -image_bytes(tuple(self.frames.values())))
+        self.frames.clear()
+
+    # -------------------------------------------------
+    # Decoder
+    # -------------------------------------------------
+    def _run(self):
+        counter = 0
+        index = 0
+        try:
+            while True:
+                with self._cond:
+                    while not self._stopped and counter - self.position > self._window():
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+                try:
+                    self._image.seek(index)
+                except EOFError:
+                    if index == 0:
+                        return
+                    self.frame_count = index
+                    index = 0
+                    continue
+                frame = self._render()
+                governor.charge("animation", image_bytes(frame))
+                with self._cond:
+                    self.frames[counter] = frame
+                    self._cond.notify_all()
+                counter += 1
+                index += 1
+        except (OSError, ValueError) as e:
+            print(f"Cannot decode frame {index} of {self.path}: {e}")
+        finally:
+            self._image.close()
+
+    def _window(self):
+        return MIN_FRAME_WINDOW if governor.pressure() else self.window
+
+    def _render(self):
+        im = self._image
+        duration = frame_duration(im)
+        frame = im.convert("RGBA")
+        frame = frame.resize(
+            fit_size(frame.size, self.width, self.height), settings.resample_filter
+        )
+        return frame, duration
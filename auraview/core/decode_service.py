@@ -0,0 +1,457 @@
+"""
+auraview/core/decode_service.py
+
+Shared decode daemon: several viewer processes on one machine send
+(path, size) requests over a Unix socket to one daemon that decodes, keeps
+the results in shared memory and answers with the segment name. Viewers
+map the segment and build the PIL image from it: RGBA frames wrap the
+mapping as is, RGB frames take one copy (Pillow only maps 1 and 4 byte
+per pixel modes), instead of the pixels crossing the socket.
+
+    python -m auraview.core.decode_service SOCKET [--workers N] ...
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import json
+import time
+import socket
+import struct
+import argparse
+import threading
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from multiprocessing import shared_memory, resource_tracker
+
+from PIL import Image
+from pillow_heif import register_heif_opener
+
+from auraview.basic_functions.os_funs import get_cache_dir
+from auraview.core.photo_module import create_image_obj
+from auraview.application.config import settings, ConfigError
+
+register_heif_opener()
+
+SOCKET_NAME = "decode.sock"
+LOCK_NAME = "decode.lock"
+DAEMON_WORKERS = 4
+DAEMON_CACHE_MB = 512
+# the daemon exits after this many seconds without clients
+IDLE_TIMEOUT = 120
+START_TIMEOUT = 5.0
+HEADER = struct.Struct("!I")
+
+
+class DecodeServiceError(OSError):
+    """The decode daemon could not be reached."""
+
+
+class RemoteDecodeError(DecodeServiceError):
+    """The daemon is up but could not decode the file."""
+
+
+def available():
+    """
+    True if this platform supports the shared decoder (Unix sockets).
+    """
+    return hasattr(socket, "AF_UNIX") and os.name == "posix"
+
+
+def default_socket_path():
+    """
+    Socket path in the per-user runtime (or cache) directory.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        base = os.path.join(runtime, "auraview")
+        os.makedirs(base, exist_ok=True)
+    else:
+        base = get_cache_dir("daemon")
+    return os.path.join(base, SOCKET_NAME)
+
+
+# -------------------------------------------------
+# Protocol: 4 byte length + JSON, both directions
+# -------------------------------------------------
+def send_message(sock, message):
+    """
+    Send one JSON message.
+    """
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def recv_message(sock):
+    """
+    Receive one JSON message.
+    """
+    (length,) = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    return json.loads(_recv_exact(sock, length).decode("utf-8"))
+
+
+def attach_segment(name):
+    """
+    Map an existing shared memory segment without letting this process's
+    resource tracker unlink it at exit (the daemon owns it).
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # pylint: disable=protected-access
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except (AttributeError, KeyError):
+        pass
+    return shm
+
+
+# -------------------------------------------------
+# Daemon
+# -------------------------------------------------
+class DecodeDaemon:
+    """
+    Owns the worker pool and the frame cache shared by all viewers.
+
+    Frames are stored as raw RGB/RGBA pixels in shared memory segments,
+    keyed by (path, mtime, size, width, height), and evicted least
+    recently used over max_bytes. Identical requests arriving together
+    share one decode. An evicted segment is unlinked at once; viewers that
+    still map it keep valid pages until they let go.
+    """
+
+    def __init__(
+            self,
+            socket_path,
+            workers=DAEMON_WORKERS,
+            max_bytes=DAEMON_CACHE_MB * 2**20,
+            idle_timeout=IDLE_TIMEOUT
+        ):
+        self.socket_path = socket_path
+        self.max_bytes = max_bytes
+        self.idle_timeout = idle_timeout
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.frames = OrderedDict()
+        self.nbytes = 0
+        self.pending = {}
+        self.clients = 0
+        self.last_active = time.monotonic()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server = None
+
+    def serve(self):
+        """
+        Accept viewers until idle for idle_timeout seconds.
+        """
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        self._server.listen()
+        self._server.settimeout(1.0)
+        try:
+            while not self._stopped.is_set():
+                try:
+                    conn, _ = self._server.accept()
+                except socket.timeout:
+                    if self._idle():
+                        break
+                    continue
+                with self._lock:
+                    self.clients += 1
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self.shutdown()
+
+    def _idle(self):
+        with self._lock:
+            return (self.clients == 0
+                    and time.monotonic() - self.last_active > self.idle_timeout)
+
+    def _handle(self, conn):
+        try:
+            with conn:
+                while True:
+                    try:
+                        request = recv_message(conn)
+                    except (ConnectionError, OSError, ValueError):
+                        return
+                    self.last_active = time.monotonic()
+                    send_message(conn, self._answer(request))
+        finally:
+            with self._lock:
+                self.clients -= 1
+                self.last_active = time.monotonic()
+
+    def _answer(self, request):
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "stats":
+            return {"ok": True, "frames": len(self.frames), "bytes": self.nbytes,
+                    "clients": self.clients}
+        if op != "frame":
+            return {"ok": False, "error": f"unknown op {op!r}"}
+        try:
+            path = request["path"]
+            width, height = int(request["width"]), int(request["height"])
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size, width, height)
+            return self._frame(key).result()
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _frame(self, key):
+        with self._lock:
+            entry = self.frames.get(key)
+            if entry is not None:
+                self.frames.move_to_end(key)
+                future = Future()
+                future.set_result(entry[1])
+                return future
+            future = self.pending.get(key)
+            if future is None:
+                future = self.pool.submit(self._decode, key)
+                self.pending[key] = future
+            return future
+
+    def _decode(self, key):
+        path, _, _, width, height = key
+        try:
+            img = create_image_obj(path, width, height)
+            mode = "RGBA" if img.mode in ("RGBA", "LA", "PA") else "RGB"
+            if img.mode != mode:
+                img = img.convert(mode)
+            data = img.tobytes()
+            shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            shm.buf[:len(data)] = data
+            reply = {"ok": True, "shm": shm.name, "mode": mode,
+                     "size": list(img.size), "nbytes": len(data)}
+            with self._lock:
+                self.frames[key] = (shm, reply)
+                self.nbytes += shm.size
+                self._evict()
+            return reply
+        finally:
+            with self._lock:
+                self.pending.pop(key, None)
+
+    def _evict(self):
+        # called with the lock held; the newest frame always stays
+        while self.nbytes > self.max_bytes and len(self.frames) > 1:
+            _, (shm, _) = self.frames.popitem(last=False)
+            self.nbytes -= shm.size
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self):
+        """
+        Stop serving and unlink every segment and the socket.
+        """
+        self._stopped.set()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+        self.pool.shutdown(wait=False)
+        with self._lock:
+            for shm, _ in self.frames.values():
+                shm.close()
+                shm.unlink()
+            self.frames.clear()
+            self.nbytes = 0
+
+
+def run_daemon(socket_path, **kwargs):
+    """
+    Run a daemon unless one already serves this socket (flock guarded).
+    """
+    import fcntl
+    lock_path = os.path.join(os.path.dirname(socket_path), LOCK_NAME)
+    with open(lock_path, "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return
+        DecodeDaemon(socket_path, **kwargs).serve()
+
+
+# -------------------------------------------------
+# Client
+# -------------------------------------------------
+class DecodeClient:
+    """
+    Viewer side of the shared decoder.
+
+    frame() returns a PIL image whose pixels live in the daemon's shared
+    memory segment. Each thread has its own connection. Mapped segments
+    are kept while images may still use them and closed once they can be
+    (a mapping still referenced by an image is retried later).
+    """
+
+    def __init__(self, socket_path=None, autostart=True, max_mapped=32, daemon_args=()):
+        self.socket_path = socket_path or default_socket_path()
+        self.autostart = autostart
+        self.max_mapped = max_mapped
+        self.daemon_args = list(daemon_args)
+        self._local = threading.local()
+        self._mapped = OrderedDict()
+        self._closing = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            return sock
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            if not self.autostart:
+                raise DecodeServiceError(f"no decode daemon at {self.socket_path}")
+            sock = self._start_daemon()
+        self._local.sock = sock
+        return sock
+
+    def _start_daemon(self):
+        """
+        Launch the daemon in its own session and wait for its socket.
+        """
+        subprocess.Popen(
+            [sys.executable, "-m", "auraview.core.decode_service",
+             self.socket_path, *self.daemon_args],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, start_new_session=True, close_fds=True
+        )
+        deadline = time.monotonic() + START_TIMEOUT
+        while time.monotonic() < deadline:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except OSError:
+                sock.close()
+                time.sleep(0.05)
+        raise DecodeServiceError("decode daemon did not start")
+
+    def request(self, message):
+        """
+        Send one request and return the reply (reconnecting once).
+        """
+        for attempt in (0, 1):
+            sock = self._connect()
+            try:
+                send_message(sock, message)
+                return recv_message(sock)
+            except (ConnectionError, OSError, ValueError):
+                sock.close()
+                self._local.sock = None
+                if attempt:
+                    raise DecodeServiceError("decode daemon connection lost") from None
+        return None
+
+    def frame(self, path, width, height):
+        """
+        Return the display frame of path fitting width x height.
+
+        RGBA frames are views of the daemon's segment; RGB frames are
+        copied out of it once by Image.frombuffer.
+
+        :raises DecodeServiceError: daemon unreachable
+        :raises RemoteDecodeError: the daemon could not decode path
+        """
+        reply = self.request(
+            {"op": "frame", "path": path, "width": width, "height": height}
+        )
+        if not reply.get("ok"):
+            raise RemoteDecodeError(reply.get("error", "decode failed"))
+        try:
+            shm = self._map(reply["shm"])
+        except FileNotFoundError:
+            # evicted between the reply and the mapping: ask once more
+            reply = self.request(
+                {"op": "frame", "path": path, "width": width, "height": height}
+            )
+            if not reply.get("ok"):
+                raise RemoteDecodeError(reply.get("error", "decode failed")) from None
+            shm = self._map(reply["shm"])
+        mode = reply["mode"]
+        size = tuple(reply["size"])
+        view = shm.buf[:reply["nbytes"]]
+        return Image.frombuffer(mode, size, view, "raw", mode, 0, 1)
+
+    def _map(self, name):
+        with self._lock:
+            shm = self._mapped.get(name)
+            if shm is not None:
+                self._mapped.move_to_end(name)
+                return shm
+            shm = attach_segment(name)
+            self._mapped[name] = shm
+            while len(self._mapped) > self.max_mapped:
+                self._closing.append(self._mapped.popitem(last=False)[1])
+            self._closing = [s for s in self._closing if not _try_close(s)]
+            return shm
+
+    def close(self):
+        """
+        Drop this client's connection and mappings (the daemon keeps
+        running until it is idle).
+        """
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+        with self._lock:
+            for shm in list(self._mapped.values()) + self._closing:
+                _try_close(shm)
+            self._mapped.clear()
+            self._closing = []
+
+
+def _try_close(shm):
+    try:
+        shm.close()
+        return True
+    except BufferError:
+        # an image still uses the pixels; try again later
+        return False
+
+
+def main(argv=None):
+    """
+    Daemon entry point.
+    """
+    parser = argparse.ArgumentParser(prog="auraview-decode-daemon")
+    parser.add_argument("socket", nargs="?", default=None)
+    parser.add_argument("--workers", type=int, default=DAEMON_WORKERS)
+    parser.add_argument("--cache-mb", type=int, default=DAEMON_CACHE_MB)
+    parser.add_argument("--idle", type=float, default=IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    try:
+        # same resampling and limits as the viewers of this user
+        settings.load()
+    except ConfigError as e:
+        print(e)
+    run_daemon(
+        args.socket or default_socket_path(), workers=args.workers,
+        max_bytes=args.cache_mb * 2**20, idle_timeout=args.idle
+    )
+
+
+if __name__ == "__main__":
+    main()
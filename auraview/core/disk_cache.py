@@ -0,0 +1,128 @@
+"""
+auraview/core/disk_cache.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import hashlib
+import tempfile
+import threading
+
+from PIL import Image
+
+from auraview.basic_functions.os_funs import get_cache_dir
+
+# prune the cache directory after this many writes
+PRUNE_EVERY = 200
+
+
+class ImageDiskCache:
+    """
+    Persistent cache of small rendered images (thumbnails, previews).
+
+    Entries are keyed by path, mtime and size of the source file, so an
+    edited file simply misses. Hits refresh the entry's mtime and the
+    oldest entries are pruned once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, name, max_bytes, quality=85):
+        self.root = get_cache_dir(name)
+        self.max_bytes = max_bytes
+        self.quality = quality
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def key(self, path, stat=None, extra=""):
+        """
+        Return the cache key of a file, or None if it cannot be stat'ed.
+
+        :param path: Source image path
+        :param stat: os.stat_result if already known
+        :param extra: Anything else the rendering depends on (e.g. size)
+        """
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+        raw = f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{extra}"
+        return hashlib.sha1(raw.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.root, key[:2], key + ".jpg")
+
+    def get(self, key):
+        """
+        Return the cached image (fully loaded) or None.
+
+        :param key: Output of key()
+        """
+        if key is None:
+            return None
+        file = self._file(key)
+        try:
+            with Image.open(file) as im:
+                im.load()
+            os.utime(file)
+        except (OSError, ValueError):
+            return None
+        return im
+
+    def put(self, key, image):
+        """
+        Store an image under key (written atomically).
+
+        :param key: Output of key()
+        :param image: PIL image
+        """
+        if key is None:
+            return
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(file), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                image.save(f, "JPEG", quality=self.quality)
+            os.replace(tmp, file)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def prune(self):
+        """
+        Delete least recently used entries until the cache fits max_bytes.
+        """
+        entries = []
+        total = 0
+        for sub in os.scandir(self.root):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, file in entries:
+            try:
+                os.remove(file)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes * 0.9:
+                break
@@ -0,0 +1,233 @@
+"""
+auraview/core/exporter.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from PIL import Image, ImageOps
+from pillow_heif import register_heif_opener
+
+from auraview.core.image_source import open_image
+
+# worker processes import this module, so they can read HEIC too
+register_heif_opener()
+
+# output format -> file extension
+EXPORT_FORMATS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+EXIF_ORIENTATION = 0x0112
+
+
+def normalize_export_format(name):
+    """
+    Map a user given format name (jpg, JPEG, webp, ...) to a Pillow format.
+    """
+    fmt = name.strip().upper()
+    if fmt == "JPG":
+        fmt = "JPEG"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"unsupported export format {name!r} (choose from "
+            f"{', '.join(f.lower() for f in EXPORT_FORMATS)})"
+        )
+    return fmt
+
+
+def export_one(src, dst, fmt, max_size=None, quality=85):
+    """
+    Decode src, shrink it to fit max_size x max_size, and write it to dst
+    in fmt. EXIF and the ICC profile are kept; the pixels are rotated
+    upright and the orientation tag reset, so every viewer shows the
+    same thing. Runs in a worker process.
+
+    :param src: Source image path
+    :param dst: Destination path (written via a temporary file)
+    :param fmt: One of EXPORT_FORMATS
+    :param max_size: Longest edge in pixels, or None to keep the size
+    :param quality: JPEG/WebP quality 1..100
+    :returns: (src, dst, source format, bytes in, bytes out, seconds)
+    """
+    start = time.perf_counter()
+    with open_image(src) as im:
+        in_format = im.format or "unknown"
+        if max_size:
+            # reduced-scale JPEG decode when only a small copy is wanted
+            im.draft("RGB", (max_size, max_size))
+        exif = im.getexif()
+        icc = im.info.get("icc_profile")
+        img = ImageOps.exif_transpose(im)
+
+    if max_size:
+        img.thumbnail((max_size, max_size), Image.LANCZOS, reducing_gap=3.0)
+    if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    options = {}
+    if exif:
+        exif[EXIF_ORIENTATION] = 1
+        options["exif"] = exif.tobytes()
+    if icc:
+        options["icc_profile"] = icc
+    if fmt in ("JPEG", "WEBP"):
+        options["quality"] = quality
+    if fmt == "JPEG":
+        options["optimize"] = True
+
+    tmp = dst + ".part"
+    try:
+        img.save(tmp, fmt, **options)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return (
+        src, dst, in_format, os.path.getsize(src), os.path.getsize(dst),
+        time.perf_counter() - start
+    )
+
+
+class ExportStats:
+    """
+    Per source format counters of one export run.
+    """
+
+    def __init__(self):
+        self.formats = {}
+        self.failed = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add(self, result):
+        """
+        Account for one export_one() result.
+        """
+        _, _, in_format, bytes_in, bytes_out, seconds = result
+        row = self.formats.setdefault(
+            in_format, {"files": 0, "bytes_in": 0, "bytes_out": 0, "seconds": 0.0}
+        )
+        row["files"] += 1
+        row["bytes_in"] += bytes_in
+        row["bytes_out"] += bytes_out
+        row["seconds"] += seconds
+
+    @property
+    def done(self):
+        """
+        Number of files exported.
+        """
+        return sum(row["files"] for row in self.formats.values())
+
+    def report(self):
+        """
+        Printable throughput summary, one line per source format.
+        """
+        lines = [
+            f"exported {self.done} file(s), {len(self.failed)} failed, "
+            f"in {self.elapsed:.1f} s"
+        ]
+        for fmt, row in sorted(self.formats.items()):
+            seconds = row["seconds"] or 1e-9
+            lines.append(
+                f"  {fmt:8} {row['files']:6d} files  "
+                f"{row['files'] / seconds:7.1f} files/s/worker  "
+                f"{row['bytes_in'] / 2**20 / seconds:7.1f} MiB/s in  "
+                f"{row['bytes_in'] / 2**20:8.1f} -> {row['bytes_out'] / 2**20:8.1f} MiB"
+            )
+        return "\n".join(lines)
+
+
+class ExportPipeline:
+    """
+    Convert many images across a process pool.
+
+    At most `max_in_flight` files are submitted at a time, so queued
+    work never holds more than that many decoded images, however long
+    the input list is. Results are reported as they complete.
+    """
+
+    def __init__(
+            self,
+            paths,
+            out_dir,
+            fmt="JPEG",
+            max_size=None,
+            quality=85,
+            workers=None,
+            max_in_flight=None
+        ):
+        self.paths = paths
+        self.out_dir = out_dir
+        self.fmt = normalize_export_format(fmt)
+        self.max_size = max_size
+        self.quality = quality
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self.stats = ExportStats()
+        self._stopped = False
+        self._taken = set()
+
+    def stop(self):
+        """
+        Stop submitting new files; running ones finish.
+        """
+        self._stopped = True
+
+    def destination(self, src):
+        """
+        Output path for src in out_dir, never overwriting an existing file.
+        """
+        root = os.path.splitext(os.path.basename(src))[0]
+        ext = EXPORT_FORMATS[self.fmt]
+        dst = os.path.join(self.out_dir, root + ext)
+        n = 1
+        while dst in self._taken or os.path.exists(dst):
+            dst = os.path.join(self.out_dir, f"{root}_{n}{ext}")
+            n += 1
+        self._taken.add(dst)
+        return dst
+
+    def run(self, on_progress=None):
+        """
+        Export every path; returns the ExportStats.
+
+        :param on_progress: Optional callback(stats, result, error) called
+            in this thread after each file (result is None on error)
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        paths = iter(self.paths)
+        pending = {}
+        # spawn: forking a process that runs Tk and threads is not safe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            while True:
+                while not self._stopped and len(pending) < self.max_in_flight:
+                    src = next(paths, None)
+                    if src is None:
+                        break
+                    future = pool.submit(
+                        export_one, src, self.destination(src), self.fmt,
+                        self.max_size, self.quality
+                    )
+                    pending[future] = src
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    src = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.stats.failed.append((src, str(e)))
+                        result, error = None, e
+                    else:
+                        self.stats.add(result)
+                        error = None
+                    if on_progress is not None:
+                        on_progress(self.stats, result, error)
+        self.stats.elapsed = time.perf_counter() - self.stats.started
+        return self.stats
@@ -0,0 +1,296 @@
+"""
+auraview/core/file_list.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+from bisect import bisect_left
+from array import array
+from collections.abc import MutableSequence
+
+# entries per block; blocks are split when they grow past 2 * BLOCK
+BLOCK = 256
+ENCODING = "utf-8"
+ERRORS = "surrogateescape"
+
+
+def _split(path):
+    """
+    Split a path into (directory prefix incl. separator, basename).
+    """
+    name = os.path.basename(path)
+    return path[:len(path) - len(name)], name
+
+
+class _Block:
+    """
+    A run of entries: directory ids plus utf-8 basenames packed in one blob.
+    Entry k spans blob[offsets[k]:offsets[k + 1]].
+    """
+    __slots__ = ("dir_ids", "offsets", "blob")
+
+    def __init__(self):
+        self.dir_ids = array("I")
+        self.offsets = array("I", [0])
+        self.blob = bytearray()
+
+    def __len__(self):
+        return len(self.dir_ids)
+
+    def name(self, k):
+        return self.blob[self.offsets[k]:self.offsets[k + 1]].decode(
+            ENCODING, ERRORS
+        )
+
+    def append(self, dir_id, raw):
+        self.dir_ids.append(dir_id)
+        self.blob += raw
+        self.offsets.append(len(self.blob))
+
+    def insert(self, k, dir_id, raw):
+        start = self.offsets[k]
+        self.dir_ids.insert(k, dir_id)
+        self.blob[start:start] = raw
+        size = len(raw)
+        tail = array("I", (o + size for o in self.offsets[k:]))
+        self.offsets[k + 1:] = tail
+        self.offsets[k] = start
+
+    def delete(self, k):
+        start, end = self.offsets[k], self.offsets[k + 1]
+        size = end - start
+        del self.dir_ids[k]
+        del self.blob[start:end]
+        tail = array("I", (o - size for o in self.offsets[k + 2:]))
+        self.offsets[k + 1:] = tail
+
+    def split(self):
+        """
+        Move the upper half of this block into a new block and return it.
+        """
+        half = len(self) // 2
+        cut = self.offsets[half]
+        other = _Block()
+        other.dir_ids = self.dir_ids[half:]
+        other.blob = self.blob[cut:]
+        other.offsets = array("I", (o - cut for o in self.offsets[half:]))
+        del self.dir_ids[half:]
+        del self.blob[cut:]
+        del self.offsets[half + 1:]
+        return other
+
+
+class FileList(MutableSequence):
+    """
+    Compact sequence of absolute paths for very large collections.
+
+    Directory prefixes are interned once and basenames are packed into
+    blocks of about BLOCK entries. A Fenwick tree over block lengths gives
+    O(log n) index lookup and O(log n + BLOCK) insertion and removal,
+    instead of the O(n) pointer shift of list.pop().
+    """
+
+    def __init__(self, paths=()):
+        self._dirs = []
+        self._dir_ids = {}
+        self._blocks = []
+        self._tree = [0]
+        self._len = 0
+        self.extend(paths)
+
+    # ---------------------------------
+    # Fenwick tree over block lengths
+    # ---------------------------------
+    def _rebuild(self):
+        self._blocks = [b for b in self._blocks if len(b)]
+        n = len(self._blocks)
+        tree = [0] * (n + 1)
+        for i, block in enumerate(self._blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, b, delta):
+        i = b + 1
+        n = len(self._blocks)
+        while i <= n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        """
+        Return (block number, offset in block) for a global index.
+        """
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("FileList index out of range")
+        pos = 0
+        step = 1 << (len(self._blocks).bit_length())
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= index:
+                pos = nxt
+                index -= self._tree[nxt]
+            step >>= 1
+        return pos, index
+
+    def _intern(self, prefix):
+        dir_id = self._dir_ids.get(prefix)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dirs.append(prefix)
+            self._dir_ids[prefix] = dir_id
+        return dir_id
+
+    # ---------------------------------
+    # Sequence protocol
+    # ---------------------------------
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        b, k = self._locate(index)
+        block = self._blocks[b]
+        return self._dirs[block.dir_ids[k]] + block.name(k)
+
+    def __setitem__(self, index, path):
+        if isinstance(index, slice):
+            raise TypeError("FileList does not support slice assignment")
+        b, k = self._locate(index)
+        block = self._blocks[b]
+        prefix, name = _split(path)
+        block.delete(k)
+        block.insert(k, self._intern(prefix), name.encode(ENCODING, ERRORS))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(self._len)), reverse=True):
+                del self[i]
+            return
+        if index < 0:
+            index += self._len
+        b, k = self._locate(index)
+        self._blocks[b].delete(k)
+        self._len -= 1
+        if len(self._blocks[b]):
+            self._add(b, -1)
+        else:
+            self._rebuild()
+
+    def insert(self, index, path):
+        if index < 0:
+            index = max(index + self._len, 0)
+        index = min(index, self._len)
+        prefix, name = _split(path)
+        dir_id = self._intern(prefix)
+        raw = name.encode(ENCODING, ERRORS)
+
+        if index == self._len:
+            self.append(path)
+            return
+
+        b, k = self._locate(index)
+        block = self._blocks[b]
+        block.insert(k, dir_id, raw)
+        self._len += 1
+        if len(block) > 2 * BLOCK:
+            self._blocks.insert(b + 1, block.split())
+            self._rebuild()
+        else:
+            self._add(b, 1)
+
+    def append(self, path):
+        self.extend((path,))
+
+    def extend(self, paths):
+        if not self._blocks or len(self._blocks[-1]) >= BLOCK:
+            self._blocks.append(_Block())
+        block = self._blocks[-1]
+        added = 0
+        grew = False
+        for path in paths:
+            if len(block) >= BLOCK:
+                block = _Block()
+                self._blocks.append(block)
+                grew = True
+            prefix, name = _split(path)
+            block.append(self._intern(prefix), name.encode(ENCODING, ERRORS))
+            added += 1
+        self._len += added
+        if grew or len(self._tree) != len(self._blocks) + 1:
+            self._rebuild()
+        elif added:
+            self._add(len(self._blocks) - 1, added)
+
+    def __iter__(self):
+        dirs = self._dirs
+        for block in self._blocks:
+            blob = block.blob
+            offsets = block.offsets
+            for k, dir_id in enumerate(block.dir_ids):
+                yield dirs[dir_id] + blob[offsets[k]:offsets[k + 1]].decode(
+                    ENCODING, ERRORS
+                )
+
+    def index(self, path, start=0, stop=None):
+        """
+        Return the first index of path; raise ValueError if absent.
+
+        Nothing is decoded: each block's packed names are searched for the
+        encoded basename with bytes.find, and only the hits are checked
+        for an entry boundary and the path's directory.
+        """
+        if stop is None:
+            stop = self._len
+        prefix, name = _split(path)
+        dir_id = self._dir_ids.get(prefix)
+        if dir_id is not None and name:
+            raw = name.encode(ENCODING, ERRORS)
+            base = 0
+            for block in self._blocks:
+                if base >= stop:
+                    break
+                if base + len(block) > start:
+                    i = self._find_in_block(block, raw, dir_id, start - base, stop - base)
+                    if i is not None:
+                        return base + i
+                base += len(block)
+        raise ValueError(f"{path!r} is not in FileList")
+
+    @staticmethod
+    def _find_in_block(block, raw, dir_id, lo, hi):
+        """
+        Index in block of the first entry in [lo, hi) equal to
+        (dir_id, raw), or None.
+        """
+        offsets = block.offsets
+        count = len(block)
+        lo = max(lo, 0)
+        hi = min(hi, count)
+        if lo >= hi:
+            return None
+        end = offsets[hi]
+        pos = block.blob.find(raw, offsets[lo], end)
+        while pos != -1:
+            k = bisect_left(offsets, pos, lo, hi)
+            if (k < hi and offsets[k] == pos and offsets[k + 1] == pos + len(raw)
+                    and block.dir_ids[k] == dir_id):
+                return k
+            pos = block.blob.find(raw, pos + 1, end)
+        return None
+
+    def __contains__(self, path):
+        try:
+            self.index(path)
+        except ValueError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"FileList(<{self._len} paths in {len(self._dirs)} folders>)"
@@ -0,0 +1,111 @@
+"""
+auraview/core/file_loader.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# the first batch is small so the first image shows up immediately
+FIRST_BATCH = 32
+BATCH_SIZE = 2048
+STAT_WORKERS = 16
+
+
+def iter_path_lines(stream):
+    """
+    Yield stripped, non-empty lines of a text stream, closing it at the end
+    (stdin is left open).
+
+    :param stream: Text file object, e.g. from os_funs.open_text_stream
+    """
+    try:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+class StreamingLoader:
+    """
+    Turn a (possibly huge) iterator of paths into batches of existing image
+    files, in input order.
+
+    Paths are read lazily on a background thread; existence is checked per
+    batch in a thread pool so slow network stats overlap. Each batch is
+    handed to on_batch as soon as it is checked.
+    """
+
+    def __init__(
+            self,
+            paths,
+            image_ext,
+            batch_size=BATCH_SIZE,
+            workers=STAT_WORKERS
+        ):
+        self.paths = paths
+        self.image_ext = image_ext
+        self.batch_size = batch_size
+        self.workers = workers
+        self.total_read = 0
+        self.total_found = 0
+        self.done = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, on_batch, on_done=None):
+        """
+        Start loading in the background.
+
+        :param on_batch: Called with each list of existing paths
+        :param on_done: Called once when the input is exhausted or stopped
+        """
+        self._thread = threading.Thread(
+            target=self._run, args=(on_batch, on_done), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Ask the loader to stop after the current batch.
+        """
+        self._stop.set()
+
+    def _batches(self):
+        batch = []
+        limit = FIRST_BATCH
+        for path in self.paths:
+            if self._stop.is_set():
+                return
+            self.total_read += 1
+            if os.path.splitext(path)[1].lower() not in self.image_ext:
+                continue
+            batch.append(os.path.abspath(os.path.expanduser(path)))
+            if len(batch) >= limit:
+                yield batch
+                batch = []
+                limit = self.batch_size
+        if batch:
+            yield batch
+
+    def _run(self, on_batch, on_done):
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for batch in self._batches():
+                    exists = pool.map(os.path.exists, batch, chunksize=16)
+                    found = [p for p, ok in zip(batch, exists) if ok]
+                    if self._stop.is_set():
+                        return
+                    if found:
+                        self.total_found += len(found)
+                        on_batch(found)
+        finally:
+            self.done = True
+            if on_done:
+                on_done()
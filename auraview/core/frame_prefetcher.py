@@ -0,0 +1,117 @@
+"""
+auraview/core/frame_prefetcher.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from auraview.core.lru_cache import LRUCache
+from auraview.core.memory_governor import governor, PRIORITY_FRAMES
+from auraview.core.photo_module import create_image_obj
+
+FRAME_CACHE_ITEMS = 8
+DECODE_WORKERS = 2
+
+
+class FramePrefetcher:
+    """
+    Bounded cache of display-ready frames keyed by (path, width, height),
+    filled ahead of time by a small decode pool.
+
+    The cache is an LRU with a fixed item count, so memory stays flat no
+    matter how many frames pass through it. `decoder(path, width, height)`
+    replaces the local decode (e.g. with the shared decode daemon).
+    """
+
+    def __init__(self, max_items=FRAME_CACHE_ITEMS, workers=DECODE_WORKERS, decoder=None):
+        self.cache = LRUCache(
+            max_items, governor, name="frames", priority=PRIORITY_FRAMES
+        )
+        self.pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="auraview-decode"
+        )
+        self.decoder = decoder or create_image_obj
+        self.pending = {}
+        # moving average of decode time in seconds (None until measured)
+        self.decode_time = None
+        self._lock = threading.Lock()
+
+    def get(self, path, width, height):
+        """
+        Return the cached frame or None; never decodes.
+        """
+        return self.cache.get((path, width, height))
+
+    def put(self, path, width, height, image):
+        """
+        Store a frame decoded elsewhere.
+        """
+        self.cache.put((path, width, height), image)
+
+    def request(self, path, width, height):
+        """
+        Return a Future for the frame, starting a decode if needed.
+
+        :param path: Image path
+        :param width: Box width
+        :param height: Box height
+        """
+        key = (path, width, height)
+        image = self.cache.get(key)
+        if image is not None:
+            future = Future()
+            future.set_result(image)
+            return future
+        with self._lock:
+            future = self.pending.get(key)
+            if future is None:
+                future = self.pool.submit(self._decode, key)
+                self.pending[key] = future
+        return future
+
+    def _decode(self, key):
+        start = time.perf_counter()
+        try:
+            image = self.decoder(*key)
+            # force the decode here, not on the Tk thread
+            image.load()
+        finally:
+            with self._lock:
+                self.pending.pop(key, None)
+        elapsed = time.perf_counter() - start
+        if self.decode_time is None:
+            self.decode_time = elapsed
+        else:
+            self.decode_time = 0.8 * self.decode_time + 0.2 * elapsed
+        self.cache.put(key, image)
+        return image
+
+    def retain(self, keys):
+        """
+        Cancel queued decodes that are not in keys.
+
+        :param keys: Set of (path, width, height) still wanted
+        """
+        with self._lock:
+            for key, future in list(self.pending.items()):
+                if key not in keys and future.cancel():
+                    del self.pending[key]
+
+    def discard(self, path):
+        """
+        Drop every cached frame of path (e.g. after it was rotated).
+        """
+        for key in self.cache.keys():
+            if key[0] == path:
+                self.cache.pop(key)
+
+    def close(self):
+        """
+        Cancel pending work and stop the pool.
+        """
+        self.retain(set())
+        self.pool.shutdown(wait=False)
+        self.cache.clear()
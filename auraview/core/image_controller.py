@@ -5,7 +5,9 @@ Author: Benevant Mathew
 Date: 2026-02-21
 """
 import os
-from natsort import natsorted
+from datetime import datetime
+from natsort import natsort_keygen
+import pandas as pd
 
 from PIL import Image, UnidentifiedImageError, ImageOps
 from pillow_heif import register_heif_opener
@@ -18,8 +20,25 @@ from auraview.basic_functions.time_funs import file_creation_time
 from auraview.core.photo_module import (
     create_image_obj, get_pic_wh, update_datetime, correct_image_ext,
     get_dpi_text, get_image_ext, get_photo_dir, image_datetime_original,
-    image_datetime_digitized,image_datetime
+    image_datetime_digitized,image_datetime, read_embedded_thumbnail, fit_size
 )
+from auraview.core.metadata_cache import MetadataCache, collect_records
+from auraview.core.metadata_table import build_table, filter_table
+from auraview.core.file_list import FileList
+from auraview.core.listing_cache import ListingCache
+from auraview.core.search_index import SearchIndex
+from auraview.core.image_source import ImageSource
+from auraview.core.raw_preview import is_raw
+from auraview.core.frame_prefetcher import FramePrefetcher
+from auraview.core.process_decoder import ProcessDecoder
+from auraview.core.preview_cache import PreviewCache
+from auraview.core.verifier import IntegrityVerifier, STATUS_CORRUPT
+from auraview.core.animation import FrameSequence, is_multi_frame
+from auraview.core.decode_service import (
+    DecodeClient, DecodeServiceError, RemoteDecodeError,
+    available as decode_service_available
+)
+from auraview.application.config import settings
 
 # Register HEIF opener
 register_heif_opener()
@@ -29,6 +48,13 @@ ORIENT = 274
 # rotation maps
 ROTATE_RIGHT = {1: 6, 6: 3, 3: 8, 8: 1}
 ROTATE_LEFT  = {1: 8, 8: 3, 3: 6, 6: 1}
+# selectable sort orders
+SORT_ORDERS = ("name", "folder", "date", "mtime", "size", "pixels")
+NATURAL_KEY = natsort_keygen()
+# files checked for corruption ahead of the current image
+VERIFY_AHEAD = 256
+# search results up to this many are sorted; more keep the list's order
+SEARCH_SORT_LIMIT = 20000
 
 class ImageController:
     """Handles photo-related operations."""
@@ -36,16 +62,73 @@ class ImageController:
     def __init__(
             self,
             files=None,
-            loc='.'
+            loc='.',
+            sort_order=None,
+            sort_reverse=False
         ):
         self.files = files
         self.loc = loc
         self.img_no = 0
         self.folder_path=''
         self.folder_quick_operation=''
+        self.sort_order = "name"
+        self.sort_reverse = False
+        # the list is a recursive scan of loc (not one folder or a list)
+        self.recursive = False
+
+        # sort keys gathered in bulk, kept for cheap re-sorting
+        self.metadata = MetadataCache()
+        # sorted folder listings, opened when a folder is scanned
+        self.listings = None
+        self._records = {}
+        self._name_keys = {}
+
+        # metadata filter: full list kept aside while a view is active
+        self.filter_query = None
+        self.search_query = None
+        self._unfiltered = None
+        self._table = None
+        # file name / path search, indexed in the background
+        self.search_index = SearchIndex()
+
+        # decode daemon shared with other viewers, if enabled
+        self.decoder = None
+        if settings.shared_decoder and decode_service_available():
+            self.decoder = DecodeClient()
+        # worker processes for CPU bound decoding, if enabled
+        self.processes = None
+        if settings.decode_processes > 0:
+            self.processes = ProcessDecoder(settings.decode_processes)
+
+        # screen-sized renditions of large images, kept on disk
+        self.previews = None
+        if settings.preview_size > 0:
+            self.previews = PreviewCache(
+                settings.preview_size, settings.preview_cache_mb * 2**20
+            )
+
+        # background corruption check of the files ahead of the cursor
+        self.verifier = None
+        if settings.verify_workers > 0:
+            self.verifier = IntegrityVerifier(self.metadata, settings.verify_workers)
+        self._verify_list = None
+        self._verify_from = 0
+
+        # display-ready frames decoded ahead (slideshow) or already shown;
+        # one prefetch thread per worker process keeps them all busy
+        self.frames = FramePrefetcher(
+            settings.frame_cache_items,
+            max(settings.decode_workers, settings.decode_processes),
+            self._prefetch_decode
+        )
+
+        # the current image, mapped once and shared by decode and metadata
+        self._source = None
+        # frame player of the current image when it is animated / multi-page
+        self.animation = None
 
         # defaults
-        self.image_ext = {".png", ".jpg", ".jpeg", ".heic"}
+        self.image_ext = {ext.lower() for ext in settings.image_ext}
 
         # Normalize loc always
         self.loc = os.path.abspath(os.path.expanduser(self.loc))
@@ -88,6 +171,18 @@ class ImageController:
         # If nothing passed
         else:
             self.files = self._get_all_image_files(loc=self.loc)
+            self.recursive = True
+
+        # a single path that is not a file
+        if isinstance(self.files, str):
+            self.files = []
+
+        self.search_index.add(self.files)
+        # compact storage: interned folders, O(log n) removal
+        self.files = FileList(self.files)
+
+        if sort_order or sort_reverse:
+            self.sort_files(sort_order or "name", sort_reverse)
 
     # ------------------------
     # Navigation
@@ -138,6 +233,128 @@ class ImageController:
         """
         if 0 <= index < len(self.files):
             self.img_no = index
+
+    # ------------------------
+    # Progressive loading
+    # ------------------------
+    def add_files(self, paths):
+        """
+        Append already validated image paths (e.g. from a StreamingLoader
+        batch) without moving the current image.
+
+        :param paths: List of absolute paths
+        """
+        if self._unfiltered is not None:
+            self._unfiltered.extend(paths)
+        else:
+            self.files.extend(paths)
+        self.search_index.add(paths)
+
+    # ------------------------
+    # Sorting
+    # ------------------------
+    def sort_files(self, order=None, reverse=None):
+        """
+        Re-sort the file list, keeping the current image selected.
+
+        Keys come from the in-memory record table, which is filled in bulk
+        from the metadata cache, so re-sorting never opens an image.
+
+        :param order: One of SORT_ORDERS (defaults to the current order)
+        :param reverse: Reverse the order (defaults to the current setting)
+        """
+        if order is None:
+            order = self.sort_order
+        if order not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {order}")
+        if reverse is None:
+            reverse = self.sort_reverse
+
+        self.sort_order = order
+        self.sort_reverse = reverse
+
+        if not self.files:
+            return
+
+        current = self.get_current_path()
+        self.files = FileList(self._sorted(self.files, order, reverse))
+        if self._unfiltered is not None:
+            self._unfiltered = FileList(
+                self._sorted(self._unfiltered, order, reverse)
+            )
+        self.img_no = self.files.index(current)
+
+    # ------------------------
+    # Filtering
+    # ------------------------
+    def apply_filter(self, query):
+        """
+        Narrow the file list to images whose cached metadata matches query,
+        e.g. "date >= 2024-01-01 and size > 5MB and format == HEIC".
+        Navigation, the counter and go_to then work over the filtered view.
+
+        Returns the number of matches; the view is left unchanged when
+        nothing matches.
+
+        :param query: Metadata query (see auraview.core.query)
+        """
+        base = self.files if self._unfiltered is None else self._unfiltered
+        matched = filter_table(self._get_table(base), query)
+        view = FileList(p for p in base if p in matched)
+        if not view:
+            return 0
+
+        current = self.get_current_path()
+        self._unfiltered = base
+        self.files = view
+        self.filter_query = query
+        self.search_query = None
+        self.img_no = view.index(current) if current in matched else 0
+        return len(view)
+
+    def apply_search(self, text):
+        """
+        Narrow the file list to paths containing text (any part of the
+        folder or file name, ignoring case), as a temporary view like
+        apply_filter. Matches are listed in the current sort order.
+
+        Returns the number of matches; the view is left unchanged when
+        nothing matches.
+
+        :param text: Substring to look for
+        """
+        base = self.files if self._unfiltered is None else self._unfiltered
+        matched = self.search_index.search(text)
+        if not matched:
+            return 0
+        if len(matched) <= SEARCH_SORT_LIMIT:
+            view = FileList(self._sorted(matched, self.sort_order, self.sort_reverse))
+        else:
+            view = FileList(p for p in base if p in matched)
+        if not view:
+            return 0
+
+        current = self.get_current_path()
+        self._unfiltered = base
+        self.files = view
+        self.filter_query = None
+        self.search_query = text
+        self.img_no = view.index(current) if current in matched else 0
+        return len(view)
+
+    def clear_filter(self):
+        """
+        Return to the full file list, staying on the current image.
+        """
+        if self._unfiltered is None:
+            return
+
+        current = self.get_current_path()
+        self.files = self._unfiltered
+        self._unfiltered = None
+        self.filter_query = None
+        self.search_query = None
+        self.img_no = self.files.index(current) if current else 0
     # ------------------------
     # Image loading
     # ------------------------
@@ -168,15 +385,134 @@ class ImageController:
                 self._remove_current()
                 continue
 
+            if self.verifier is not None and path in self.verifier.bad:
+                print(f"Skipping {self.verifier.bad[path][0]} image: {path}")
+                self._remove_current()
+                continue
+
+            frame = self.frames.get(path, width, height)
+            if frame is not None:
+                return frame
+
             try:
-                return create_image_obj(path, width, height)
+                # the mapped source is only worth it for an in-process decode
+                local = None
+                if self.decoder is None:
+                    local = self._get_source(path)
+                frame = self._decode(path, width, height, local)
+                self.frames.put(path, width, height, frame)
+                return frame
 
             except UnidentifiedImageError:
                 print(f"Removing invalid image: {path}")
+                if self.verifier is not None:
+                    self.verifier.mark(path, STATUS_CORRUPT, "not a recognised image")
                 self._remove_current()
 
         return None
 
+    def _prefetch_decode(self, path, width, height):
+        """
+        Decoder of the prefetch threads: the only caller allowed to wait
+        on the worker processes.
+        """
+        return self._decode(path, width, height, offload=True)
+
+    def _decode(self, path, width, height, local=None, offload=False):
+        """
+        Display frame of path, resized from its on-disk preview when the
+        image is large and the box fits the preview size. On a miss the
+        frame is decoded at the box size and the preview rendered in the
+        background, so the display never pays for the larger decode.
+
+        :param local: Source to decode locally instead of path
+        :param offload: Decode in the worker processes when enabled
+        """
+        previews = self.previews
+        if previews is None or not previews.covers(width, height):
+            return self._decode_full(path, width, height, local, offload)
+        key = previews.lookup(path)
+        if key is None:
+            return self._decode_full(path, width, height, local, offload)
+        frame = previews.get(key, width, height)
+        if frame is not None:
+            return frame
+        previews.schedule(key, path)
+        return self._decode_full(path, width, height, local, offload)
+
+    def _decode_full(self, path, width, height, local=None, offload=False):
+        """
+        Display frame of path: from the shared decode daemon when enabled,
+        else (or when the daemon fails) from the worker processes when
+        offload is set, else decoded in this thread. The visible frame is
+        never offloaded: waiting on the pool would stall the Tk thread
+        while the workers start up or are busy with prefetches. An
+        unreachable daemon turns the shared decoder off for this session.
+
+        :param local: Source to decode locally instead of path
+        :param offload: Decode in the worker processes when enabled
+        """
+        decoder = self.decoder
+        if decoder is not None:
+            try:
+                return decoder.frame(path, width, height)
+            except RemoteDecodeError:
+                pass
+            except DecodeServiceError as e:
+                print(f"Shared decoder unavailable ({e}); decoding locally")
+                self.decoder = None
+        if offload and self.processes is not None:
+            return self.processes.frame(path, width, height).result()
+        return create_image_obj(local or path, width, height)
+
+    def get_preview(self, width, height):
+        """
+        Cheap stand-in for the current image while the user scrubs through
+        the list: the decoded frame if it is cached, else the embedded EXIF
+        thumbnail scaled up, else None. Never decodes the full image.
+        """
+        path = self.get_current_path()
+        if not path:
+            return None
+        frame = self.frames.get(path, width, height)
+        if frame is not None:
+            return frame
+        thumb = read_embedded_thumbnail(path)
+        if thumb is None:
+            return None
+        return thumb.resize(fit_size(thumb.size, width, height), Image.BILINEAR)
+
+    def get_animation(self, width, height):
+        """
+        Return a FrameSequence playing the current image, or None when it
+        has a single frame.
+        """
+        path = self.get_current_path()
+        anim = self.animation
+        if (anim is not None and anim.path == path
+                and (anim.width, anim.height) == (width, height)):
+            return anim
+        self._stop_animation()
+        if not path or not os.path.exists(path):
+            return None
+
+        src = self._get_source(path)
+        try:
+            with src.open_image() as im:
+                if not is_multi_frame(im):
+                    return None
+        except (UnidentifiedImageError, OSError):
+            return None
+        self.animation = FrameSequence(
+            src, width, height, window=settings.prefetch_depth
+        )
+        return self.animation
+
+    def _stop_animation(self):
+        if self.animation is not None:
+            self.animation.close()
+            self.animation = None
+
     def get_metadata(self):
         """
         Docstring for get_metadata
@@ -187,16 +523,33 @@ class ImageController:
         if not path:
             return None
 
+        return self.read_metadata(path, self._get_source(path))
+
+    def read_metadata(self, path, src=None):
+        """
+        Return the metadata panel fields of path.
+
+        Safe to call from a worker thread when src is None: the file is then
+        mapped separately instead of sharing the current visit's mapping,
+        which the Tk thread may release at any time.
+
+        :param path: Image path
+        :param src: ImageSource of path to reuse, or None
+        """
+        if src is None:
+            with ImageSource(path) as own:
+                return self.read_metadata(path, own)
+
         return {
             "name": os.path.basename(path),
             "size": get_file_size(path),
-            "dimensions": get_pic_wh(path),
-            "dpi_text": get_dpi_text(path),
-            "ext": str(get_image_ext(path)),
+            "dimensions": get_pic_wh(src),
+            "dpi_text": get_dpi_text(src),
+            "ext": str(get_image_ext(src)),
             "image_dir": get_photo_dir(path),
-            "image_datetimeoriginal":image_datetime_original(path),
-            "image_datetimedigitized": image_datetime_digitized(path),
-            "image_datetime":image_datetime(path),
+            "image_datetimeoriginal":image_datetime_original(src),
+            "image_datetimedigitized": image_datetime_digitized(src),
+            "image_datetime":image_datetime(src),
             "image_filecreationtime": file_creation_time(path),
             "move_copy_dir": self.folder_path
         }
@@ -216,8 +569,9 @@ class ImageController:
             return
 
         new_path = os.path.join(destination, get_end_from_path(path))
+        self._release_source()
         move(path, new_path)
-        self.files.pop(self.img_no)
+        self._remove_current()
     def quick_move(self):
         """
         Docstring for quick_move
@@ -266,7 +620,13 @@ class ImageController:
         path = self.get_current_path()
         if not path:
             return
+        if is_raw(path):
+            # saving through PIL would replace the RAW data with the preview
+            print(f"Rotating RAW files is not supported: {path}")
+            return
 
+        # the file is rewritten in place; never keep it mapped meanwhile
+        self._release_source()
         with Image.open(path) as im:
             exif = im.getexif()
 
@@ -283,6 +643,8 @@ class ImageController:
 
             im.save(path, exif=exif.tobytes())
 
+        self._forget(path)
+
     def delete_current(self):
         """
         Docstring for delete_current
@@ -293,6 +655,7 @@ class ImageController:
         if not path:
             return
 
+        self._release_source()
         delete_to_trash(path)
         self._remove_current()
 
@@ -307,10 +670,291 @@ class ImageController:
         if not self.files:
             return
 
-        self.files.pop(self.img_no)
+        path = self.files.pop(self.img_no)
+        self.search_index.discard(path)
+        if self._unfiltered is not None:
+            self._unfiltered.remove(path)
+            if not self.files:
+                self.clear_filter()
 
         if self.img_no >= len(self.files):
             self.img_no = max(len(self.files) - 1, 0)
+
+    # ------------------------
+    # Integrity
+    # ------------------------
+    def verify_ahead(self):
+        """
+        Point the verifier at the next VERIFY_AHEAD files. Cheap to call
+        on every image change: the window only moves once the cursor has
+        passed half of it, or the list was re-sorted or filtered.
+        """
+        if self.verifier is None or not self.files:
+            return
+        start = self.img_no
+        if (self._verify_list is self.files
+                and self._verify_from <= start < self._verify_from + VERIFY_AHEAD // 2):
+            return
+        self._verify_list = self.files
+        self._verify_from = start
+        stop = min(start + VERIFY_AHEAD, len(self.files))
+        self.verifier.queue(self.files[i] for i in range(start, stop))
+
+    def exclude(self, path):
+        """
+        Drop a file found to be corrupt from the list, keeping the current
+        image selected. The current image itself is left to
+        get_resized_image.
+
+        Returns True if the file was removed.
+        """
+        try:
+            index = self.files.index(path)
+        except ValueError:
+            index = None
+        if index == self.img_no:
+            return False
+        # also when a filter hides it, so clearing the filter cannot bring it back
+        if self._unfiltered is not None and path in self._unfiltered:
+            self._unfiltered.remove(path)
+        if index is None:
+            return False
+        del self.files[index]
+        self.search_index.discard(path)
+        if index < self.img_no:
+            self.img_no -= 1
+        return True
+
+    def integrity_report(self):
+        """
+        Printable list of the corrupt files found so far.
+        """
+        if self.verifier is None:
+            return "integrity check is off (verify_workers=0)"
+        return self.verifier.report()
+
+    # ------------------------
+    # Session
+    # ------------------------
+    def session_state(self, neighbours):
+        """
+        JSON state of the view for a warm restart: the folder scanned (the
+        listing cache holds its list), the current image and the paths
+        around it, the sort order and the move/copy folders.
+
+        :param neighbours: Paths kept on each side of the current image
+        """
+        lo = max(self.img_no - neighbours, 0)
+        return {
+            "loc": self.loc,
+            "recursive": self.recursive,
+            "current": self.get_current_path(),
+            "window": list(self.files[lo:self.img_no + neighbours + 1]),
+            "sort_order": self.sort_order,
+            "sort_reverse": self.sort_reverse,
+            "folder_quick_operation": self.folder_quick_operation,
+            "folder_path": self.folder_path,
+        }
+
+    def session_frames(self, width, height, neighbours):
+        """
+        Cached display frames of the current image and its neighbours.
+        """
+        lo = max(self.img_no - neighbours, 0)
+        out = []
+        for path in self.files[lo:self.img_no + neighbours + 1]:
+            frame = self.frames.get(path, width, height)
+            if frame is not None:
+                out.append((path, frame))
+        return out
+
+    def restore_session(self, state, frames, width, height):
+        """
+        Resume a saved view: select its image and seed the frame cache.
+        The list is still the saved window until replace_files().
+
+        :param state: Output of session_state()
+        :param frames: [(path, image)] frames of width x height
+        """
+        self.recursive = state.get("recursive", False)
+        self.sort_order = state.get("sort_order") or "name"
+        self.sort_reverse = bool(state.get("sort_reverse"))
+        self.folder_quick_operation = state.get("folder_quick_operation") or ""
+        self.folder_path = state.get("folder_path") or ""
+        if state.get("current") in self.files:
+            self.img_no = self.files.index(state["current"])
+        for path, frame in frames:
+            self.frames.put(path, width, height, frame)
+
+    def scan(self, state):
+        """
+        Image list of a saved session's folder, sorted as it was. Safe to
+        run off the Tk thread: it reads the listing and metadata caches.
+
+        :param state: Output of session_state()
+        """
+        if state.get("recursive"):
+            paths = self._get_all_image_files(state["loc"])
+        else:
+            paths = self._get_image_files(loc=state["loc"])
+        order = state.get("sort_order") or "name"
+        reverse = bool(state.get("sort_reverse"))
+        if order != "name" or reverse:
+            paths = self._sorted(paths, order, reverse)
+        return paths
+
+    def replace_files(self, paths, current=None, order=None, reverse=False):
+        """
+        Swap in a freshly scanned list, keeping current selected if it is
+        still there. Any filter or search is cleared.
+        """
+        self.files = FileList(paths)
+        self._unfiltered = None
+        self._table = None
+        self.filter_query = None
+        self.search_query = None
+        if order:
+            self.sort_order = order
+            self.sort_reverse = reverse
+        self.search_index.close()
+        self.search_index = SearchIndex()
+        self.search_index.add(paths)
+        self.img_no = self.files.index(current) if current in self.files else 0
+
+    def close(self):
+        """
+        Release the current image, the frame cache and the decoders.
+        """
+        self._release_source()
+        self.frames.close()
+        if self.verifier is not None:
+            self.verifier.close()
+        if self.listings is not None:
+            self.listings.close()
+        self.search_index.close()
+        if self.decoder is not None:
+            self.decoder.close()
+        if self.processes is not None:
+            self.processes.close()
+        if self.previews is not None:
+            self.previews.close()
+
+    def _get_source(self, path):
+        """
+        Return the mapped ImageSource for path, reusing the one of the
+        current visit while the file is unchanged.
+        """
+        src = self._source
+        if src is not None and src.path == path and src.is_current():
+            return src
+        self._release_source()
+        self._source = ImageSource(path)
+        return self._source
+
+    def _release_source(self):
+        """
+        Unmap the current image (before it is moved, rewritten or deleted).
+        """
+        self._stop_animation()
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def _forget(self, path):
+        """
+        Drop cached sort keys/metadata of a file that was modified.
+        """
+        self._records.pop(path, None)
+        self._name_keys.pop(path, None)
+        self.metadata.forget([path])
+        self.frames.discard(path)
+        if self._table is not None:
+            self._table = self._table[self._table["path"] != path]
+
+    def _get_table(self, paths):
+        """
+        Return the in-memory metadata table, adding rows for new paths.
+        """
+        if self._table is None:
+            missing = list(paths)
+        else:
+            known = set(self._table["path"].values)
+            missing = [p for p in paths if p not in known]
+
+        if missing:
+            rows = build_table(missing, self._get_records(missing))
+            if self._table is None:
+                self._table = rows
+            else:
+                self._table = pd.concat([self._table, rows], ignore_index=True)
+        return self._table
+
+    def _sorted(self, paths, order, reverse):
+        paths = list(paths)
+        keys = self._get_sort_keys(paths, order)
+        ranks = sorted(range(len(paths)), key=keys.__getitem__, reverse=reverse)
+        return [paths[i] for i in ranks]
+
+    def _get_records(self, paths):
+        """
+        Return header records for paths, gathering missing ones in bulk.
+        """
+        missing = [p for p in paths if p not in self._records]
+        if missing:
+            self._records.update(collect_records(
+                missing, self.metadata, workers=settings.metadata_workers
+            ))
+            for p in missing:
+                # unreadable files still get an (empty) entry
+                self._records.setdefault(p, {})
+        return [self._records[p] for p in paths]
+
+    def _name_key(self, path):
+        key = self._name_keys.get(path)
+        if key is None:
+            key = NATURAL_KEY(os.path.basename(path))
+            self._name_keys[path] = key
+        return key
+
+    def _get_sort_keys(self, paths, order):
+        """
+        Return one precomputed sort key per path for the given order.
+        """
+        name_keys = [self._name_key(p) for p in paths]
+        if order == "name":
+            return name_keys
+
+        if order == "folder":
+            dir_keys = {}
+            out = []
+            for p, name_key in zip(paths, name_keys):
+                folder = os.path.dirname(p)
+                if folder not in dir_keys:
+                    dir_keys[folder] = NATURAL_KEY(folder)
+                out.append((dir_keys[folder], name_key))
+            return out
+
+        records = self._get_records(paths)
+        if order == "mtime":
+            values = [r.get("mtime") or 0 for r in records]
+        elif order == "size":
+            values = [r.get("size") or 0 for r in records]
+        elif order == "pixels":
+            values = [
+                (r.get("width") or 0) * (r.get("height") or 0)
+                for r in records
+            ]
+        else:
+            # capture time, falling back to mtime in the same EXIF format
+            values = []
+            for r in records:
+                dt = r.get("datetime_original")
+                if not dt and r.get("mtime"):
+                    dt = datetime.fromtimestamp(r["mtime"]).strftime(
+                        "%Y:%m:%d %H:%M:%S"
+                    )
+                values.append(dt or "")
+        return list(zip(values, name_keys))
     # -------------------------------------------------
     # Image Operations
     # -------------------------------------------------
@@ -324,7 +968,9 @@ class ImageController:
         path = self.get_current_path()
         if not path:
             return
+        self._release_source()
         update_datetime(path, date_str)
+        self._forget(path)
 
     def correct_extension(self):
         """
@@ -336,11 +982,17 @@ class ImageController:
         if not path:
             return
 
+        self._release_source()
         new_path = correct_image_ext(path)
 
         # If renamed → update internal list
         if new_path != path:
             self.files[self.img_no] = new_path
+            if self._unfiltered is not None:
+                self._unfiltered[self._unfiltered.index(path)] = new_path
+            self.search_index.discard(path)
+            self.search_index.add([new_path])
+            self._forget(path)
     # -------------------------------------------------
     # File Operations
     # -------------------------------------------------
@@ -360,18 +1012,18 @@ class ImageController:
         reverse : bool
             Reverse sorting order
         """
-        scanned = False
-
         # If files not provided, read directory
         if files is None:
             if loc is None:
                 raise ValueError("Either 'files' or 'loc' must be provided")
 
-            scanned = True
-            files = []
-            for entry in os.scandir(loc):
-                if entry.is_file():
-                    files.append(entry.path if full_path else entry.name)
+            # filtered and sorted, reused while the folder is unchanged
+            names = self._listings().list_dir(loc, self.image_ext)
+            if reverse:
+                names.reverse()
+            if full_path:
+                return [os.path.join(loc, name) for name in names]
+            return names
 
         # Filter image extensions
         filtered = []
@@ -380,14 +1032,6 @@ class ImageController:
             if ext in self.image_ext:
                 filtered.append(f)
 
-        # Only sort if scanned from directory
-        if scanned:
-            filtered = natsorted(
-                filtered,
-                key=lambda x: os.path.basename(x),
-                reverse=reverse
-            )
-
         return filtered
 
     def _get_all_image_files(self, loc, reverse=False):
@@ -406,14 +1050,15 @@ class ImageController:
         list[str]
         """
 
-        out = []
-
-        for path, _, files in os.walk(loc):
-            for name in files:
-                ext = os.path.splitext(name)[1].lower()
-                if ext in self.image_ext:
-                    out.append(os.path.join(path, name))
+        # only folders changed since the last scan are read again
+        return self._listings().walk(
+            loc, self.image_ext, depth=settings.scan_depth, reverse=reverse
+        )
 
-        out = natsorted(out, key=lambda x: os.path.basename(x), reverse=reverse)
-
-        return out
+    def _listings(self):
+        """
+        The persistent listing cache, opened on first use.
+        """
+        if self.listings is None:
+            self.listings = ListingCache()
+        return self.listings
@@ -0,0 +1,156 @@
+"""
+auraview/core/image_source.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import io
+import os
+import mmap
+
+from PIL import Image
+
+from auraview.core.raw_preview import is_raw, open_raw
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Independent read position over a shared buffer, so several PIL images
+    can be opened from one mapping without copying the whole file.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buf = buffer
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buf)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, b):
+        chunk = self._buf[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            end = len(self._buf)
+        else:
+            end = min(self._pos + size, len(self._buf))
+        data = self._buf[self._pos:end].tobytes()
+        self._pos = max(end, self._pos)
+        return data
+
+
+class ImageSource:
+    """
+    A file mapped once and shared by every stage of a visit: header/EXIF
+    parsing, decoding and thumbnailing.
+
+    Files that cannot be mapped (empty files, some network or special
+    filesystems) are read into memory once instead.
+    """
+
+    def __init__(self, path, use_mmap=True):
+        self.path = path
+        self._map = None
+        with open(path, "rb") as f:
+            self.stat = os.fstat(f.fileno())
+            if use_mmap and self.stat.st_size:
+                try:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    self._map = None
+            if self._map is not None:
+                self.buffer = memoryview(self._map)
+            else:
+                self.buffer = memoryview(f.read())
+        self.mapped = self._map is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_current(self):
+        """
+        True while the file on disk is unchanged since it was mapped.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return (
+            st.st_mtime_ns == self.stat.st_mtime_ns
+            and st.st_size == self.stat.st_size
+        )
+
+    def reader(self):
+        """
+        Return a new file-like object positioned at the start of the file.
+        """
+        return _BufferReader(self.buffer)
+
+    def open_image(self):
+        """
+        Lazily open the image (header only) from the shared buffer; for
+        camera RAW files, their largest embedded JPEG preview.
+        """
+        if is_raw(self.path):
+            return open_raw(self.reader(), self.path)
+        return Image.open(self.reader())
+
+    def close(self):
+        """
+        Release the mapping. Images opened from it must not be used after.
+        """
+        try:
+            self.buffer.release()
+            if self._map is not None:
+                self._map.close()
+        except BufferError:
+            # a slice is still alive somewhere; the map goes with it
+            pass
+        self._map = None
+
+
+def open_image(file):
+    """
+    Lazily open an image from a path or an ImageSource.
+
+    :param file: Path or ImageSource
+    """
+    if isinstance(file, ImageSource):
+        return file.open_image()
+    if is_raw(file):
+        with open(file, "rb") as f:
+            return open_raw(f, file)
+    return Image.open(file)
+
+
+def source_path(file):
+    """
+    Return the file system path behind a path or an ImageSource.
+
+    :param file: Path or ImageSource
+    """
+    if isinstance(file, ImageSource):
+        return file.path
+    return file
@@ -0,0 +1,264 @@
+"""
+auraview/core/listing_cache.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import time
+import json
+import heapq
+import sqlite3
+import threading
+
+from natsort import natsort_keygen
+
+from auraview.basic_functions.os_funs import get_cache_dir
+
+NATURAL_KEY = natsort_keygen()
+# a directory modified this close to its scan may have changed within the
+# same mtime tick (coarse timestamps on FAT, SMB, ...): scan it again
+RACY_NS = 2 * 10**9
+
+
+class _KeyMemo(dict):
+    """
+    Natural sort keys by file name, computed once per name (the key
+    only depends on the name, and computing it dominates sorting).
+    """
+
+    def __missing__(self, name):
+        key = self[name] = NATURAL_KEY(name)
+        return key
+
+    def of_path(self, path):
+        return self[os.path.basename(path)]
+
+
+class ListingCache:
+    """
+    Persistent, naturally sorted image listings of directories.
+
+    A directory's listing (image file names and sub folders) is stored
+    with the directory's mtime and inode and reused while both match:
+    adding, removing or renaming an entry changes the directory's mtime.
+    Recursive scans also store their merged result together with the
+    (mtime, inode) of every directory they visited, so reopening an
+    unchanged tree costs one stat per directory and no sorting; when some
+    directories changed only those are read again and their files are
+    spliced into the stored result.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "listings.sqlite")
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, ino INTEGER, "
+            "exts TEXT, scanned_ns INTEGER, files TEXT, subdirs TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS trees ("
+            "root TEXT, depth INTEGER, exts TEXT, dirs TEXT, files TEXT, "
+            "PRIMARY KEY (root, depth, exts))"
+        )
+        self._conn.commit()
+
+    # -------------------------------------------------
+    # One directory
+    # -------------------------------------------------
+    def list_dir(self, path, image_ext):
+        """
+        Return the naturally sorted image file names in path.
+
+        :param path: Directory
+        :param image_ext: Set of lower case extensions to keep
+        """
+        st = os.stat(path)
+        exts = ",".join(sorted(image_ext))
+        files, _, row = self._listing(path, st, exts, _KeyMemo())
+        if row is not None:
+            self._save_dirs([row])
+        return files
+
+    def _listing(self, path, st, exts, memo):
+        """
+        Return (file names, sub folder names, row to store or None).
+        """
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT mtime_ns, ino, exts, scanned_ns, files, subdirs "
+                "FROM dirs WHERE path = ?", (path,)
+            ).fetchone()
+        if found is not None:
+            mtime_ns, ino, old_exts, scanned_ns, files, subdirs = found
+            if (mtime_ns == st.st_mtime_ns and ino == st.st_ino and old_exts == exts
+                    and st.st_mtime_ns < scanned_ns - RACY_NS):
+                return json.loads(files), json.loads(subdirs), None
+
+        scanned_ns = time.time_ns()
+        wanted = set(exts.split(","))
+        files, subdirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        if os.path.splitext(entry.name)[1].lower() in wanted:
+                            files.append(entry.name)
+                except OSError:
+                    continue
+        # same order as natsorted(files)
+        files.sort(key=memo.__getitem__)
+        row = (path, st.st_mtime_ns, st.st_ino, exts, scanned_ns,
+               json.dumps(files), json.dumps(subdirs))
+        return files, subdirs, row
+
+    # -------------------------------------------------
+    # Directory trees
+    # -------------------------------------------------
+    def walk(self, root, image_ext, depth=-1, reverse=False):
+        """
+        Return every image below root as full paths, naturally sorted by
+        file name (like natsorted(..., key=basename) over an os.walk).
+
+        :param root: Root directory
+        :param image_ext: Set of lower case extensions to keep
+        :param depth: Sub folder levels to descend (negative = no limit)
+        :param reverse: Reverse the order
+        """
+        root = os.path.normpath(root)
+        exts = ",".join(sorted(image_ext))
+        memo = _KeyMemo()
+        visited = []
+        listings = []
+        rows = []
+        # pre-order, sub folders in listing order, as os.walk visits them
+        stack = [(root, 0)]
+        while stack:
+            path, level = stack.pop()
+            try:
+                st = os.stat(path)
+                files, subdirs, row = self._listing(path, st, exts, memo)
+            except OSError:
+                continue
+            visited.append([path, st.st_mtime_ns, st.st_ino])
+            listings.append((path, files))
+            if row is not None:
+                rows.append(row)
+            if depth < 0 or level < depth:
+                for name in reversed(subdirs):
+                    stack.append((os.path.join(path, name), level + 1))
+
+        stored = self._stored_tree(root, depth, exts)
+        # folders whose files may differ from the stored tree: the dirs
+        # table is shared with list_dir() and other roots, so a folder
+        # read again by an earlier call comes back here without a row
+        changed = {row[0] for row in rows}
+        if stored is not None:
+            before = {path: (mtime_ns, ino) for path, mtime_ns, ino in stored[0]}
+            changed.update(
+                path for path, mtime_ns, ino in visited
+                if before.get(path) != (mtime_ns, ino)
+            )
+        if stored is not None and not changed and stored[0] == visited:
+            out = stored[1]
+        else:
+            if stored is not None:
+                out = self._splice(stored[1], visited, listings, changed, memo)
+            else:
+                out = None
+            if out is None:
+                out = list(heapq.merge(
+                    *([os.path.join(path, name) for name in files]
+                      for path, files in listings if files),
+                    key=memo.of_path
+                ))
+            self._save_dirs(rows)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO trees (root, depth, exts, dirs, files) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (root, depth, exts, json.dumps(visited), json.dumps(out))
+                )
+                self._conn.commit()
+        if reverse:
+            out.reverse()
+        return out
+
+    def _stored_tree(self, root, depth, exts):
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT dirs, files FROM trees "
+                "WHERE root = ? AND depth = ? AND exts = ?", (root, depth, exts)
+            ).fetchone()
+        if found is None:
+            return None
+        return json.loads(found[0]), json.loads(found[1])
+
+    @staticmethod
+    def _splice(old, visited, listings, changed, memo):
+        """
+        Update a stored sorted tree listing with the folders read again:
+        their old entries are dropped and their new files inserted by
+        binary search, so only the changed files and O(log n) probes per
+        file have their sort key computed. Returns None when so much
+        changed that a full merge is cheaper.
+
+        :param changed: Folders whose stored entries are out of date
+        """
+        order = {path: i for i, (path, _, _) in enumerate(visited)}
+        fresh = [
+            os.path.join(path, name)
+            for path, files in listings if path in changed
+            for name in files
+        ]
+        if len(fresh) * max(len(old), 2).bit_length() > len(old):
+            return None
+
+        def key(p):
+            # ties between equal names keep the folder walk order
+            return memo.of_path(p), order[os.path.dirname(p)]
+
+        kept = [
+            p for p in old
+            if os.path.dirname(p) in order and os.path.dirname(p) not in changed
+        ]
+        out = []
+        start = 0
+        for item, item_key in sorted(((p, key(p)) for p in fresh), key=lambda t: t[1]):
+            lo, hi = start, len(kept)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if item_key < key(kept[mid]):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            out.extend(kept[start:lo])
+            out.append(item)
+            start = lo
+        out.extend(kept[start:])
+        return out
+
+    def _save_dirs(self, rows):
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirs "
+                "(path, mtime_ns, ino, exts, scanned_ns, files, subdirs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def close(self):
+        """
+        Close the underlying database.
+        """
+        with self._lock:
+            self._conn.close()
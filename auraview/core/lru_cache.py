@@ -0,0 +1,172 @@
+"""
+auraview/core/lru_cache.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import threading
+from collections import OrderedDict
+
+from auraview.core.memory_governor import image_bytes
+
+
+class LRUCache:
+    """
+    Small thread-safe least-recently-used mapping with an item limit.
+
+    Given a MemoryGovernor it also reports the bytes of its values
+    (measured by sizeof) and gives entries up when the global budget is
+    exceeded, the most recently used one and pinned keys excepted.
+
+    Values that must be released on one thread (Tk PhotoImages) take a
+    dispatcher: the governor then only evicts on the thread that created
+    the cache and posts the eviction there when triggered elsewhere.
+    """
+
+    def __init__(self, max_items, governor=None, name="cache", priority=0, sizeof=None,
+                 dispatcher=None):
+        self.max_items = max_items
+        self.name = name
+        self.priority = priority
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._pinned = frozenset()
+        self._lock = threading.Lock()
+        self._dispatcher = dispatcher
+        self._owner = threading.get_ident()
+        self._evict_posted = False
+        self._governor = governor
+        if governor is not None:
+            self._sizeof = sizeof or image_bytes
+            governor.register(self)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Return the cached value (marking it recently used) or default.
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """
+        Insert or refresh a value, evicting the oldest entries over the limit.
+        """
+        delta = 0
+        with self._lock:
+            if self._governor is not None:
+                delta -= self._sizes.pop(key, 0)
+                size = self._sizes[key] = self._sizeof(value)
+                delta += size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                old, _ = self._data.popitem(last=False)
+                delta -= self._sizes.pop(old, 0)
+            self.nbytes += delta
+        self._report(delta)
+
+    def pop(self, key, default=None):
+        """
+        Remove and return a value.
+        """
+        with self._lock:
+            value = self._data.pop(key, default)
+            delta = -self._sizes.pop(key, 0)
+            self.nbytes += delta
+        self._report(delta)
+        return value
+
+    def pin(self, keys):
+        """
+        Keep keys (e.g. what is on screen) out of the governor's evictions,
+        replacing the previous pins.
+        """
+        self._pinned = frozenset(keys)
+
+    def _victim(self):
+        # oldest key the governor may drop, or None
+        pinned = self._pinned
+        newest = next(reversed(self._data), None)
+        for key in self._data:
+            if key == newest:
+                return None
+            if key not in pinned:
+                return key
+        return None
+
+    def evict_one(self):
+        """
+        Drop the least recently used entry for the memory governor; the
+        most recent one and pinned keys are kept. Returns False when
+        nothing was dropped.
+        """
+        with self._lock:
+            old = self._victim()
+            if old is None:
+                return False
+            del self._data[old]
+            delta = -self._sizes.pop(old, 0)
+            self.nbytes += delta
+        self._report(delta)
+        return True
+
+    def can_evict(self):
+        """
+        False on a thread other than the owning one of a dispatched cache.
+        """
+        return self._dispatcher is None or threading.get_ident() == self._owner
+
+    def defer_eviction(self):
+        """
+        Post a governor pass to the owning thread (once until it has run);
+        returns the bytes evict_one() can free there.
+        """
+        with self._lock:
+            newest = next(reversed(self._data), None)
+            freeable = sum(
+                size for key, size in self._sizes.items()
+                if key != newest and key not in self._pinned
+            )
+            post = not self._evict_posted and freeable > 0
+            if post:
+                self._evict_posted = True
+        if post:
+            self._dispatcher.post(self._deferred_enforce)
+        return freeable
+
+    def _deferred_enforce(self):
+        self._evict_posted = False
+        self._governor.enforce()
+
+    def keys(self):
+        """
+        Snapshot of the keys, oldest first.
+        """
+        with self._lock:
+            return list(self._data)
+
+    def clear(self):
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            delta = -self.nbytes
+            self.nbytes = 0
+        self._report(delta)
+
+    def _report(self, delta):
+        if delta and self._governor is not None:
+            self._governor.add(delta)
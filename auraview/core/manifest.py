@@ -0,0 +1,198 @@
+"""
+auraview/core/manifest.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+
+import pandas as pd
+
+from auraview.basic_functions.os_funs import read_csv, read_excel
+from auraview.core.query import (
+    parse_query, evaluate_query, QueryError, DATE_ONLY_RE
+)
+
+# read with openpyxl's streaming reader; other Excel files are loaded whole
+XLSX_EXT = (".xlsx", ".xlsm")
+EXCEL_EXT = XLSX_EXT + (".xls", ".xlsb", ".ods")
+# the first chunk is small so the first image shows up immediately
+FIRST_ROWS = 256
+CHUNK_ROWS = 20000
+ORDERING = (">", ">=", "<", "<=")
+
+
+class ManifestError(ValueError):
+    """Unreadable manifest, or a column that it does not have."""
+
+
+def _coerce(df, clauses, fields):
+    """
+    Give text columns compared by order a numeric or date type.
+
+    Column types are guessed per chunk, so a column with a few blanks or
+    typos would otherwise be compared as text in some chunks only.
+    """
+    for field, op, raw in clauses:
+        col = fields[field]
+        column = df[col]
+        if op not in ORDERING or not (
+                pd.api.types.is_object_dtype(column)
+                or pd.api.types.is_string_dtype(column)):
+            continue
+        try:
+            float(raw)
+        except ValueError:
+            if DATE_ONLY_RE.match(raw):
+                df[col] = pd.to_datetime(column, errors="coerce")
+        else:
+            df[col] = pd.to_numeric(column, errors="coerce")
+    return df
+
+
+class Manifest:
+    """
+    Image paths listed in one column of a CSV or Excel sheet, optionally
+    filtered on other columns ("rating >= 4 and client == acme", same
+    syntax as the metadata filter).
+
+    Iterating reads the sheet in chunks (CSV through pandas, .xlsx through
+    openpyxl's read-only mode), so memory is bounded by one chunk and the
+    first paths are yielded before the rest of the file is read. Relative
+    paths are taken relative to the manifest's folder.
+    """
+
+    def __init__(self, file, path_column="path", where=None, sheet=None,
+                 chunk_rows=CHUNK_ROWS):
+        self.file = file
+        self.sheet = sheet
+        self.chunk_rows = chunk_rows
+        self.base_dir = os.path.dirname(os.path.abspath(file))
+        ext = os.path.splitext(file)[1].lower()
+        self.kind = "xlsx" if ext in XLSX_EXT else "excel" if ext in EXCEL_EXT else "csv"
+        self.clauses = parse_query(where) if where else []
+        self.rows_read = 0
+        self.rows_matched = 0
+
+        header = self._header()
+        columns = {str(c).strip().lower(): c for c in header}
+        key = path_column.strip().lower()
+        if key not in columns:
+            raise ManifestError(
+                f"no column {path_column!r} in {file} "
+                f"(columns: {', '.join(str(c) for c in header)})"
+            )
+        self.path_column = columns[key]
+        for field, _, _ in self.clauses:
+            if field not in columns:
+                raise QueryError(f"Unknown field: {field}")
+        # query field -> header name as written in the file
+        self.fields = {f: columns[f] for f, _, _ in self.clauses}
+        # only the columns in use are kept
+        self.usecols = list(dict.fromkeys(
+            [self.path_column] + list(self.fields.values())
+        ))
+
+    def __iter__(self):
+        for df in self._chunks():
+            self.rows_read += len(df)
+            if self.clauses:
+                df = _coerce(df, self.clauses, self.fields)
+                aliases = {f: str(c) for f, c in self.fields.items()}
+                df = df[evaluate_query(df, self.clauses, aliases=aliases)]
+            for value in df[self.path_column].dropna():
+                path = os.path.expanduser(str(value).strip())
+                if not path:
+                    continue
+                self.rows_matched += 1
+                yield os.path.join(self.base_dir, path)
+
+    # -------------------------------------------------
+    # Readers
+    # -------------------------------------------------
+    def _header(self):
+        try:
+            if self.kind == "csv":
+                return list(read_csv(self.file, nrows=0).columns)
+            if self.kind == "xlsx":
+                with self._xlsx_rows() as rows:
+                    return list(next(rows, ()))
+            return list(self._excel().columns)
+        except (OSError, ValueError, KeyError) as e:
+            raise ManifestError(f"cannot read {self.file}: {e}") from e
+
+    def _chunks(self):
+        if self.kind == "csv":
+            reader = read_csv(
+                self.file, usecols=self.usecols, chunksize=self.chunk_rows,
+                dtype={self.path_column: str}
+            )
+            with reader:
+                try:
+                    yield reader.get_chunk(FIRST_ROWS)
+                except StopIteration:
+                    return
+                yield from reader
+        elif self.kind == "xlsx":
+            yield from self._xlsx_chunks()
+        else:
+            # no streaming reader: loaded whole, still handed out in chunks
+            df = self._excel()[self.usecols]
+            for start in range(0, len(df), self.chunk_rows):
+                yield df.iloc[start:start + self.chunk_rows].copy()
+
+    def _excel(self):
+        return read_excel(self.file, self.sheet)
+
+    def _xlsx_rows(self):
+        return _XlsxRows(self.file, self.sheet)
+
+    def _xlsx_chunks(self):
+        with self._xlsx_rows() as rows:
+            header = next(rows, None)
+            if header is None:
+                return
+            keep = [i for i, name in enumerate(header) if name in self.usecols]
+            names = [header[i] for i in keep]
+            chunk = []
+            limit = FIRST_ROWS
+            for row in rows:
+                chunk.append([row[i] if i < len(row) else None for i in keep])
+                if len(chunk) >= limit:
+                    yield pd.DataFrame(chunk, columns=names).infer_objects()
+                    chunk = []
+                    limit = self.chunk_rows
+            if chunk:
+                yield pd.DataFrame(chunk, columns=names).infer_objects()
+
+
+class _XlsxRows:
+    """
+    Row value tuples of one sheet, read by openpyxl in read-only mode
+    (rows are parsed from the zip as they are iterated).
+    """
+
+    def __init__(self, file, sheet=None):
+        try:
+            import openpyxl
+        except ImportError as e:
+            raise ManifestError(
+                "Excel manifests need openpyxl (pip install openpyxl)"
+            ) from e
+        try:
+            self._book = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        except Exception as e:
+            # openpyxl raises zipfile, XML and its own errors
+            raise ManifestError(f"cannot read {file}: {e}") from e
+        try:
+            sheet_obj = self._book[sheet] if sheet else self._book.active
+        except KeyError:
+            self._book.close()
+            raise
+        self._rows = sheet_obj.iter_rows(values_only=True)
+
+    def __enter__(self):
+        return self._rows
+
+    def __exit__(self, *exc):
+        self._book.close()
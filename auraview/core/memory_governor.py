@@ -0,0 +1,205 @@
+"""
+auraview/core/memory_governor.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import threading
+import weakref
+
+# share of physical RAM used when no budget is configured
+RAM_SHARE = 0.25
+MIN_BUDGET = 256 * 2**20
+MAX_BUDGET = 4 * 2**30
+FALLBACK_BUDGET = 1 * 2**30
+# above this share of the budget prefetching is cut back
+PRESSURE = 0.75
+
+# eviction order across caches: lowest priority goes first
+PRIORITY_THUMBNAILS = 0
+PRIORITY_GRID = 1
+PRIORITY_TILES = 1
+PRIORITY_LEVELS = 2
+PRIORITY_FRAMES = 3
+PRIORITY_DISPLAY = 4
+
+
+def physical_memory():
+    """
+    Total physical memory in bytes, or None if it cannot be determined.
+    """
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        pass
+    if sys.platform == "win32":
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+    return None
+
+
+def default_budget():
+    """
+    Budget derived from the machine's RAM.
+    """
+    total = physical_memory()
+    if not total:
+        return FALLBACK_BUDGET
+    return int(max(MIN_BUDGET, min(total * RAM_SHARE, MAX_BUDGET)))
+
+
+def image_bytes(value):
+    """
+    Approximate bytes held by a cached value: PIL images, Tk PhotoImages
+    and tuples of them (e.g. (frame, duration)); anything else counts 0.
+    """
+    if isinstance(value, tuple):
+        return sum(image_bytes(v) for v in value)
+    getbands = getattr(value, "getbands", None)
+    if getbands is not None:
+        width, height = value.size
+        return width * height * len(getbands())
+    if hasattr(value, "width") and hasattr(value, "height") and callable(value.width):
+        # Tk photo images keep 4 bytes per pixel
+        return value.width() * value.height() * 4
+    return 0
+
+
+class MemoryGovernor:
+    """
+    One memory budget shared by every image cache.
+
+    Caches register themselves with a priority and report the bytes of
+    what they hold. When the total goes over the budget the governor asks
+    the caches, lowest priority first, to drop their least recently used
+    entries until it fits again. Buffers that cannot be evicted (e.g. an
+    animation's frame window) are only charged, and pressure() tells
+    prefetchers to look less far ahead.
+
+    Caches of Tk objects may only drop entries on the Tk thread: when the
+    budget is exceeded on another thread their eviction is posted there,
+    and the bytes it will free are counted as freed meanwhile.
+    """
+
+    def __init__(self, budget=None):
+        self.budget = budget or default_budget()
+        self.total = 0
+        self._caches = weakref.WeakSet()
+        self._charges = {}
+        self._lock = threading.Lock()
+        self._enforcing = threading.local()
+
+    def set_budget(self, budget):
+        """
+        Change the budget (bytes; None for the RAM-derived default).
+        """
+        self.budget = budget or default_budget()
+        self.enforce()
+
+    def register(self, cache):
+        """
+        Account for a cache; it needs `name`, `priority`, `nbytes` and
+        `evict_one()`, and may have `can_evict()` (False off its owning
+        thread) with `defer_eviction()` (post an eviction to that thread,
+        return the bytes it can free).
+        """
+        self._caches.add(cache)
+
+    def add(self, delta):
+        """
+        Record a change of held bytes and evict if over budget.
+        """
+        with self._lock:
+            self.total += delta
+        if delta > 0:
+            self.enforce()
+
+    def charge(self, name, delta):
+        """
+        Record bytes held outside any evictable cache.
+
+        :param name: Label for usage()
+        :param delta: Change in bytes
+        """
+        with self._lock:
+            self._charges[name] = self._charges.get(name, 0) + delta
+        self.add(delta)
+
+    def pressure(self):
+        """
+        True when usage is close enough to the budget to cut prefetching.
+        """
+        return self.total > self.budget * PRESSURE
+
+    def enforce(self):
+        """
+        Evict across caches, lowest priority first, until within budget.
+        """
+        # eviction reports back through add(); do not recurse
+        if getattr(self._enforcing, "active", False):
+            return
+        self._enforcing.active = True
+        try:
+            deferred = 0
+            for cache in sorted(self._caches, key=lambda c: c.priority):
+                if self.total - deferred <= self.budget:
+                    break
+                can_evict = getattr(cache, "can_evict", None)
+                if can_evict is not None and not can_evict():
+                    deferred += cache.defer_eviction()
+                    continue
+                while self.total - deferred > self.budget and cache.evict_one():
+                    pass
+        finally:
+            self._enforcing.active = False
+
+    def usage(self):
+        """
+        Current accounting: {name: bytes} per cache and charge, plus the
+        total and the budget.
+        """
+        usage = {}
+        for cache in list(self._caches):
+            usage[cache.name] = usage.get(cache.name, 0) + cache.nbytes
+        with self._lock:
+            usage.update(self._charges)
+        usage["total"] = self.total
+        usage["budget"] = self.budget
+        return usage
+
+    def report(self):
+        """
+        Usage as one printable line (MiB).
+        """
+        usage = self.usage()
+        parts = [
+            f"{name} {value / 2**20:.1f}"
+            for name, value in sorted(usage.items())
+            if name not in ("total", "budget") and value
+        ]
+        return (
+            f"memory: {usage['total'] / 2**20:.1f} of "
+            f"{usage['budget'] / 2**20:.0f} MiB ({', '.join(parts) or 'empty'})"
+        )
+
+
+# the process-wide instance all image caches share
+governor = MemoryGovernor()
@@ -0,0 +1,220 @@
+"""
+auraview/core/metadata_cache.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from auraview.basic_functions.os_funs import get_cache_dir
+from auraview.core.photo_module import read_header_record
+
+# record fields, in table column order
+FIELDS = (
+    "path", "mtime", "size", "width", "height", "format", "datetime_original"
+)
+# integrity check results (see auraview.core.verifier)
+INTEGRITY_FIELDS = ("path", "mtime", "size", "status", "reason")
+# sqlite limits the number of bound parameters per statement
+CHUNK = 500
+
+
+class MetadataCache:
+    """
+    Persistent header metadata keyed by absolute path.
+
+    A record is only trusted while the file's mtime and size still match,
+    so the cache can be shared between sessions and folders safely.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "metadata.sqlite")
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+            "width INTEGER, height INTEGER, format TEXT, "
+            "datetime_original TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS integrity ("
+            "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+            "status TEXT, reason TEXT)"
+        )
+        self._conn.commit()
+
+    def get_many(self, paths):
+        """
+        Return {path: record} for every cached path (validity not checked).
+
+        :param paths: Iterable of absolute paths
+        """
+        paths = list(paths)
+        out = {}
+        with self._lock:
+            for i in range(0, len(paths), CHUNK):
+                chunk = paths[i:i + CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(FIELDS)} FROM metadata "
+                    f"WHERE path IN ({marks})",
+                    chunk
+                )
+                for row in rows:
+                    out[row[0]] = dict(zip(FIELDS, row))
+        return out
+
+    def put_many(self, records):
+        """
+        Insert or replace records.
+
+        :param records: Iterable of record dicts
+        """
+        rows = [tuple(r.get(f) for f in FIELDS) for r in records]
+        if not rows:
+            return
+        marks = ",".join("?" * len(FIELDS))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO metadata ({', '.join(FIELDS)}) "
+                f"VALUES ({marks})",
+                rows
+            )
+            self._conn.commit()
+
+    def get_integrity(self, paths):
+        """
+        Return {path: result} of stored integrity checks (validity not
+        checked; compare mtime and size like get_many records).
+
+        :param paths: Iterable of absolute paths
+        """
+        paths = list(paths)
+        out = {}
+        with self._lock:
+            for i in range(0, len(paths), CHUNK):
+                chunk = paths[i:i + CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(INTEGRITY_FIELDS)} FROM integrity "
+                    f"WHERE path IN ({marks})",
+                    chunk
+                )
+                for row in rows:
+                    out[row[0]] = dict(zip(INTEGRITY_FIELDS, row))
+        return out
+
+    def put_integrity(self, results):
+        """
+        Insert or replace integrity results.
+
+        :param results: Iterable of (path, mtime, size, status, reason)
+        """
+        rows = [tuple(r) for r in results]
+        if not rows:
+            return
+        marks = ",".join("?" * len(INTEGRITY_FIELDS))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO integrity ({', '.join(INTEGRITY_FIELDS)}) "
+                f"VALUES ({marks})",
+                rows
+            )
+            self._conn.commit()
+
+    def forget(self, paths):
+        """
+        Drop cached records, e.g. after a file was rewritten or renamed.
+
+        :param paths: Iterable of absolute paths
+        """
+        paths = list(paths)
+        with self._lock:
+            for i in range(0, len(paths), CHUNK):
+                chunk = paths[i:i + CHUNK]
+                marks = ",".join("?" * len(chunk))
+                for table in ("metadata", "integrity"):
+                    self._conn.execute(
+                        f"DELETE FROM {table} WHERE path IN ({marks})", chunk
+                    )
+            self._conn.commit()
+
+    def close(self):
+        """
+        Close the underlying database.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+def stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def split_cached(paths, stats, cached):
+    """
+    Split paths into valid cached records and paths to read again.
+
+    :param paths: Absolute image paths
+    :param stats: os.stat_result (or None if gone) per path
+    :param cached: Output of MetadataCache.get_many()
+    :returns: ({path: record}, [paths missing or stale]); gone paths are dropped
+    """
+    out = {}
+    missing = []
+    for path, st in zip(paths, stats):
+        if st is None:
+            continue
+        rec = cached.get(path)
+        if rec and rec["mtime"] == st.st_mtime and rec["size"] == st.st_size:
+            out[path] = rec
+        else:
+            missing.append(path)
+    return out, missing
+
+
+def collect_records(paths, cache, workers=8):
+    """
+    Return {path: record} for paths, gathered in bulk.
+
+    Cached records are validated against a stat of the file; only missing
+    or stale entries have their header read (in a thread pool), and those
+    are written back to the cache. Paths that are not readable images are
+    left out of the result.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Absolute image paths
+    cache : MetadataCache
+        Persistent cache to read from and update
+    workers : int
+        Number of I/O threads used for stats and header reads
+    """
+    paths = list(paths)
+    cached = cache.get_many(paths)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        stats = list(pool.map(stat_or_none, paths, chunksize=256))
+
+        out, missing = split_cached(paths, stats, cached)
+
+        fresh = [
+            rec
+            for rec in pool.map(read_header_record, missing, chunksize=16)
+            if rec is not None
+        ]
+
+    cache.put_many(fresh)
+    for rec in fresh:
+        out[rec["path"]] = rec
+    return out
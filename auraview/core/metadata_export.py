@@ -0,0 +1,251 @@
+"""
+auraview/core/metadata_export.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+from pillow_heif import register_heif_opener
+
+from auraview.core.metadata_cache import (
+    MetadataCache, FIELDS, split_cached, stat_or_none
+)
+from auraview.core.photo_module import read_header_record
+
+# worker processes import this module, so they can read HEIC too
+register_heif_opener()
+
+METADATA_FORMATS = ("csv", "parquet")
+# output columns, in order
+COLUMNS = ("path", "ext", "format", "size", "width", "height", "mtime",
+           "datetime_original")
+# rows gathered, written and dropped at a time: bounds memory
+CHUNK_ROWS = 20000
+# paths per worker task: amortizes the inter-process round trip
+BATCH = 256
+
+
+def stat_batch(paths):
+    """
+    os.stat (or None) of each path; one thread task per batch, since a
+    future per file costs more than the stat itself.
+    """
+    return [stat_or_none(path) for path in paths]
+
+
+def read_header_batch(paths):
+    """
+    Header records of paths (unreadable ones left out). Runs in a worker.
+    """
+    out = []
+    for path in paths:
+        rec = read_header_record(path)
+        if rec is not None:
+            out.append(rec)
+    return out
+
+
+def metadata_format(output, fmt=None):
+    """
+    Output format from fmt or the output file extension (default csv).
+    """
+    if fmt is None:
+        ext = os.path.splitext(output)[1].lower()
+        fmt = "parquet" if ext in (".parquet", ".pq") else "csv"
+    fmt = fmt.lower()
+    if fmt not in METADATA_FORMATS:
+        raise ValueError(
+            f"unsupported metadata format {fmt!r} "
+            f"(choose from {', '.join(METADATA_FORMATS)})"
+        )
+    return fmt
+
+
+def records_frame(records):
+    """
+    DataFrame of header records with the COLUMNS layout and fixed dtypes,
+    so every chunk of one export has the same schema.
+    """
+    df = pd.DataFrame.from_records(list(records), columns=FIELDS)
+    return pd.DataFrame({
+        "path": df["path"].astype(object),
+        "ext": df["path"].map(lambda p: os.path.splitext(p)[1].lower()).astype(object),
+        "format": df["format"].astype(object),
+        "size": df["size"].astype("Int64"),
+        "width": df["width"].astype("Int64"),
+        "height": df["height"].astype("Int64"),
+        "mtime": pd.to_datetime(df["mtime"], unit="s"),
+        "datetime_original": df["datetime_original"].astype(object),
+    }, columns=COLUMNS)
+
+
+def _batches(items):
+    return [items[i:i + BATCH] for i in range(0, len(items), BATCH)]
+
+
+class _CsvWriter:
+
+    def __init__(self, output):
+        self._own = output != "-"
+        self._file = open(output, "w", newline="", encoding="utf-8") if self._own else sys.stdout
+        self._header = True
+
+    def write(self, df):
+        df.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self):
+        if self._own:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class _ParquetWriter:
+
+    def __init__(self, output):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise OSError("Parquet output needs pyarrow (pip install pyarrow)") from e
+        if output == "-":
+            raise OSError("Parquet output needs a file name")
+        self._pa = pa
+        self._schema = pa.schema([
+            ("path", pa.string()), ("ext", pa.string()), ("format", pa.string()),
+            ("size", pa.int64()), ("width", pa.int64()), ("height", pa.int64()),
+            ("mtime", pa.timestamp("ns")), ("datetime_original", pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(output, self._schema)
+
+    def write(self, df):
+        # one row group per chunk
+        self._writer.write_table(
+            self._pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        )
+
+    def close(self):
+        self._writer.close()
+
+
+class MetadataExport:
+    """
+    Stream the header metadata of many images into a CSV or Parquet file.
+
+    Paths are consumed in chunks of chunk_rows: a chunk's cached records
+    are validated by a stat, only missing or stale files have their header
+    parsed (in worker processes, BATCH files per task), fresh records are
+    written back to the metadata cache and the chunk is appended to the
+    output. Memory is bounded by one chunk, however long the input.
+    """
+
+    def __init__(
+            self,
+            paths,
+            output,
+            fmt=None,
+            workers=None,
+            stat_workers=16,
+            chunk_rows=CHUNK_ROWS,
+            cache=None
+        ):
+        self.paths = paths
+        self.output = output
+        self.fmt = metadata_format(output, fmt)
+        self.workers = workers or os.cpu_count() or 1
+        self.stat_workers = stat_workers
+        self.chunk_rows = chunk_rows
+        self.cache = cache
+        self.rows = 0
+        self.cached = 0
+        self.parsed = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+        # started on the first header to parse: a cached run needs none
+        self._pool = None
+
+    def report(self):
+        """
+        Printable summary of the run.
+        """
+        rate = self.rows / self.elapsed if self.elapsed else 0.0
+        return (
+            f"wrote {self.rows} record(s) ({self.cached} cached, {self.parsed} "
+            f"parsed, {self.skipped} skipped) in {self.elapsed:.1f} s, "
+            f"{rate:.0f} files/s"
+        )
+
+    def run(self, on_chunk=None):
+        """
+        Export every path; returns self (see report()).
+
+        :param on_chunk: Optional callback(export) after each chunk written
+        """
+        start = time.perf_counter()
+        cache = self.cache or MetadataCache()
+        writer = _ParquetWriter(self.output) if self.fmt == "parquet" else _CsvWriter(self.output)
+        try:
+            with ThreadPoolExecutor(max_workers=self.stat_workers) as stats:
+                for chunk in self._chunks():
+                    records = self._gather(chunk, cache, stats)
+                    if records:
+                        writer.write(records_frame(records))
+                    self.rows += len(records)
+                    self.skipped += len(chunk) - len(records)
+                    self.elapsed = time.perf_counter() - start
+                    if on_chunk is not None:
+                        on_chunk(self)
+        finally:
+            writer.close()
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            if self.cache is None:
+                cache.close()
+        self.elapsed = time.perf_counter() - start
+        return self
+
+    def _chunks(self):
+        chunk = []
+        for path in self.paths:
+            chunk.append(path)
+            if len(chunk) >= self.chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _gather(self, chunk, cache, stats):
+        """
+        Records of chunk in input order, cached where still valid.
+        """
+        st = []
+        for batch in stats.map(stat_batch, _batches(chunk)):
+            st.extend(batch)
+        found, missing = split_cached(chunk, st, cache.get_many(chunk))
+        self.cached += len(found)
+        fresh = []
+        if self._pool is None and len(missing) < BATCH:
+            # a few changed files: not worth starting the workers
+            fresh = read_header_batch(missing)
+        elif missing:
+            if self._pool is None:
+                # spawn: forking a process that runs Tk and threads is not safe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            for batch in self._pool.map(read_header_batch, _batches(missing)):
+                fresh.extend(batch)
+        cache.put_many(fresh)
+        self.parsed += len(fresh)
+        for rec in fresh:
+            found[rec["path"]] = rec
+        return [found[p] for p in chunk if p in found]
@@ -0,0 +1,139 @@
+"""
+auraview/core/metadata_table.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from auraview.core.query import parse_query, evaluate_query, QueryError
+
+SIZE_UNITS = {"": 1, "b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3}
+FORMAT_ALIASES = {"HEIC": "HEIF", "JPG": "JPEG", "TIF": "TIFF"}
+# user facing field names -> table columns
+ALIASES = {
+    "resolution": "pixels",
+    "res": "pixels",
+    "mp": "megapixels",
+    "filename": "name",
+    "folder": "dir",
+    "type": "format",
+    "capture": "date",
+    "datetime": "date",
+    "modified": "mtime",
+}
+
+
+def parse_size(text):
+    """
+    Convert "5MB", "300 kb" or "1024" to bytes.
+
+    :param text: Size with an optional unit
+    """
+    match = re.match(r"^\s*([\d.]+)\s*([kmg]?b?)\s*$", text, re.IGNORECASE)
+    if not match:
+        raise QueryError(f"Invalid size: {text!r}")
+    return float(match.group(1)) * SIZE_UNITS[match.group(2).lower()]
+
+
+def parse_pixels(text):
+    """
+    Convert "1920x1080", "12MP" or "2000000" to a pixel count.
+
+    :param text: Resolution value
+    """
+    text = text.strip().lower()
+    match = re.match(r"^(\d+)\s*[x*]\s*(\d+)$", text)
+    if match:
+        return float(int(match.group(1)) * int(match.group(2)))
+    if text.endswith("mp"):
+        return float(text[:-2]) * 1e6
+    return float(text)
+
+
+def normalize_format(text):
+    """
+    Map an extension or format name onto the PIL format name.
+
+    :param text: e.g. "heic", ".jpg", "JPEG"
+    """
+    text = text.strip().lstrip(".").upper()
+    return FORMAT_ALIASES.get(text, text)
+
+
+CONVERTERS = {
+    "size": parse_size,
+    "pixels": parse_pixels,
+    "format": normalize_format,
+}
+
+
+def build_table(paths, records):
+    """
+    Build a columnar table (one row per path) from header records.
+
+    Paths without a record keep NaN/NaT in the header derived columns, so
+    they never match a numeric or date clause.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Absolute image paths
+    records : list[dict]
+        One header record per path (may be empty)
+    """
+    def column(name):
+        return np.array(
+            [r.get(name) if r.get(name) is not None else np.nan for r in records],
+            dtype=float
+        )
+
+    width = column("width")
+    height = column("height")
+    mtime = column("mtime")
+
+    mtime_dt = pd.to_datetime(
+        [datetime.fromtimestamp(t) if t == t else None for t in mtime]
+    )
+    date = pd.to_datetime(
+        [r.get("datetime_original") for r in records],
+        format="%Y:%m:%d %H:%M:%S",
+        errors="coerce"
+    )
+    exts = [os.path.splitext(p)[1].lower() for p in paths]
+
+    return pd.DataFrame({
+        "path": paths,
+        "name": [os.path.basename(p) for p in paths],
+        "dir": [os.path.dirname(p) for p in paths],
+        "ext": exts,
+        "format": [
+            normalize_format(r.get("format") or ext)
+            for r, ext in zip(records, exts)
+        ],
+        "size": column("size"),
+        "width": width,
+        "height": height,
+        "pixels": width * height,
+        "megapixels": width * height / 1e6,
+        "mtime": mtime_dt,
+        "date": pd.Series(date).fillna(pd.Series(mtime_dt)).values,
+    })
+
+
+def filter_table(table, query):
+    """
+    Return the set of paths in table matching query.
+
+    :param table: Output of build_table
+    :param query: e.g. "size > 5MB and res >= 1920x1080"
+    """
+    mask = evaluate_query(
+        table, parse_query(query), aliases=ALIASES, converters=CONVERTERS
+    )
+    return set(table["path"].values[mask.values])
@@ -4,6 +4,7 @@ application/photo_module.py
 Author: Benevant Mathew
 Date: 2025-12-16
 """
+import io
 import os
 from PIL import Image
 import piexif
@@ -17,6 +18,8 @@ from auraview.basic_functions.convert import (
 from auraview.basic_functions.time_funs import (
 	unix_time2norm,datetime2string,string2datetime
 )
+from auraview.core.image_source import open_image, source_path
+from auraview.application.config import settings
 
 # Photo module
 def pic_auto_size(img, max_w, max_h):
@@ -28,8 +31,18 @@ def pic_auto_size(img, max_w, max_h):
     :param max_h: Description
     """
 
-    with Image.open(img) as im:
-        w, h = im.size
+    with open_image(img) as im:
+        return fit_size(im.size, max_w, max_h)
+
+def fit_size(size, max_w, max_h):
+    """
+    Scale (w, h) to fit inside max_w x max_h, keeping the aspect ratio.
+
+    :param size: (w, h) of the source
+    :param max_w: Box width
+    :param max_h: Box height
+    """
+    w, h = size
 
     if w == 0 or h == 0:
         return (0, 0)
@@ -48,9 +61,8 @@ def image_datetime(file):
     :param file: Description
     """
     # DateTime Tag
-    im = Image.open(file)
-    tags=im.getexif()
-    im.close()
+    with open_image(file) as im:
+        tags=im.getexif()
     try:
         dt=tags[306]
     except:
@@ -64,9 +76,8 @@ def image_datetime_original(file):
     :param file: Description
     """
     # DateTimeOriginal Tag
-    im = Image.open(file)
-    tags = im.getexif()
-    im.close()
+    with open_image(file) as im:
+        tags = im.getexif()
     try:
         dt = tags[36867]
     except:
@@ -80,9 +91,8 @@ def image_datetime_digitized(file):
     :param file: Description
     """
     # DateTimeDigitized Tag
-    im = Image.open(file)
-    tags = im.getexif()
-    im.close()
+    with open_image(file) as im:
+        tags = im.getexif()
     try:
         dt = tags[36868]
     except:
@@ -97,8 +107,12 @@ def create_image_obj(file, width, height):
     :param width: Description
     :param height: Description
     """
-    pic_size = pic_auto_size(file, width, height)
-    obj = Image.open(file).resize(pic_size,Image.LANCZOS)
+    # one open serves both the size probe and the decode
+    with open_image(file) as im:
+        pic_size = fit_size(im.size, width, height)
+        # reduced-scale JPEG decode (1/2..1/8, never below pic_size)
+        im.draft(None, (max(pic_size[0], 1), max(pic_size[1], 1)))
+        obj = im.resize(pic_size, settings.resample_filter)
     return obj
 
 def get_image_ext(file):
@@ -107,8 +121,8 @@ def get_image_ext(file):
 
     :param file: Description
     """
-    img = Image.open(file)
-    return img.format
+    with open_image(file) as img:
+        return img.format
 
 def correct_image_ext(file):
     """
@@ -146,8 +160,8 @@ def get_pic_wh(img,mode='pixel',dpi='default'):
     :param mode: Description
     :param dpi: Description
     """
-    im=Image.open(img)
-    w,h=im.size
+    with open_image(img) as im:
+        w,h=im.size
     if mode=='pixel' and dpi=='default':
         pass
     elif mode=='mm' and dpi!='default':
@@ -169,9 +183,8 @@ def get_native_dpi(file):
     """
     #dpi out id a tuple with x and y dpi values
     try:
-        im = Image.open(file)
-        dpi = im.info.get('dpi', None)
-        im.close()
+        with open_image(file) as im:
+            dpi = im.info.get('dpi', None)
         return dpi
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -202,9 +215,9 @@ def update_datetime(image_path, new_datetime,mode='string',format='%m/%d/%y'):
     :param format: Description
     """
     try:
-        # get current datetime from the image
-        image = Image.open(image_path)
-        exif_data = image._getexif()
+        # get current datetime from the image; closed before the rewrite
+        with Image.open(image_path) as image:
+            exif_data = image._getexif()
         if exif_data is not None:
             if 306 in exif_data:
                 dt=exif_data[306]
@@ -273,3 +286,50 @@ def get_photo_dir(image_file):
     else:
         out=get_previous_dir_from_path(image_file)
     return out
+
+def read_header_record(file):
+    """
+    Read the sortable/filterable header fields of an image without decoding
+    its pixels. Returns a dict or None when the file is not a readable image.
+
+    :param file: Image path or ImageSource
+    """
+    try:
+        st = os.stat(source_path(file))
+        with open_image(file) as im:
+            width, height = im.size
+            fmt = im.format
+            exif = im.getexif()
+            dt = exif.get_ifd(0x8769).get(36867) or exif.get(306)
+    except Exception:
+        return None
+    return {
+        "path": source_path(file),
+        "mtime": st.st_mtime,
+        "size": st.st_size,
+        "width": width,
+        "height": height,
+        "format": fmt,
+        "datetime_original": str(dt).strip('\x00 ') if dt else None,
+    }
+
+def read_embedded_thumbnail(file):
+    """
+    Return the small JPEG preview embedded in the EXIF block (decoded), or
+    None. Much cheaper than decoding the image itself.
+
+    :param file: Image path or ImageSource
+    """
+    try:
+        with open_image(file) as im:
+            exif = im.info.get("exif")
+        if not exif:
+            return None
+        data = piexif.load(exif).get("thumbnail")
+        if not data:
+            return None
+        thumb = Image.open(io.BytesIO(data))
+        thumb.load()
+        return thumb
+    except Exception:
+        return None
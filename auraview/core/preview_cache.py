@@ -0,0 +1,193 @@
+"""
+auraview/core/preview_cache.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import threading
+import multiprocessing
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+
+from PIL import UnidentifiedImageError
+from pillow_heif import register_heif_opener
+
+from auraview.core.disk_cache import ImageDiskCache
+from auraview.core.image_source import open_image
+from auraview.core.photo_module import fit_size, create_image_obj
+from auraview.application.config import settings
+
+# bulk workers import this module, so they can read HEIC too
+register_heif_opener()
+
+ORIENT = 0x0112
+# previews are JPEGs seen at screen size: keep them close to the source
+QUALITY = 90
+
+
+class PreviewCache:
+    """
+    Screen-sized JPEG renditions of large images, kept on disk.
+
+    A preview is the image fitted into a size x size box, rendered like
+    the display frame. Displays at or below that box are resized from the
+    preview instead of decoding the full file (a 48 MP HEIC costs a full
+    libheif decode). Entries are keyed by path, mtime, size and EXIF
+    orientation, so edits and rotations miss, and the directory is pruned
+    least recently used first once it exceeds max_bytes.
+    """
+
+    def __init__(self, size, max_bytes):
+        self.size = size
+        self.disk = ImageDiskCache("previews", max_bytes, quality=QUALITY)
+        # rendering a preview decodes the full image: keep it off the
+        # display path
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="auraview-preview")
+        self._queued = set()
+        self._lock = threading.Lock()
+
+    def covers(self, width, height):
+        """
+        True if a width x height display can be served from a preview.
+        """
+        return width <= self.size and height <= self.size
+
+    def lookup(self, path):
+        """
+        Return the cache key of path, or None when the image is too small
+        to be worth a preview (or cannot be read).
+
+        Only the header is parsed, for the pixel size and orientation.
+        """
+        try:
+            with open_image(path) as im:
+                if max(im.size) <= self.size:
+                    return None
+                orientation = im.getexif().get(ORIENT, 1)
+        except (OSError, UnidentifiedImageError):
+            return None
+        return self.disk.key(
+            path, extra=f"{self.size}|{orientation}|{settings.resample}"
+        )
+
+    def get(self, key, width, height):
+        """
+        Return the preview under key fitted into width x height, or None.
+        """
+        preview = self.disk.get(key)
+        if preview is None:
+            return None
+        return self.fit(preview, width, height)
+
+    def put(self, key, preview):
+        """
+        Store a rendered preview (alpha images are left to a full decode).
+        """
+        if preview.mode in ("RGB", "L"):
+            self.disk.put(key, preview)
+
+    def schedule(self, key, path):
+        """
+        Render and store the preview of path in the background, once per
+        key however often it is asked for before the write lands.
+        """
+        with self._lock:
+            if key in self._queued:
+                return
+            self._queued.add(key)
+        self._writer.submit(self._build, key, path)
+
+    def _build(self, key, path):
+        try:
+            self.put(key, self.render(path))
+        finally:
+            with self._lock:
+                self._queued.discard(key)
+
+    def close(self):
+        """
+        Finish pending writes.
+        """
+        self._writer.shutdown(wait=True)
+
+    def render(self, path):
+        """
+        Decode path at preview size.
+        """
+        return create_image_obj(path, self.size, self.size)
+
+    def make(self, path):
+        """
+        Render and store the preview of path unless it is cached or not
+        needed. Returns True when a preview was written.
+        """
+        key = self.lookup(path)
+        if key is None or self.disk.get(key) is not None:
+            return False
+        self.put(key, self.render(path))
+        return True
+
+    @staticmethod
+    def fit(preview, width, height):
+        """
+        Resize a preview down to the display box (unchanged if it fits).
+        """
+        size = fit_size(preview.size, width, height)
+        if size == preview.size:
+            return preview
+        return preview.resize(size, settings.resample_filter)
+
+
+# -------------------------------------------------
+# Bulk generation
+# -------------------------------------------------
+_worker_cache = None
+
+
+def _init_worker(values):
+    global _worker_cache
+    # spawned workers start from the defaults; use the caller's settings
+    settings.restore(values)
+    _worker_cache = PreviewCache(
+        settings.preview_size, settings.preview_cache_mb * 2**20
+    )
+
+
+def make_preview(path):
+    """
+    Build the preview of path in a bulk worker process.
+
+    :returns: (path, True if written)
+    """
+    return path, _worker_cache.make(path)
+
+
+def build_previews(paths, workers=None):
+    """
+    Generate missing previews in worker processes.
+
+    :param paths: Image paths
+    :param workers: Worker processes (None = one per CPU)
+    :returns: Iterator of (path, written, error) in completion order
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(settings.as_dict(),)
+    )
+    futures = {}
+    try:
+        for path in paths:
+            futures[pool.submit(make_preview, path)] = path
+        for future in as_completed(futures):
+            try:
+                yield future.result() + (None,)
+            except Exception as e:
+                # decoders raise OSError, SyntaxError, ValueError, ...
+                yield futures[future], False, e
+    finally:
+        pool.shutdown(wait=False)
+        for future in futures:
+            future.cancel()
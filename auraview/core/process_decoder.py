@@ -0,0 +1,145 @@
+"""
+auraview/core/process_decoder.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import shared_memory
+
+from PIL import Image
+from pillow_heif import register_heif_opener
+
+from auraview.core.photo_module import create_image_obj
+from auraview.core.thumbnails import make_thumbnail
+from auraview.application.config import settings
+
+# worker processes import this module, so they can read HEIC too
+register_heif_opener()
+
+BYTES_PER_PIXEL = {"L": 1, "RGB": 3, "RGBA": 4}
+
+
+# -------------------------------------------------
+# Worker side
+# -------------------------------------------------
+def _init_worker(values):
+    # spawned workers start from the defaults; use the viewer's settings
+    settings.restore(values)
+
+
+def _to_shared(img):
+    """
+    Copy the pixels of img into a new shared memory block.
+
+    :returns: (block name, mode, size); the parent unlinks the block
+    """
+    if img.mode not in ("RGB", "RGBA", "L"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    data = img.tobytes()
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[:len(data)] = data
+    name = shm.name
+    shm.close()
+    return name, img.mode, img.size
+
+
+def decode_frame(path, width, height):
+    """
+    Worker: decode path resized to fit width x height.
+    """
+    return _to_shared(create_image_obj(path, width, height))
+
+
+def decode_thumbnail(path, size):
+    """
+    Worker: reduced-scale thumbnail of path.
+    """
+    return _to_shared(make_thumbnail(path, size))
+
+
+# -------------------------------------------------
+# Viewer side
+# -------------------------------------------------
+def _from_shared(result):
+    name, mode, size = result
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        nbytes = BYTES_PER_PIXEL[mode] * size[0] * size[1]
+        img = Image.frombytes(mode, size, shm.buf[:nbytes])
+    finally:
+        shm.close()
+        shm.unlink()
+    return img
+
+
+class _FrameFuture(Future):
+    """
+    Future of a PIL image decoded in a worker process. Cancelling it
+    cancels the worker task if it has not started.
+    """
+
+    def __init__(self, inner):
+        super().__init__()
+        self._inner = inner
+        inner.add_done_callback(self._collect)
+
+    def cancel(self):
+        return self._inner.cancel() and super().cancel()
+
+    def _collect(self, inner):
+        # runs even when nobody waits, so no block is left behind
+        if inner.cancelled():
+            return
+        try:
+            img = _from_shared(inner.result())
+        except BaseException as e:
+            self.set_exception(e)
+        else:
+            self.set_result(img)
+
+
+class ProcessDecoder:
+    """
+    Decode and resize images in worker processes.
+
+    Decoding HEIC and LANCZOS resampling are CPU bound and partly hold the
+    GIL, so in threads they slow down Tk; workers run on other cores. The
+    pixels come back through a shared memory block (one copy into the
+    viewer, no pickling of the frame). Calls return futures of PIL images.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        # spawn: forking a process that runs Tk and threads is not safe
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings.as_dict(),)
+        )
+
+    def frame(self, path, width, height):
+        """
+        Future of path resized to fit width x height.
+        """
+        return _FrameFuture(self.pool.submit(decode_frame, path, width, height))
+
+    def thumbnail(self, path, size):
+        """
+        Future of the size x size thumbnail of path.
+        """
+        return _FrameFuture(self.pool.submit(decode_thumbnail, path, size))
+
+    def make_thumbnail(self, path, size):
+        """
+        Blocking thumbnail call with the signature of make_thumbnail().
+        """
+        return self.thumbnail(path, size).result()
+
+    def close(self):
+        """
+        Shut the pool down without waiting for it.
+        """
+        self.pool.shutdown(wait=False)
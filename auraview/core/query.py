@@ -0,0 +1,135 @@
+"""
+auraview/core/query.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import re
+from fnmatch import translate
+
+import pandas as pd
+
+# field, operator, value  e.g.  size > 5MB | name ~ IMG_*.heic
+CLAUSE_RE = re.compile(
+    r"^\s*([A-Za-z_][\w ]*?)\s*(==|!=|>=|<=|=|>|<|~)\s*(.+?)\s*$"
+)
+# clauses are joined with "and" (or "&&" / ";")
+SPLIT_RE = re.compile(r"\s+and\s+|\s*&&\s*|\s*;\s*", re.IGNORECASE)
+DATE_ONLY_RE = re.compile(r"^\d{4}[-:/]\d{2}([-:/]\d{2})?$")
+
+
+class QueryError(ValueError):
+    """Raised for a malformed query or an unknown field."""
+
+
+def parse_query(text):
+    """
+    Split a query string into (field, op, value) clauses.
+
+    :param text: e.g. "date >= 2024-01-01 and format == HEIC"
+    """
+    clauses = []
+    for part in SPLIT_RE.split(text.strip()):
+        if not part:
+            continue
+        match = CLAUSE_RE.match(part)
+        if not match:
+            raise QueryError(f"Cannot parse clause: {part!r}")
+        field, op, value = match.groups()
+        if op == "=":
+            op = "=="
+        value = value.strip("'\"")
+        clauses.append((field.strip().lower(), op, value))
+    return clauses
+
+
+def _date_bounds(value):
+    """
+    Return (start, end) timestamps covering a date-only value.
+    """
+    value = value.replace(":", "-").replace("/", "-")
+    start = pd.Timestamp(value)
+    if value.count("-") == 1:
+        return start, start + pd.DateOffset(months=1)
+    return start, start + pd.Timedelta(days=1)
+
+
+def _compare(column, op, value):
+    if op == "==":
+        return column == value
+    if op == "!=":
+        return column != value
+    if op == ">":
+        return column > value
+    if op == ">=":
+        return column >= value
+    if op == "<":
+        return column < value
+    return column <= value
+
+
+def evaluate_query(df, clauses, aliases=None, converters=None):
+    """
+    Return a boolean Series selecting the rows of df that match every clause.
+
+    Values are coerced to the column type: numbers for numeric columns,
+    timestamps for datetime columns (a bare date covers the whole day or
+    month) and case-insensitive text otherwise. "~" is a glob match.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Table to query
+    clauses : list[tuple]
+        Output of parse_query
+    aliases : dict | None
+        Alternative field names mapped to column names
+    converters : dict | None
+        Column name -> callable turning the raw value into a comparable one
+    """
+    aliases = aliases or {}
+    converters = converters or {}
+    columns = {str(c).lower(): c for c in df.columns}
+    mask = pd.Series(True, index=df.index)
+
+    for field, op, raw in clauses:
+        field = aliases.get(field, field)
+        if field.lower() not in columns:
+            raise QueryError(f"Unknown field: {field}")
+        col = columns[field.lower()]
+        column = df[col]
+
+        if op == "~":
+            pattern = translate(raw)
+            mask &= column.astype(str).str.match(
+                pattern, case=False, na=False
+            )
+            continue
+
+        if col in converters:
+            mask &= _compare(column, op, converters[col](raw)).fillna(False)
+        elif pd.api.types.is_datetime64_any_dtype(column):
+            if DATE_ONLY_RE.match(raw):
+                start, end = _date_bounds(raw)
+                bounds = {
+                    "==": (column >= start) & (column < end),
+                    "!=": (column < start) | (column >= end),
+                    ">": column >= end,
+                    ">=": column >= start,
+                    "<": column < start,
+                    "<=": column < end,
+                }
+                mask &= bounds[op].fillna(False)
+            else:
+                mask &= _compare(column, op, pd.Timestamp(raw)).fillna(False)
+        elif pd.api.types.is_numeric_dtype(column):
+            try:
+                value = float(raw)
+            except ValueError as exc:
+                raise QueryError(f"{field} expects a number, got {raw!r}") from exc
+            mask &= _compare(column, op, value).fillna(False)
+        else:
+            text = column.astype("string").str.lower()
+            mask &= _compare(text, op, raw.lower()).fillna(False)
+
+    return mask.astype(bool)
@@ -0,0 +1,246 @@
+"""
+auraview/core/raw_preview.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import io
+import os
+import struct
+
+from PIL import Image, UnidentifiedImageError
+
+# TIFF based camera RAW formats: extension -> format name
+RAW_FORMATS = {
+    ".cr2": "CR2",
+    ".nef": "NEF",
+    ".nrw": "NRW",
+    ".arw": "ARW",
+    ".sr2": "SR2",
+    ".dng": "DNG",
+    ".pef": "PEF",
+    ".orf": "ORF",
+    ".rw2": "RW2",
+}
+# byte order mark + magic of plain TIFF and of the vendor variants
+# (Olympus ORF, Panasonic RW2)
+HEADERS = {
+    b"II*\x00": "<", b"MM\x00*": ">",
+    b"IIRO": "<", b"IIRS": "<", b"IIU\x00": "<",
+}
+# TIFF field type -> (struct code, size)
+TYPES = {
+    1: ("B", 1), 2: ("s", 1), 3: ("H", 2), 4: ("I", 4), 5: ("II", 8),
+    7: ("s", 1), 9: ("i", 4), 10: ("ii", 8), 13: ("I", 4),
+}
+# bounds on what a damaged file can make us read
+MAX_IFDS = 64
+MAX_ENTRIES = 1024
+
+TAG_COMPRESSION = 0x0103
+TAG_STRIP_OFFSETS = 0x0111
+TAG_STRIP_BYTE_COUNTS = 0x0117
+TAG_SUB_IFDS = 0x014A
+TAG_JPEG_OFFSET = 0x0201
+TAG_JPEG_LENGTH = 0x0202
+TAG_EXIF_IFD = 0x8769
+# Panasonic RW2 keeps its full size preview in one UNDEFINED field
+TAG_JPEG_FROM_RAW = 0x002E
+JPEG_COMPRESSION = (6, 7)
+# fields copied into the EXIF of the opened preview
+IFD0_TAGS = (271, 272, 274, 305, 306, 315, 33432)
+EXIF_TAGS = (33434, 33437, 34855, 36867, 36868, 37386, 42036)
+# SOF markers of baseline / extended / progressive JPEG; lossless JPEG
+# (the raw data of CR2 and many DNGs) cannot be decoded by PIL
+SOF_DECODABLE = (0xC0, 0xC1, 0xC2)
+
+
+def is_raw(path):
+    """
+    True if path has a camera RAW extension.
+    """
+    return os.path.splitext(path)[1].lower() in RAW_FORMATS
+
+
+class RawInfo:
+    """
+    Result of one pass over the IFDs of a RAW file.
+
+    :ivar previews: [(offset, length, width, height)] of decodable JPEGs
+    :ivar ifd0: Selected IFD0 fields
+    :ivar exif: Selected EXIF fields
+    """
+
+    def __init__(self):
+        self.previews = []
+        self.ifd0 = {}
+        self.exif = {}
+
+    def largest(self):
+        """
+        (offset, length, width, height) of the largest preview, or None.
+        """
+        if not self.previews:
+            return None
+        return max(self.previews, key=lambda p: (p[2] * p[3], p[1]))
+
+
+def _read_at(f, offset, size):
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise UnidentifiedImageError("truncated RAW file")
+    return data
+
+
+def _read_ifd(f, order, offset):
+    """
+    Return ({tag: values}, next IFD offset). ASCII fields are str,
+    UNDEFINED fields only their (offset, count) since they can be large.
+    """
+    count, = struct.unpack(order + "H", _read_at(f, offset, 2))
+    if count > MAX_ENTRIES:
+        raise UnidentifiedImageError("bad IFD")
+    raw = _read_at(f, offset + 2, count * 12 + 4)
+    fields = {}
+    for i in range(count):
+        tag, typ, n = struct.unpack(order + "HHI", raw[i * 12:i * 12 + 8])
+        if typ not in TYPES:
+            continue
+        code, size = TYPES[typ]
+        total = size * n
+        value_offset = offset + 2 + i * 12 + 8
+        if total > 4:
+            value_offset, = struct.unpack(order + "I", raw[i * 12 + 8:i * 12 + 12])
+        if typ == 7:
+            fields[tag] = (value_offset, n)
+            continue
+        if total > 4096:
+            continue
+        data = _read_at(f, value_offset, total)
+        if typ == 2:
+            fields[tag] = data.split(b"\x00", 1)[0].decode("latin-1")
+        else:
+            values = struct.unpack(order + code * n, data)
+            if typ in (5, 10):
+                values = tuple(zip(values[::2], values[1::2]))
+            fields[tag] = values
+    next_ifd, = struct.unpack(order + "I", raw[count * 12:])
+    return fields, next_ifd
+
+
+def _jpeg_size(f, offset, length):
+    """
+    (width, height) of the JPEG stream at offset, or None when it is not
+    one PIL can decode. Only the marker segments before SOF are read.
+    """
+    if length < 4 or _read_at(f, offset, 2) != b"\xff\xd8":
+        return None
+    pos = offset + 2
+    end = offset + length
+    while pos + 4 <= end:
+        marker, seg_len = struct.unpack(">2sH", _read_at(f, pos, 4))
+        if marker[0] != 0xFF:
+            return None
+        kind = marker[1]
+        if kind in SOF_DECODABLE:
+            height, width = struct.unpack(">HH", _read_at(f, pos + 5, 4))
+            return width, height
+        if kind == 0xDA or (0xC3 <= kind <= 0xCF and kind not in (0xC4, 0xC8, 0xCC)):
+            # image data or an unsupported SOF before a usable SOF
+            return None
+        pos += 2 + seg_len
+    return None
+
+
+def parse_raw(f):
+    """
+    Walk the IFD chain, SubIFDs and EXIF IFD of a TIFF based RAW file,
+    collecting its embedded JPEG previews and the metadata fields.
+
+    :param f: Seekable binary file object
+    :returns: RawInfo
+    """
+    order = HEADERS.get(_read_at(f, 0, 4))
+    if order is None:
+        raise UnidentifiedImageError("not a TIFF based RAW file")
+    first, = struct.unpack(order + "I", _read_at(f, 4, 4))
+    info = RawInfo()
+    candidates = []
+    todo = [(first, True)]
+    seen = set()
+    while todo and len(seen) < MAX_IFDS:
+        offset, chain = todo.pop()
+        if not offset or offset in seen:
+            continue
+        seen.add(offset)
+        try:
+            fields, next_ifd = _read_ifd(f, order, offset)
+        except (UnidentifiedImageError, struct.error):
+            continue
+        if not info.ifd0 and offset == first:
+            info.ifd0 = {t: fields[t] for t in IFD0_TAGS if t in fields}
+        if chain:
+            todo.append((next_ifd, True))
+        todo.extend((sub, False) for sub in fields.get(TAG_SUB_IFDS, ()))
+        if TAG_EXIF_IFD in fields:
+            try:
+                exif, _ = _read_ifd(f, order, fields[TAG_EXIF_IFD][0])
+            except (UnidentifiedImageError, struct.error):
+                exif = {}
+            info.exif = {t: exif[t] for t in EXIF_TAGS if t in exif}
+
+        if TAG_JPEG_OFFSET in fields and TAG_JPEG_LENGTH in fields:
+            candidates.append((fields[TAG_JPEG_OFFSET][0], fields[TAG_JPEG_LENGTH][0]))
+        if (fields.get(TAG_COMPRESSION, (0,))[0] in JPEG_COMPRESSION
+                and len(fields.get(TAG_STRIP_OFFSETS, ())) == 1
+                and len(fields.get(TAG_STRIP_BYTE_COUNTS, ())) == 1):
+            candidates.append(
+                (fields[TAG_STRIP_OFFSETS][0], fields[TAG_STRIP_BYTE_COUNTS][0])
+            )
+        if TAG_JPEG_FROM_RAW in fields:
+            candidates.append(fields[TAG_JPEG_FROM_RAW])
+
+    for offset, length in set(candidates):
+        try:
+            size = _jpeg_size(f, offset, length)
+        except (UnidentifiedImageError, struct.error):
+            continue
+        if size is not None:
+            info.previews.append((offset, length) + size)
+    return info
+
+
+def _exif_bytes(info):
+    exif = Image.Exif()
+    for tag, value in info.ifd0.items():
+        exif[tag] = value[0] if isinstance(value, tuple) and len(value) == 1 else value
+    if info.exif:
+        exif[TAG_EXIF_IFD] = {
+            tag: value[0] if isinstance(value, tuple) and len(value) == 1 else value
+            for tag, value in info.exif.items()
+        }
+    return exif.tobytes()
+
+
+def open_raw(f, path):
+    """
+    Open the largest embedded JPEG preview of a RAW file.
+
+    The preview is decoded like any JPEG (lazily, so draft() can still
+    pick a reduced scale); its format is the RAW format and its EXIF
+    carries the RAW's own camera and date fields.
+
+    :param f: Seekable binary file object over the RAW file
+    :param path: File name, for the format
+    :raises UnidentifiedImageError: no decodable preview
+    """
+    info = parse_raw(f)
+    best = info.largest()
+    if best is None:
+        raise UnidentifiedImageError(f"no embedded JPEG preview in {path}")
+    offset, length = best[:2]
+    im = Image.open(io.BytesIO(_read_at(f, offset, length)))
+    im.format = RAW_FORMATS.get(os.path.splitext(path)[1].lower(), "RAW")
+    im.info["exif"] = _exif_bytes(info)
+    return im
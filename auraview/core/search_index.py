@@ -0,0 +1,261 @@
+"""
+auraview/core/search_index.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import bisect
+import threading
+from array import array
+from collections import deque
+
+from auraview.core.file_list import _split, ENCODING, ERRORS
+
+# paths indexed per lock hold, so queries never wait long
+INDEX_BATCH = 5000
+# pads the end of a file name: every 1-2 character substring of a name
+# is then the start of one of its trigrams
+END = "\0\0"
+SEPARATORS = tuple({os.sep, os.altsep or os.sep})
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Case-insensitive substring search over file paths.
+
+    Folders and file names are indexed apart, since the folders of a
+    large collection are few and each is shared by many files:
+
+    * a query found in a folder matches every file in it (the folders are
+      searched as one newline-joined string),
+    * a query without a separator is looked up in a trigram index over
+      the file names (padded at the end, so queries of one or two
+      characters work too) and candidates are confirmed by a substring test,
+    * a query with a separator that spans folder and name is split at its
+      last separator: the folder must end with the head and the name
+      start with the tail.
+
+    add() only queues paths; a background thread indexes them in batches,
+    so the index grows while a scan is still running. Queries see what has
+    been indexed so far (`pending` tells how much is left).
+    """
+
+    def __init__(self):
+        self._dirs = []
+        self._dirs_lower = []
+        self._dir_ids = {}
+        self._dir_files = []
+        # lower case folders joined by newlines, one chunk per indexing
+        # batch: (text, id of its first folder, start offset of each folder)
+        self._dir_chunks = []
+        self._unsealed = 0
+        # per file: folder id and utf-8 name in one packed blob
+        self._file_dirs = array("I")
+        self._offsets = array("Q", [0])
+        self._blob = bytearray()
+        self._postings = {}
+        self._removed = set()
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="auraview-search-index", daemon=True
+        )
+        self._thread.start()
+
+    def __len__(self):
+        return len(self._file_dirs)
+
+    @property
+    def pending(self):
+        """
+        Number of paths queued but not indexed yet.
+        """
+        with self._cond:
+            return sum(len(batch) for batch in self._queue)
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+    def add(self, paths):
+        """
+        Queue paths for indexing.
+
+        :param paths: Iterable of absolute paths
+        """
+        batch = list(paths)
+        if not batch:
+            return
+        with self._cond:
+            self._queue.append(batch)
+            self._cond.notify()
+
+    def discard(self, path):
+        """
+        Leave path out of future results (it was removed from the list).
+        """
+        with self._lock:
+            self._removed.add(path)
+
+    def close(self):
+        """
+        Stop indexing.
+        """
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                batch = self._queue[0]
+            for i in range(0, len(batch), INDEX_BATCH):
+                with self._lock:
+                    for path in batch[i:i + INDEX_BATCH]:
+                        self._index(path)
+                    self._seal()
+            with self._cond:
+                if self._queue and self._queue[0] is batch:
+                    self._queue.popleft()
+
+    def _index(self, path):
+        self._removed.discard(path)
+        prefix, name = _split(path)
+        dir_id = self._dir_ids.get(prefix)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dir_ids[prefix] = dir_id
+            self._dirs.append(prefix)
+            self._dirs_lower.append(prefix.lower())
+            self._dir_files.append(array("I"))
+        file_id = len(self._file_dirs)
+        self._file_dirs.append(dir_id)
+        self._blob += name.encode(ENCODING, ERRORS)
+        self._offsets.append(len(self._blob))
+        self._dir_files[dir_id].append(file_id)
+        postings = self._postings
+        for gram in _trigrams(name.lower() + END):
+            ids = postings.get(gram)
+            if ids is None:
+                ids = postings[gram] = array("I")
+            ids.append(file_id)
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+    def _name(self, file_id):
+        return self._blob[self._offsets[file_id]:self._offsets[file_id + 1]].decode(
+            ENCODING, ERRORS
+        )
+
+    def _path(self, file_id):
+        return self._dirs[self._file_dirs[file_id]] + self._name(file_id)
+
+    def search(self, text, limit=None):
+        """
+        Return the set of indexed paths containing text (ignoring case).
+
+        :param text: Substring of the file name or path
+        :param limit: Stop after about this many matches
+        """
+        query = text.lower()
+        if os.altsep:
+            query = query.replace(os.altsep, os.sep)
+        if not query or "\n" in query:
+            return set()
+        with self._lock:
+            found = set()
+            for dir_id in self._find_dirs(query):
+                found.update(self._dir_files[dir_id])
+            if any(sep in query for sep in SEPARATORS):
+                found.update(self._spanning(query))
+            else:
+                found.update(self._in_names(query, limit))
+            paths = set()
+            for file_id in found:
+                path = self._path(file_id)
+                if path not in self._removed:
+                    paths.add(path)
+                    if limit is not None and len(paths) >= limit:
+                        break
+        return paths
+
+    def _seal(self):
+        # join the folders added since the last chunk into a new chunk
+        folders = self._dirs_lower[self._unsealed:]
+        if not folders:
+            return
+        starts = []
+        offset = 0
+        for folder in folders:
+            starts.append(offset)
+            offset += len(folder) + 1
+        text = "\n".join(folders) + "\n"
+        self._dir_chunks.append((text, self._unsealed, starts))
+        self._unsealed = len(self._dirs_lower)
+
+    def _find_dirs(self, needle):
+        """
+        Yield the ids of folders containing needle (a trailing newline
+        anchors it at the end of the folder).
+        """
+        for text, first, starts in self._dir_chunks:
+            pos = text.find(needle)
+            while pos >= 0:
+                k = bisect.bisect_right(starts, pos) - 1
+                yield first + k
+                if k + 1 >= len(starts):
+                    break
+                pos = text.find(needle, starts[k + 1])
+
+    def _in_names(self, query, limit):
+        postings = self._postings
+        if len(query) < 3:
+            # every occurrence starts a trigram of the padded name
+            found = set()
+            for gram, ids in postings.items():
+                if gram.startswith(query):
+                    found.update(ids)
+            return found
+        lists = []
+        for gram in _trigrams(query):
+            ids = postings.get(gram)
+            if ids is None:
+                return set()
+            lists.append(ids)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for ids in lists[1:]:
+            # a few hundred candidates are cheaper to confirm than to intersect
+            if len(candidates) < 256:
+                break
+            candidates.intersection_update(ids)
+        out = set()
+        for file_id in candidates:
+            if query in self._name(file_id).lower():
+                out.add(file_id)
+                if limit is not None and len(out) >= limit:
+                    break
+        return out
+
+    def _spanning(self, query):
+        # the last separator of the query is the one ending the folder
+        cut = max(query.rfind(sep) for sep in SEPARATORS) + 1
+        head, tail = query[:cut], query[cut:]
+        out = []
+        for dir_id in self._find_dirs(head + "\n"):
+            for file_id in self._dir_files[dir_id]:
+                if self._name(file_id).lower().startswith(tail):
+                    out.append(file_id)
+        return out
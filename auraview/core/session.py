@@ -0,0 +1,115 @@
+"""
+auraview/core/session.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import json
+import zlib
+import tempfile
+
+from PIL import Image
+
+from auraview.basic_functions.os_funs import get_cache_dir
+
+SESSION_FILE = "session.json"
+FRAMES_FILE = "session.frames"
+SESSION_VERSION = 1
+# frames kept on each side of the current image
+NEIGHBOURS = 2
+# fast, and most of the gain: photos do not compress much losslessly
+ZLIB_LEVEL = 1
+
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def save_session(state, frames=(), directory=None):
+    """
+    Write the session snapshot.
+
+    The state is JSON; frames are stored as zlib compressed raw pixels in
+    one side file, each with the mtime and size of its source so a file
+    changed since is never shown from the snapshot.
+
+    :param state: Dict of JSON values (loc, current, sort order, window...)
+    :param frames: Iterable of (path, PIL image) display frames
+    :param directory: Session directory (default: the user cache)
+    """
+    directory = directory or get_cache_dir("session")
+    blob = bytearray()
+    index = []
+    for path, image in frames:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGB")
+        data = zlib.compress(image.tobytes(), ZLIB_LEVEL)
+        index.append({
+            "path": path, "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+            "mode": image.mode, "width": image.width, "height": image.height,
+            "offset": len(blob), "length": len(data),
+        })
+        blob += data
+    state = dict(state, version=SESSION_VERSION, frames=index)
+    _write_atomic(os.path.join(directory, FRAMES_FILE), bytes(blob))
+    _write_atomic(
+        os.path.join(directory, SESSION_FILE), json.dumps(state).encode("utf-8")
+    )
+
+
+def load_session(directory=None):
+    """
+    Return the saved session state, or None if there is none (or it is
+    from another version or unreadable).
+    """
+    directory = directory or get_cache_dir("session")
+    try:
+        with open(os.path.join(directory, SESSION_FILE), "rb") as f:
+            state = json.loads(f.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != SESSION_VERSION:
+        return None
+    return state
+
+
+def load_frames(state, directory=None):
+    """
+    Return [(path, image)] of the saved frames whose source file is
+    unchanged (same mtime and size).
+
+    :param state: Output of load_session()
+    """
+    directory = directory or get_cache_dir("session")
+    out = []
+    try:
+        with open(os.path.join(directory, FRAMES_FILE), "rb") as f:
+            for entry in state.get("frames", ()):
+                try:
+                    st = os.stat(entry["path"])
+                except OSError:
+                    continue
+                if (st.st_mtime_ns, st.st_size) != (entry["mtime_ns"], entry["size"]):
+                    continue
+                f.seek(entry["offset"])
+                data = zlib.decompress(f.read(entry["length"]))
+                out.append((entry["path"], Image.frombytes(
+                    entry["mode"], (entry["width"], entry["height"]), data
+                )))
+    except (OSError, ValueError, KeyError, zlib.error):
+        # a damaged snapshot only costs the warm start
+        return out
+    return out
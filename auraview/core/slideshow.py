@@ -0,0 +1,194 @@
+"""
+auraview/core/slideshow.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import math
+
+from auraview.core.photo_module import read_embedded_thumbnail, fit_size
+from auraview.core.memory_governor import governor
+from auraview.application.config import settings
+
+# a frame shown within this many seconds of its deadline is on time
+ON_TIME = 1 / 60
+# how long past its deadline a frame may still be waited for
+GRACE = 0.25
+MIN_LOOKAHEAD = 2
+POLL = 0.01
+
+
+class SlideshowScheduler:
+    """
+    Steps through controller.files on fixed frame deadlines.
+
+    Upcoming frames are decoded ahead through the controller's
+    FramePrefetcher; the lookahead grows with the measured decode time so
+    slow formats (HEIC) are requested early enough. When a frame is still
+    not ready GRACE * interval after its deadline it is shown degraded
+    (its embedded EXIF thumbnail) or skipped, so the show never stalls.
+    Deadlines are absolute (start + k * interval), so timing does not
+    drift, and only counters are kept, so memory stays flat however long
+    it runs.
+    """
+
+    def __init__(self, controller, interval, width, height, loop=True):
+        self.controller = controller
+        self.interval = float(interval)
+        self.width = width
+        self.height = height
+        self.loop = loop
+        self.deadline = None
+        self.target = None
+        # index last shown; navigating by hand re-targets from the new image
+        self.current = None
+        self.stats = {
+            "shown": 0,
+            "late": 0,
+            "degraded": 0,
+            "skipped": 0,
+            "max_late_ms": 0.0,
+        }
+
+    # -------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------
+    def start(self, now):
+        """
+        Begin the show; the next frame is due one interval from now.
+
+        :param now: time.monotonic() value
+        """
+        self.deadline = now + self.interval
+        self.current = self.controller.img_no
+        self.target = self._step(self.current)
+        self.prefetch()
+
+    def resize(self, width, height):
+        """
+        Frames are decoded for a new window size from now on.
+        """
+        self.width = width
+        self.height = height
+        self.prefetch()
+
+    def lookahead(self):
+        """
+        Number of frames kept decoded ahead, from the decode time average.
+        """
+        decode_time = self.controller.frames.decode_time
+        if not decode_time or governor.pressure():
+            return MIN_LOOKAHEAD
+        needed = math.ceil(decode_time / self.interval) + 1
+        return max(MIN_LOOKAHEAD, min(needed, settings.prefetch_depth))
+
+    def prefetch(self):
+        """
+        Request the next frames and cancel decodes that are no longer due.
+        """
+        files = self.controller.files
+        if not files or self.target is None:
+            return
+        keys = set()
+        index = self.target
+        for _ in range(self.lookahead()):
+            key = (files[index], self.width, self.height)
+            keys.add(key)
+            self.controller.frames.request(*key)
+            index = self._step(index)
+            if index is None:
+                break
+        self.controller.frames.retain(keys)
+
+    def next_delay(self, now):
+        """
+        Seconds until tick() should run again.
+        """
+        if self.deadline is None:
+            return None
+        if now < self.deadline:
+            return self.deadline - now
+        return POLL
+
+    def tick(self, now):
+        """
+        Return (index, image) to display now, or None.
+
+        :param now: time.monotonic() value
+        """
+        files = self.controller.files
+        if self.deadline is None or now < self.deadline or not files:
+            return None
+        if (self.target is None or self.current != self.controller.img_no
+                or self.target >= len(files)):
+            self.current = self.controller.img_no
+            self.target = self._step(self.controller.img_no)
+            if self.target is None:
+                self.stop()
+                return None
+            self.prefetch()
+
+        late = now - self.deadline
+        path = files[self.target]
+        image = self.controller.frames.get(path, self.width, self.height)
+
+        if image is None and late < GRACE * self.interval:
+            return None
+
+        if image is None:
+            image = self._degraded(path)
+            self.stats["degraded" if image is not None else "skipped"] += 1
+        else:
+            self.stats["shown"] += 1
+            if late > ON_TIME:
+                self.stats["late"] += 1
+            self.stats["max_late_ms"] = max(self.stats["max_late_ms"], late * 1000)
+
+        index = self.current = self.target
+        self.target = self._step(index)
+        self.deadline += self.interval
+        if now - self.deadline > self.interval:
+            # far behind (suspend, very slow share): resync instead of bursting
+            self.deadline = now + self.interval
+        if self.target is None:
+            self.deadline = None
+        self.prefetch()
+
+        if image is None:
+            return None
+        return index, image
+
+    def stop(self):
+        """
+        End the show and cancel outstanding decodes.
+        """
+        self.deadline = None
+        self.controller.frames.retain(set())
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+    def _step(self, index):
+        total = len(self.controller.files)
+        if total == 0:
+            return None
+        if index + 1 < total:
+            return index + 1
+        return 0 if self.loop else None
+
+    def _degraded(self, path):
+        thumb = read_embedded_thumbnail(path)
+        if thumb is None:
+            return None
+        return thumb.resize(fit_size(thumb.size, self.width, self.height))
+
+    def summary(self):
+        """
+        One line of missed-deadline statistics.
+        """
+        s = self.stats
+        return (
+            f"slideshow: {s['shown']} shown, {s['late']} late "
+            f"(max {s['max_late_ms']:.0f} ms), {s['degraded']} degraded, "
+            f"{s['skipped']} skipped"
+        )
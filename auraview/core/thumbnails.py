@@ -0,0 +1,150 @@
+"""
+auraview/core/thumbnails.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from auraview.core.disk_cache import ImageDiskCache
+from auraview.core.lru_cache import LRUCache
+from auraview.core.memory_governor import governor, PRIORITY_THUMBNAILS
+from auraview.core.image_source import ImageSource
+
+THUMB_SIZE = 160
+THUMB_CACHE_BYTES = 512 * 1024 * 1024
+MEMORY_ITEMS = 2000
+
+
+def make_thumbnail(file, size=THUMB_SIZE):
+    """
+    Return a thumbnail fitting size x size, decoded at reduced scale
+    where the format supports it (JPEG draft mode decodes at 1/2..1/8).
+
+    :param file: Path or ImageSource
+    :param size: Longest edge in pixels
+    """
+    src = file if isinstance(file, ImageSource) else ImageSource(file)
+    try:
+        with src.open_image() as im:
+            im.draft("RGB", (size, size))
+            im.thumbnail((size, size), Image.BILINEAR, reducing_gap=2.0)
+            thumb = im.convert("RGB") if im.mode not in ("RGB", "L") else im.copy()
+    finally:
+        if src is not file:
+            src.close()
+    return thumb
+
+
+class ThumbnailService:
+    """
+    Background thumbnail generation with a memory LRU in front of a
+    persistent disk cache.
+
+    Requests are served newest first and can be narrowed to what is
+    currently visible with retain(), so fast scrolling never leaves the
+    workers busy with cells that scrolled away. `maker(path, size)`
+    replaces make_thumbnail (e.g. to decode in worker processes).
+    """
+
+    def __init__(
+            self,
+            size=THUMB_SIZE,
+            workers=4,
+            max_bytes=THUMB_CACHE_BYTES,
+            maker=None
+        ):
+        self.size = size
+        self.maker = maker or make_thumbnail
+        self.disk = ImageDiskCache("thumbnails", max_bytes)
+        self.memory = LRUCache(
+            MEMORY_ITEMS, governor, name="thumbnails", priority=PRIORITY_THUMBNAILS
+        )
+        self._pending = OrderedDict()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def cached(self, path):
+        """
+        Return an in-memory thumbnail without touching the disk, or None.
+        """
+        return self.memory.get(path)
+
+    def request(self, path, callback):
+        """
+        Ask for the thumbnail of path; callback(path, image) is called from
+        a worker thread (image is None if the file cannot be read).
+
+        :param path: Image path
+        :param callback: Callable
+        """
+        thumb = self.memory.get(path)
+        if thumb is not None:
+            callback(path, thumb)
+            return
+        with self._cond:
+            callbacks = self._pending.setdefault(path, [])
+            callbacks.append(callback)
+            self._pending.move_to_end(path)
+            self._cond.notify()
+
+    def retain(self, paths):
+        """
+        Drop queued requests for paths that are no longer wanted.
+
+        :param paths: Set of paths still of interest
+        """
+        with self._cond:
+            for path in [p for p in self._pending if p not in paths]:
+                del self._pending[path]
+
+    def close(self):
+        """
+        Stop the workers; queued requests are dropped.
+        """
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                path, callbacks = self._pending.popitem(last=True)
+
+            thumb = self._load(path)
+            for callback in callbacks:
+                callback(path, thumb)
+
+    def _load(self, path):
+        thumb = self.memory.get(path)
+        if thumb is not None:
+            return thumb
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = self.disk.key(path, stat, extra=self.size)
+        thumb = self.disk.get(key)
+        if thumb is None:
+            try:
+                thumb = self.maker(path, self.size)
+            except Exception:
+                return None
+            self.disk.put(key, thumb)
+        self.memory.put(path, thumb)
+        return thumb
@@ -0,0 +1,165 @@
+"""
+auraview/core/tile_pyramid.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import math
+import threading
+
+from PIL import Image
+
+from auraview.core.lru_cache import LRUCache
+from auraview.core.memory_governor import governor, PRIORITY_TILES, PRIORITY_LEVELS
+from auraview.core.image_source import ImageSource, open_image
+
+TILE = 256
+# zoom is 2 ** step; steps above 0 magnify the full resolution level
+MAX_STEP = 3
+TILE_CACHE_ITEMS = 512
+LEVEL_CACHE_ITEMS = 2
+
+
+class TilePyramid:
+    """
+    Multi-resolution, tiled view of one image for zoom and pan.
+
+    Level n is the image reduced by 2 ** n. A level is only decoded when a
+    tile of it is needed: coarse levels come from a reduced-scale decode
+    (JPEG draft mode) followed by Image.reduce, or from a finer level that
+    is already in memory, so looking at a 100 MP scan zoomed out never
+    decodes it at full size. Display tiles are TILE x TILE pixels at the
+    current zoom and are kept in an LRU.
+    """
+
+    def __init__(self, path, tile_cache_items=TILE_CACHE_ITEMS):
+        self.path = path
+        with open_image(path) as im:
+            self.size = im.size
+            self.mode = "RGB" if im.mode not in ("RGB", "L") else im.mode
+        longest = max(self.size)
+        self.max_level = max(math.ceil(math.log2(longest / TILE)), 0)
+        self.tiles = LRUCache(
+            tile_cache_items, governor, name="tiles", priority=PRIORITY_TILES
+        )
+        self._levels = LRUCache(
+            LEVEL_CACHE_ITEMS, governor, name="levels", priority=PRIORITY_LEVELS
+        )
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------
+    # Geometry
+    # -------------------------------------------------
+    def fit_step(self, width, height):
+        """
+        Largest zoom step at which the whole image fits width x height.
+        """
+        w, h = self.size
+        scale = min(width / w, height / h)
+        step = math.floor(math.log2(scale)) if scale > 0 else -self.max_level
+        return max(min(step, 0), -self.max_level)
+
+    def display_size(self, step):
+        """
+        Size of the whole image in display pixels at zoom 2 ** step.
+        """
+        w, h = self.size
+        return (max(int(w * 2.0 ** step), 1), max(int(h * 2.0 ** step), 1))
+
+    def tile_range(self, step, box):
+        """
+        Return the (tx, ty) tiles intersecting a display-space box.
+
+        :param step: Zoom step
+        :param box: (x0, y0, x1, y1) in display pixels
+        """
+        dw, dh = self.display_size(step)
+        x0, y0, x1, y1 = box
+        tx0, ty0 = max(int(x0 // TILE), 0), max(int(y0 // TILE), 0)
+        tx1 = min(int(math.ceil(x1 / TILE)), math.ceil(dw / TILE))
+        ty1 = min(int(math.ceil(y1 / TILE)), math.ceil(dh / TILE))
+        return [(tx, ty) for ty in range(ty0, ty1) for tx in range(tx0, tx1)]
+
+    # -------------------------------------------------
+    # Decoding
+    # -------------------------------------------------
+    def level_image(self, level):
+        """
+        Return the image reduced by 2 ** level, decoding it if needed.
+
+        :param level: 0 (full size) .. max_level
+        """
+        img = self._levels.get(level)
+        if img is not None:
+            return img
+
+        with self._lock:
+            img = self._levels.get(level)
+            if img is not None:
+                return img
+
+            finer = [n for n in self._levels.keys() if n < level]
+            # the governor may have dropped it since keys() was taken
+            base_img = self._levels.get(max(finer)) if finer else None
+            if base_img is not None:
+                base = max(finer)
+                w, h = self.size
+                img = base_img.reduce(2 ** (level - base))
+                img = img.crop((0, 0, max(w >> level, 1), max(h >> level, 1)))
+            else:
+                img = self._decode(level)
+            self._levels.put(level, img)
+        return img
+
+    def _decode(self, level):
+        w, h = self.size
+        target = (max(w >> level, 1), max(h >> level, 1))
+        with ImageSource(self.path) as src:
+            with src.open_image() as im:
+                # draft() picks the largest JPEG scale (1/2..1/8) >= target
+                im.draft(self.mode, target)
+                img = im.convert(self.mode)
+        factor = max(min(img.width // target[0], img.height // target[1]), 1)
+        if factor > 1:
+            img = img.reduce(factor)
+        if img.size != target:
+            img = img.resize(target, Image.BILINEAR)
+        return img
+
+    def tile(self, step, tx, ty):
+        """
+        Return display tile (tx, ty) at zoom 2 ** step (cached).
+
+        :param step: Zoom step (-max_level .. MAX_STEP)
+        :param tx: Tile column
+        :param ty: Tile row
+        """
+        key = (step, tx, ty)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            return tile
+
+        if step <= 0:
+            src = self.level_image(-step)
+            box = (tx * TILE, ty * TILE,
+                   min((tx + 1) * TILE, src.width), min((ty + 1) * TILE, src.height))
+            tile = src.crop(box)
+        else:
+            zoom = 2 ** step
+            span = TILE // zoom
+            src = self.level_image(0)
+            box = (tx * span, ty * span,
+                   min((tx + 1) * span, src.width), min((ty + 1) * span, src.height))
+            part = src.crop(box)
+            tile = part.resize(
+                (part.width * zoom, part.height * zoom), Image.NEAREST
+            )
+        self.tiles.put(key, tile)
+        return tile
+
+    def close(self):
+        """
+        Drop every decoded level and tile.
+        """
+        self.tiles.clear()
+        self._levels.clear()
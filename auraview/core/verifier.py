@@ -0,0 +1,204 @@
+"""
+auraview/core/verifier.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import UnidentifiedImageError
+from pillow_heif import register_heif_opener
+
+from auraview.core.image_source import open_image
+
+# worker processes import this module, so they can read HEIC too
+register_heif_opener()
+
+# files checked per round; the queue can be re-targeted between rounds
+BATCH = 32
+# format -> bytes that end a complete file
+END_MARKERS = {"JPEG": b"\xff\xd9", "GIF": b"\x3b"}
+# bytes at the end of the file searched for the end marker
+TAIL = 1024
+STATUS_OK = "ok"
+STATUS_CORRUPT = "corrupt"
+STATUS_TRUNCATED = "truncated"
+
+
+def _init_worker():
+    # verification is background work: yield the CPU to the viewer
+    if hasattr(os, "nice"):
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+
+
+def _has_end_marker(path, fmt):
+    marker = END_MARKERS.get(fmt)
+    if marker is None:
+        return True
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - TAIL, 0))
+        return marker in f.read()
+
+
+def check_image(path):
+    """
+    Check that path is a complete, readable image. Runs in a worker.
+
+    The header is parsed and Image.verify() run (PNG checks every chunk
+    CRC up to IEND). JPEG and GIF files are also checked for their end
+    marker; only when it is missing (truncated, or data appended as in
+    motion photos) is the image fully decoded to decide.
+
+    :returns: (path, mtime, size, status, reason)
+    """
+    st = os.stat(path)
+    status, reason = STATUS_OK, ""
+    try:
+        with open_image(path) as im:
+            fmt = im.format
+            im.verify()
+        if not _has_end_marker(path, fmt):
+            with open_image(path) as im:
+                im.load()
+    except UnidentifiedImageError:
+        status, reason = STATUS_CORRUPT, "not a recognised image"
+    except OSError as e:
+        status = STATUS_TRUNCATED if "truncated" in str(e).lower() else STATUS_CORRUPT
+        reason = str(e)
+    except Exception as e:
+        # decoders raise SyntaxError, ValueError, struct.error, ...
+        status, reason = STATUS_CORRUPT, f"{type(e).__name__}: {e}"
+    return path, st.st_mtime, st.st_size, status, reason
+
+
+class IntegrityVerifier:
+    """
+    Low priority background check of files ahead of the cursor.
+
+    queue() replaces the work list (the viewer passes the next files in
+    display order). Results are stored in the metadata cache, keyed like
+    its records by mtime and size, so a file is checked once until it
+    changes. Bad files are collected in `bad` and reported through
+    on_bad(path, status, reason), called from the verifier thread.
+    """
+
+    def __init__(self, cache, workers=1, on_bad=None):
+        self.cache = cache
+        self.workers = workers
+        self.on_bad = on_bad
+        # path -> (status, reason) of every bad file found this session
+        self.bad = {}
+        self._checked = set()
+        self._queue = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._pool = None
+        self._thread = threading.Thread(
+            target=self._run, name="auraview-verify", daemon=True
+        )
+        self._thread.start()
+
+    def queue(self, paths):
+        """
+        Check paths next, in order, dropping what was queued before.
+
+        :param paths: Iterable of absolute paths
+        """
+        with self._cond:
+            self._queue = [p for p in paths if p not in self._checked]
+            self._queue.reverse()
+            self._cond.notify()
+
+    def mark(self, path, status, reason=""):
+        """
+        Record a result found elsewhere (e.g. a failed display decode).
+        """
+        with self._cond:
+            self._checked.add(path)
+        self._found(path, status, reason)
+
+    def report(self):
+        """
+        Printable list of the bad files found so far.
+        """
+        if not self.bad:
+            return f"no corrupt files found ({len(self._checked)} checked)"
+        lines = [f"{len(self.bad)} bad file(s) of {len(self._checked)} checked:"]
+        for path, (status, reason) in sorted(self.bad.items()):
+            lines.append(f"  {status:9} {path}  ({reason})")
+        return "\n".join(lines)
+
+    def close(self):
+        """
+        Stop after the current round.
+        """
+        with self._cond:
+            self._closed = True
+            self._queue = []
+            self._cond.notify()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def _found(self, path, status, reason):
+        if status == STATUS_OK:
+            return
+        self.bad[path] = (status, reason)
+        if self.on_bad is not None:
+            self.on_bad(path, status, reason)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                batch = [self._queue.pop() for _ in range(min(BATCH, len(self._queue)))]
+                self._checked.update(batch)
+            try:
+                self._check(batch)
+            except RuntimeError:
+                # pool shut down by close()
+                return
+
+    def _check(self, batch):
+        cached = self.cache.get_integrity(batch)
+        todo = []
+        for path in batch:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rec = cached.get(path)
+            if rec and rec["mtime"] == st.st_mtime and rec["size"] == st.st_size:
+                self._found(path, rec["status"], rec["reason"])
+            else:
+                todo.append(path)
+        if not todo or self._closed:
+            return
+
+        if self._pool is None:
+            # spawn: forking a process that runs Tk and threads is not safe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        fresh = []
+        futures = [self._pool.submit(check_image, path) for path in todo]
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except OSError:
+                # vanished or unreadable: nothing to record
+                continue
+            fresh.append(result)
+            self._found(result[0], result[3], result[4])
+        self.cache.put_integrity(fresh)
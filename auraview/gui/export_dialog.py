@@ -0,0 +1,129 @@
+"""
+auraview/gui/export_dialog.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import threading
+import tkinter as tk
+from tkinter import filedialog
+
+from auraview.application.config import settings
+from auraview.core.exporter import ExportPipeline, EXPORT_FORMATS
+
+
+class ExportDialog:
+    """
+    Export the images of the current view (all files, or the filter's
+    matches) to another format and size.
+
+    The pipeline runs on a background thread; progress comes back through
+    the Tk dispatcher, so the viewer stays usable meanwhile.
+    """
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.paths = list(gui.controller.files)
+        self.pipeline = None
+
+        self.top = tk.Toplevel(gui.root)
+        self.top.title("AuraView - Export")
+        self.top.resizable(False, False)
+
+        self.out_dir = tk.StringVar(self.top)
+        self.fmt = tk.StringVar(self.top, "jpeg")
+        self.max_size = tk.StringVar(self.top, "2048")
+        self.quality = tk.StringVar(self.top, "85")
+
+        tk.Label(self.top, text=f"{len(self.paths)} image(s) in the current view").grid(
+            row=0, column=0, columnspan=3, pady=4
+        )
+
+        tk.Label(self.top, text="Folder").grid(row=1, column=0, sticky="w")
+        tk.Entry(self.top, textvariable=self.out_dir, width=40).grid(row=1, column=1)
+        tk.Button(self.top, text="Browse", command=self._browse).grid(row=1, column=2)
+
+        tk.Label(self.top, text="Format").grid(row=2, column=0, sticky="w")
+        tk.OptionMenu(
+            self.top, self.fmt, *sorted(f.lower() for f in EXPORT_FORMATS)
+        ).grid(row=2, column=1, sticky="w")
+
+        tk.Label(self.top, text="Max size (px, empty = keep)").grid(row=3, column=0, sticky="w")
+        tk.Entry(self.top, textvariable=self.max_size, width=10).grid(row=3, column=1, sticky="w")
+
+        tk.Label(self.top, text="Quality").grid(row=4, column=0, sticky="w")
+        tk.Entry(self.top, textvariable=self.quality, width=10).grid(row=4, column=1, sticky="w")
+
+        self.label_progress = tk.Label(self.top, text="", justify="left", anchor="w")
+        self.label_progress.grid(row=5, column=0, columnspan=3, sticky="ew")
+
+        self.button_start = tk.Button(self.top, text="Start", width=12, command=self.start)
+        self.button_start.grid(row=6, column=1, sticky="e", pady=4)
+        tk.Button(self.top, text="Close", width=12, command=self.close).grid(row=6, column=2)
+
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+    def _browse(self):
+        folder = filedialog.askdirectory(parent=self.top)
+        if folder:
+            self.out_dir.set(folder)
+
+    def start(self):
+        """
+        Validate the options and start exporting in the background.
+        """
+        out_dir = self.out_dir.get().strip()
+        if not out_dir or not self.paths:
+            self.label_progress.config(text="Choose an output folder")
+            return
+        try:
+            max_size = int(self.max_size.get()) if self.max_size.get().strip() else None
+            quality = int(self.quality.get())
+        except ValueError:
+            self.label_progress.config(text="Max size and quality must be numbers")
+            return
+        if not 1 <= quality <= 100:
+            self.label_progress.config(text="Quality must be between 1 and 100")
+            return
+
+        self.pipeline = ExportPipeline(
+            self.paths, out_dir, fmt=self.fmt.get(), max_size=max_size,
+            quality=quality, workers=settings.export_workers or None
+        )
+        self.button_start.config(state=tk.DISABLED)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        pipeline = self.pipeline
+        try:
+            stats = pipeline.run(
+                on_progress=lambda s, r, e: self.gui.dispatcher.post(
+                    self._on_progress, s.done, len(s.failed)
+                )
+            )
+        except OSError as e:
+            self.gui.dispatcher.post(self._on_finished, f"Export failed: {e}")
+            return
+        self.gui.dispatcher.post(self._on_finished, stats.report())
+
+    def _on_progress(self, done, failed):
+        if self.top.winfo_exists():
+            self.label_progress.config(
+                text=f"{done + failed}/{len(self.paths)} ({failed} failed)"
+            )
+
+    def _on_finished(self, report):
+        print(report)
+        if self.top.winfo_exists():
+            self.label_progress.config(text=report)
+            self.button_start.config(state=tk.NORMAL)
+
+    def close(self):
+        """
+        Close the window; a running export stops after the current files.
+        """
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        if self.top.winfo_exists():
+            self.top.destroy()
+        self.gui.export_dialog = None
@@ -0,0 +1,222 @@
+"""
+auraview/gui/grid_view.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import tkinter as tk
+
+from PIL import ImageTk
+
+from auraview.core.lru_cache import LRUCache
+from auraview.core.memory_governor import governor, PRIORITY_GRID
+
+PAD = 8
+LABEL_H = 16
+# rows kept alive above/below the viewport
+OVERSCAN = 1
+
+
+class ThumbnailGrid:
+    """
+    Contact-sheet view over controller.files.
+
+    The canvas is virtual: only the cells that intersect the viewport (plus
+    one row of overscan) have canvas items, so the cost of scrolling does
+    not depend on the number of images. Thumbnails come from a
+    ThumbnailService and are delivered back through the Tk dispatcher.
+    """
+
+    def __init__(self, gui, service):
+        self.gui = gui
+        self.service = service
+        self.size = service.size
+        self.cell_w = self.size + PAD
+        self.cell_h = self.size + PAD + LABEL_H
+        self.columns = 1
+        self.cells = {}
+        # released on the Tk thread only; the cells on screen are pinned
+        self.photos = LRUCache(
+            400, governor, name="grid", priority=PRIORITY_GRID,
+            dispatcher=gui.dispatcher
+        )
+
+        self.top = tk.Toplevel(gui.root)
+        self.top.title("AuraView - Grid")
+        self.top.geometry(f"{gui.width}x{gui.height}")
+
+        self.canvas = tk.Canvas(
+            self.top, background="#202020", highlightthickness=0,
+            yscrollincrement=self.cell_h // 2
+        )
+        scrollbar = tk.Scrollbar(self.top, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.top.bind("<MouseWheel>", self._on_wheel)
+        self.top.bind("<Button-4>", lambda e: self._scroll(-1))
+        self.top.bind("<Button-5>", lambda e: self._scroll(1))
+        self.top.bind("<Prior>", lambda e: self._scroll(-1, "pages"))
+        self.top.bind("<Next>", lambda e: self._scroll(1, "pages"))
+        self.top.bind("<Escape>", lambda e: self.close())
+        self.top.bind("<g>", lambda e: self.close())
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.top.update_idletasks()
+        self.refresh()
+        self.show_index(gui.controller.img_no)
+
+    # -------------------------------------------------
+    # Layout
+    # -------------------------------------------------
+    def _layout(self):
+        width = max(self.canvas.winfo_width(), self.cell_w)
+        self.columns = max(width // self.cell_w, 1)
+        rows = -(-len(self.gui.controller.files) // self.columns)
+        self.canvas.configure(scrollregion=(0, 0, width, rows * self.cell_h))
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(int(top // self.cell_h) - OVERSCAN, 0)
+        last_row = int(bottom // self.cell_h) + OVERSCAN
+        total = len(self.gui.controller.files)
+        return first_row * self.columns, min((last_row + 1) * self.columns, total)
+
+    def refresh(self):
+        """
+        Re-layout and (re)create canvas items for the visible cells only.
+        """
+        if not self.top.winfo_exists():
+            return
+        columns = self.columns
+        self._layout()
+        if columns != self.columns:
+            self._clear_cells()
+
+        start, end = self._visible_range()
+        files = self.gui.controller.files
+        wanted = set(range(start, end))
+
+        for index in [i for i in self.cells if i not in wanted]:
+            for item in self.cells.pop(index)[1:]:
+                self.canvas.delete(item)
+
+        visible_paths = set()
+        for index in range(start, end):
+            path = files[index]
+            visible_paths.add(path)
+            cell = self.cells.get(index)
+            if cell is not None and cell[0] == path:
+                continue
+            if cell is not None:
+                for item in cell[1:]:
+                    self.canvas.delete(item)
+            self.cells[index] = self._create_cell(index, path)
+
+        self.photos.pin(visible_paths)
+        self.service.retain(visible_paths)
+        self._highlight()
+
+    def _create_cell(self, index, path):
+        row, col = divmod(index, self.columns)
+        x = col * self.cell_w + self.cell_w // 2
+        y = row * self.cell_h + PAD // 2
+        photo = self.photos.get(path)
+        image_item = self.canvas.create_image(
+            x, y + self.size // 2, image=photo, anchor="center"
+        )
+        name = os.path.basename(path)
+        if len(name) > 22:
+            name = name[:10] + "…" + name[-10:]
+        text_item = self.canvas.create_text(
+            x, y + self.size + LABEL_H // 2, text=name, fill="#d0d0d0",
+            font=("TkDefaultFont", 8)
+        )
+        if photo is None:
+            self.service.request(
+                path,
+                lambda p, thumb: self.gui.dispatcher.post(self._on_thumb, p, thumb)
+            )
+        return (path, image_item, text_item)
+
+    def _clear_cells(self):
+        for cell in self.cells.values():
+            for item in cell[1:]:
+                self.canvas.delete(item)
+        self.cells.clear()
+
+    def _on_thumb(self, path, thumb):
+        if thumb is None or not self.top.winfo_exists():
+            return
+        photo = self.photos.get(path)
+        for cell in self.cells.values():
+            if cell[0] == path:
+                if photo is None:
+                    photo = ImageTk.PhotoImage(thumb)
+                    self.photos.put(path, photo)
+                self.canvas.itemconfigure(cell[1], image=photo)
+
+    def _highlight(self):
+        self.canvas.delete("selected")
+        index = self.gui.controller.img_no
+        if index not in self.cells:
+            return
+        row, col = divmod(index, self.columns)
+        x0, y0 = col * self.cell_w + 1, row * self.cell_h + 1
+        self.canvas.create_rectangle(
+            x0, y0, x0 + self.cell_w - 2, y0 + self.cell_h - 2,
+            outline="#4a90d9", width=2, tags="selected"
+        )
+
+    # -------------------------------------------------
+    # Scrolling / selection
+    # -------------------------------------------------
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def _scroll(self, amount, what="units"):
+        self.canvas.yview_scroll(amount, what)
+        self.refresh()
+
+    def _on_wheel(self, event):
+        self._scroll(-1 if event.delta > 0 else 1)
+
+    def show_index(self, index):
+        """
+        Scroll so that the cell of index is visible.
+
+        :param index: Position in controller.files
+        """
+        total_rows = max(-(-len(self.gui.controller.files) // self.columns), 1)
+        row = index // self.columns
+        self.canvas.yview_moveto(max(row - 1, 0) / total_rows)
+        self.refresh()
+
+    def _on_click(self, event):
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        col = int(x // self.cell_w)
+        if col >= self.columns:
+            return
+        index = int(y // self.cell_h) * self.columns + col
+        if index >= len(self.gui.controller.files):
+            return
+        self.gui.controller.go_to(index)
+        self.gui.update_screen()
+        self.close()
+
+    def close(self):
+        """
+        Drop the window; thumbnails stay in the service's caches.
+        """
+        self.service.retain(set())
+        self.photos.clear()
+        if self.top.winfo_exists():
+            self.top.destroy()
+        self.gui.grid = None
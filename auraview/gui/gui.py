@@ -4,15 +4,43 @@ auraview/gui/gui.py
 Author: Benevant Mathew
 Date: 2025-12-16
 """
+import os
+import time
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog
 from tkcalendar import Calendar
 
-from PIL import ImageTk
 from pillow_heif import register_heif_opener
 
 from auraview.version import __version__
-from auraview.core.image_controller import ImageController
+from auraview.core.image_controller import ImageController, SORT_ORDERS
+from auraview.core.file_loader import StreamingLoader
+from auraview.gui.tk_dispatch import TkDispatcher
+from auraview.gui.grid_view import ThumbnailGrid
+from auraview.gui.zoom_view import ZoomView
+from auraview.gui.photo_pool import PhotoPool
+from auraview.gui.export_dialog import ExportDialog
+from auraview.core.thumbnails import ThumbnailService
+from auraview.core.slideshow import SlideshowScheduler
+from auraview.core.memory_governor import governor
+from auraview.core.session import save_session, load_frames, NEIGHBOURS
+from auraview.application.config import settings
+
+DEFAULT_SLIDESHOW_INTERVAL = 3.0
+# how often a late animation frame is checked for, in seconds
+ANIMATION_POLL = 0.01
+# shown in the metadata panel until the worker delivers the real values
+PLACEHOLDER = "…"
+# key events closer together than this (s) count as holding the key
+SCRUB_GAP = 0.15
+# full render once navigation has been quiet this long (ms)
+SETTLE_MS = 120
+# search once typing has paused this long (ms)
+SEARCH_DELAY_MS = 150
+# search again this often (ms) while the index is still being built
+SEARCH_REFRESH_MS = 500
 
 # Register HEIF opener
 register_heif_opener()
@@ -24,21 +52,50 @@ class PhotoViewerGUI:
     def __init__(
             self,
             files=None,
-            loc='.'
+            loc='.',
+            sort_order=None,
+            sort_reverse=False,
+            stream=None,
+            slideshow=None,
+            session=None
         ):
         self.files = files
 
-        self.controller = ImageController(self.files, loc)
+        # a streamed path list starts empty and is filled in the background
+        if stream is not None:
+            self.files = []
+        # a resumed session opens on the saved neighbourhood of its image;
+        # the full list is scanned in the background
+        if session is not None:
+            self.files = session.get("window") or [session.get("current")]
+            loc = session["loc"]
+        deferred = stream is not None or session is not None
+
+        self.controller = ImageController(
+            self.files, loc,
+            sort_order=None if deferred else sort_order,
+            sort_reverse=sort_reverse
+        )
+        # lists streamed from a log file are not worth resuming
+        self.session_enabled = settings.restore_session and stream is None
 
         self.img_obj = None
 
         # TEMP SIZE so window appears
         self.width = 500
         self.height = 500
+        if session is not None:
+            self.width, self.height = session.get("size") or (500, 500)
+            self.controller.restore_session(
+                session, load_frames(session), self.width, self.height
+            )
         self.display_height = self.height
 
         self.root = tk.Tk()
+        if session is not None and session.get("geometry"):
+            self.root.geometry(session["geometry"])
         self.selected_option = tk.StringVar(self.root)
+        self.selected_option.set(self.controller.sort_order)
         self.date_var = tk.StringVar()
 
         self.root.update_idletasks()  # important under Wayland
@@ -46,12 +103,79 @@ class PhotoViewerGUI:
         self.root.title(f"AuraView-{__version__}")
         self.root.resizable(True, True)
 
+        self.dispatcher = TkDispatcher(self.root)
+        self.photos = PhotoPool(dispatcher=self.dispatcher)
+        if self.controller.verifier is not None:
+            self.controller.verifier.on_bad = (
+                lambda path, status, reason: self.dispatcher.post(self._on_corrupt, path)
+            )
+        self.loader = None
+        self.grid = None
+        self.thumbnails = None
+        self.zoom_view = None
+        self.export_dialog = None
+        self.slideshow = None
+        self.slideshow_interval = slideshow or DEFAULT_SLIDESHOW_INTERVAL
+        self._slideshow_job = None
+        self._animation_job = None
+        self._animation_due = None
+
+        # metadata is read by one worker; only the latest request counts
+        self.info_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="auraview-info"
+        )
+        self._info_future = None
+        self._info_seq = 0
+
+        # navigation: the index moves per key event, rendering is coalesced
+        self._render_job = None
+        self._settle_job = None
+        self._last_nav = 0.0
+        self._scrubbing = False
+        self._search_job = None
+        self._search_text = ""
+
         self._create_widgets()
         self._bind_keys()
 
         self.update_screen()
 
         self.root.bind("<Configure>", self._on_resize)
+        self.root.protocol("WM_DELETE_WINDOW", self.close_window)
+
+        if session is not None:
+            self._rescan(session, sort_order, sort_reverse)
+
+        if stream is not None:
+            self.loader = StreamingLoader(
+                stream, self.controller.image_ext, workers=settings.stat_workers
+            )
+            self.loader.start(
+                on_batch=lambda batch: self.dispatcher.post(self._on_batch, batch),
+                on_done=lambda: self.dispatcher.post(
+                    self._on_load_done, sort_order, sort_reverse
+                )
+            )
+
+        if slideshow:
+            self.toggle_slideshow()
+
+    def close_window(self):
+        """
+        Save the session snapshot and close the window.
+        """
+        if self.session_enabled and self.controller.files:
+            state = self.controller.session_state(NEIGHBOURS)
+            state["size"] = [self.width, self.display_height]
+            state["geometry"] = self.root.geometry()
+            frames = self.controller.session_frames(
+                self.width, self.display_height, NEIGHBOURS
+            )
+            try:
+                save_session(state, frames)
+            except OSError as e:
+                print(f"Could not save the session: {e}")
+        self.root.destroy()
 
     def run(self):
         """
@@ -60,6 +184,96 @@ class PhotoViewerGUI:
         :param self: Description
         """
         self.root.mainloop()
+        if self.slideshow:
+            print(self.slideshow.summary())
+        self.controller.close()
+        if self._info_future is not None:
+            self._info_future.cancel()
+        self.info_pool.shutdown(wait=False)
+        if self.loader:
+            self.loader.stop()
+        if self.thumbnails:
+            self.thumbnails.close()
+
+    # -------------------------------------------------
+    # Progressive Loading
+    # -------------------------------------------------
+    def _on_batch(self, batch):
+        """
+        Add a batch of streamed paths; draw as soon as the first arrives.
+        """
+        first = not self.controller.files
+        self.controller.add_files(batch)
+        if first:
+            self.update_screen()
+        else:
+            self._update_counter()
+
+    def _rescan(self, state, sort_order, sort_reverse):
+        """
+        Rebuild a resumed session's full list in the background.
+        """
+        if sort_order or sort_reverse:
+            sort_order = sort_order or state.get("sort_order") or "name"
+            state = dict(state, sort_order=sort_order, sort_reverse=sort_reverse)
+
+        def work():
+            try:
+                paths = self.controller.scan(state)
+            except OSError as e:
+                print(f"Cannot scan {state['loc']}: {e}")
+                return
+            self.dispatcher.post(self._on_rescan, paths, state)
+
+        threading.Thread(target=work, name="auraview-rescan", daemon=True).start()
+
+    def _on_rescan(self, paths, state):
+        """
+        Swap the rescanned list in, staying on the image being shown.
+        """
+        current = self.controller.get_current_path()
+        query = self.controller.filter_query
+        self.controller.replace_files(
+            paths, current, state.get("sort_order"), bool(state.get("sort_reverse"))
+        )
+        self.selected_option.set(self.controller.sort_order)
+        # a filter or search made meanwhile applies to the full list
+        if query:
+            self.controller.apply_filter(query)
+        if self.entry_search.get():
+            self.run_search()
+            return
+        if not self.controller.files:
+            print("No valid image paths found")
+            return
+        if self.controller.get_current_path() != current:
+            self.update_screen()
+        else:
+            self._update_counter()
+            self.controller.verify_ahead()
+
+    def _on_corrupt(self, path):
+        """
+        Drop a file the verifier found broken before it is reached.
+        """
+        if self.controller.exclude(path):
+            print(f"Excluded corrupt image: {path}")
+            self._update_counter()
+
+    def _on_load_done(self, sort_order, sort_reverse):
+        """
+        Apply the requested sort once the whole list is known.
+        """
+        if not self.controller.files:
+            print("No valid image paths found")
+            return
+        if sort_order or sort_reverse:
+            sort_order = sort_order or "name"
+            self.controller.sort_files(sort_order, sort_reverse)
+            self.selected_option.set(sort_order)
+            self.update_screen()
+        else:
+            self._update_counter()
     # -------------------------------------------------
     # Window Resize Handling
     # -------------------------------------------------
@@ -79,6 +293,8 @@ class PhotoViewerGUI:
         self.width = event.width
         self.height = event.height
         self.display_height = self.height
+        if self.slideshow:
+            self.slideshow.resize(self.width, self.display_height)
 
         # to rescale image dynamically:
         self.update_screen()
@@ -93,16 +309,133 @@ class PhotoViewerGUI:
         :param self: Description
         """
 
+        if self._settle_job is not None:
+            self.root.after_cancel(self._settle_job)
+            self._settle_job = None
+
         img = self.controller.get_resized_image(self.width, self.display_height)
         if not img:
             return
 
-        self.img_obj = ImageTk.PhotoImage(img)
-        self.label_img.config(image=self.img_obj)
-        self.label_img.image = self.img_obj # prevent Garbage collection
+        self._show_image(img)
+        self._update_metadata()
+        self._update_counter()
+        self._start_animation()
+        self.controller.verify_ahead()
 
-        metadata = self.controller.get_metadata()
+    def _show_image(self, img):
+        """
+        Put a display-ready image into the image label.
+        """
+        photo = self.photos.photo_for(img)
+        if photo is not self.img_obj:
+            # same size as before: the pixels were pasted in place
+            self.img_obj = photo
+            self.label_img.config(image=self.img_obj)
+            self.label_img.image = self.img_obj # prevent Garbage collection
 
+    # -------------------------------------------------
+    # Animated / multi-page images
+    # -------------------------------------------------
+    def _start_animation(self):
+        """
+        Play the current image if it has several frames.
+        """
+        self._cancel_animation()
+        if self.slideshow is not None:
+            return
+        anim = self.controller.get_animation(self.width, self.display_height)
+        if anim is None:
+            return
+        # frame 0 is on screen already (from get_resized_image)
+        self._animation_due = None
+        self._animation_tick(anim)
+
+    def _cancel_animation(self):
+        if self._animation_job is not None:
+            self.root.after_cancel(self._animation_job)
+            self._animation_job = None
+
+    def _animation_tick(self, anim):
+        """
+        Show the next frame once the current one has been up for its
+        duration; hold the current frame while the next is still decoding.
+        """
+        self._animation_job = None
+        if anim is not self.controller.animation:
+            return
+        now = time.monotonic()
+        if self._animation_due is None:
+            # duration of frame 0 is known once the decoder produced it
+            frame = anim.current()
+            if frame is not None:
+                self._animation_due = now + frame[1] / 1000
+        elif now >= self._animation_due:
+            frame = anim.advance()
+            if frame is not None:
+                self._show_image(frame[0])
+                self._animation_due += frame[1] / 1000
+                if self._animation_due < now:
+                    # fell behind (slow decode): do not race to catch up
+                    self._animation_due = now + frame[1] / 1000
+        delay = ANIMATION_POLL
+        if self._animation_due is not None and self._animation_due > now:
+            delay = self._animation_due - now
+        self._animation_job = self.root.after(
+            max(int(delay * 1000), 1), self._animation_tick, anim
+        )
+
+    def _update_metadata(self):
+        """
+        Fill the metadata panel for the current image in the background.
+
+        Placeholders are shown at once; the worker's result is applied only
+        if the user is still on the same image, otherwise it is dropped.
+        """
+        path = self.controller.get_current_path()
+        if not path:
+            return
+        self._info_seq += 1
+        seq = self._info_seq
+
+        # an older request that has not started yet is not worth reading
+        if self._info_future is not None:
+            self._info_future.cancel()
+
+        placeholders = dict.fromkeys(
+            ("size", "dimensions", "dpi_text", "ext", "image_datetimeoriginal",
+             "image_datetimedigitized", "image_datetime",
+             "image_filecreationtime", "image_dir"),
+            PLACEHOLDER
+        )
+        placeholders["name"] = os.path.basename(path)
+        placeholders["move_copy_dir"] = self.controller.folder_path
+        self._fill_metadata(placeholders)
+
+        self._info_future = self.info_pool.submit(self.controller.read_metadata, path)
+        self._info_future.add_done_callback(
+            lambda f: self.dispatcher.post(self._on_metadata, seq, path, f)
+        )
+
+    def _on_metadata(self, seq, path, future):
+        """
+        Apply a worker's metadata if it is still for the displayed image.
+        """
+        if seq != self._info_seq or path != self.controller.get_current_path():
+            return
+        if future.cancelled():
+            return
+        try:
+            metadata = future.result()
+        except (OSError, ValueError) as e:
+            print(f"Cannot read metadata of {path}: {e}")
+            return
+        self._fill_metadata(metadata)
+
+    def _fill_metadata(self, metadata):
+        """
+        Write metadata values into the panel labels.
+        """
         if metadata:
             self.label_name.config(text=metadata.get("name",""))
             self.label_size.config(text=f'Size: {metadata.get("size","")} Mb')
@@ -134,10 +467,21 @@ class PhotoViewerGUI:
                 text=metadata.get("image_dir","")
             )
 
+    def _update_counter(self):
+        """
+        Refresh the image counter and the Back/Forward button state.
+        """
         total = len(self.controller.files)
         current = self.controller.img_no
 
-        self.label_counter.config(text=f"{current+1}/{total}")
+        counter = f"{current+1}/{total}"
+        if self.loader and not self.loader.done:
+            counter += " (loading)"
+        if self.controller.filter_query:
+            counter += " (filtered)"
+        if self.controller.search_query:
+            counter += " (search)"
+        self.label_counter.config(text=counter)
 
         # Button state control
         if current == 0:
@@ -165,6 +509,48 @@ class PhotoViewerGUI:
         else:
             self.controller.previous()
 
+        now = time.monotonic()
+        self._scrubbing = now - self._last_nav < SCRUB_GAP
+        self._last_nav = now
+
+        # auto-repeat events queued behind a slow render all land here
+        # first; only the image they end on is rendered
+        if self._render_job is None:
+            self._render_job = self.root.after_idle(self._render_latest)
+
+    def _render_latest(self):
+        """
+        Render the image navigation ended on. While a key is held, show
+        only what is cheap (a cached frame or the embedded thumbnail) and
+        leave the full render until the key is released.
+        """
+        self._render_job = None
+        if not self._scrubbing:
+            self.update_screen()
+            return
+
+        self._cancel_animation()
+        preview = self.controller.get_preview(self.width, self.display_height)
+        if preview is not None:
+            self._show_image(preview)
+        path = self.controller.get_current_path()
+        if path:
+            self.label_name.config(text=os.path.basename(path))
+        self._update_counter()
+
+        if self._settle_job is None:
+            self._settle_job = self.root.after(SETTLE_MS, self._settle)
+
+    def _settle(self):
+        """
+        Full render once the key has been released.
+        """
+        self._settle_job = None
+        idle = time.monotonic() - self._last_nav
+        if idle < SCRUB_GAP:
+            self._settle_job = self.root.after(SETTLE_MS, self._settle)
+            return
+        self._scrubbing = False
         self.update_screen()
 
     def rotate_image(self, direction):
@@ -371,7 +757,7 @@ class PhotoViewerGUI:
         self.button_exit = tk.Button(
             self.main_frame,
             text="Exit",
-            command=self.root.destroy,
+            command=self.close_window,
             width=20
         )
         self.button_exit.grid(row=6, column=5)
@@ -437,14 +823,49 @@ class PhotoViewerGUI:
         )
         button_update_ext.grid(row=8, column=4)
 
+        button_export=tk.Button(
+            self.main_frame,
+            text="Export",
+            command=self.open_export,
+            width=20
+        )
+        button_export.grid(row=8, column=3)
+
+        button_grid=tk.Button(
+            self.main_frame,
+            text="Grid",
+            command=self.toggle_grid,
+            width=20
+        )
+        button_grid.grid(row=8, column=5)
+
+        button_zoom=tk.Button(
+            self.main_frame,
+            text="Zoom",
+            command=self.toggle_zoom,
+            width=20
+        )
+        button_zoom.grid(row=9, column=5)
+
+        button_slideshow=tk.Button(
+            self.main_frame,
+            text="Slideshow",
+            command=self.toggle_slideshow,
+            width=20
+        )
+        button_slideshow.grid(row=10, column=5)
+
         ## row 9
-        # dropdown = tk.OptionMenu(
-        #     self.main_frame,
-        #     self.selected_option,
-        #     *options,
-        #     command=go_button_fun
-        # )
-        # dropdown.grid(row=9,column=1)
+        label_sort=tk.Label(self.main_frame,text='Sort By')
+        label_sort.grid(row=9, column=0)
+
+        dropdown = tk.OptionMenu(
+            self.main_frame,
+            self.selected_option,
+            *SORT_ORDERS,
+            command=self.sort_files
+        )
+        dropdown.grid(row=9,column=1)
 
         label8=tk.Label(self.main_frame,text='Photo Number')
         label8.grid(row=9, column=2)
@@ -459,6 +880,39 @@ class PhotoViewerGUI:
             width=10
         )
         self.button_go.grid(row=9, column=4)
+
+        ## row 10
+        label_filter=tk.Label(self.main_frame,text='Filter')
+        label_filter.grid(row=10, column=0)
+
+        self.entry_filter = tk.Entry(self.main_frame, width=50)
+        self.entry_filter.grid(row=10, column=1, columnspan=2, sticky="ew")
+
+        self.button_filter = tk.Button(
+            self.main_frame,
+            text="Apply Filter",
+            command=self.apply_filter,
+            width=20
+        )
+        self.button_filter.grid(row=10, column=3)
+
+        self.button_clear_filter = tk.Button(
+            self.main_frame,
+            text="Clear Filter",
+            command=self.clear_filter,
+            width=20
+        )
+        self.button_clear_filter.grid(row=10, column=4)
+
+        ## row 11
+        label_search=tk.Label(self.main_frame,text='Search')
+        label_search.grid(row=11, column=0)
+
+        self.entry_search = tk.Entry(self.main_frame, width=50)
+        self.entry_search.grid(row=11, column=1, columnspan=2, sticky="ew")
+
+        self.label_search = tk.Label(self.main_frame, text="")
+        self.label_search.grid(row=11, column=3, columnspan=2, sticky="w")
         ##
 
     def go_to_index(self):
@@ -489,6 +943,189 @@ class PhotoViewerGUI:
         self.controller.go_to(internal_index)
         self.update_screen()
 
+    def sort_files(self, order):
+        """
+        Re-sort the file list by the chosen order, staying on the same image.
+
+        :param order: One of SORT_ORDERS
+        """
+        self.controller.sort_files(order)
+        self.update_screen()
+
+    def toggle_grid(self):
+        """
+        Open (or close) the thumbnail grid over the current file list.
+        """
+        if self.grid is not None:
+            self.grid.close()
+            return
+        if not self.controller.files:
+            return
+        if self.thumbnails is None:
+            processes = self.controller.processes
+            self.thumbnails = ThumbnailService(
+                workers=max(settings.thumbnail_workers, settings.decode_processes),
+                max_bytes=settings.thumbnail_cache_mb * 2**20,
+                maker=processes.make_thumbnail if processes else None
+            )
+        self.grid = ThumbnailGrid(self, self.thumbnails)
+
+    def toggle_zoom(self):
+        """
+        Open (or close) the tiled zoom/pan view of the current image.
+        """
+        if self.zoom_view is not None:
+            self.zoom_view.close()
+            return
+        path = self.controller.get_current_path()
+        if not path:
+            return
+        self.zoom_view = ZoomView(self, path)
+
+    def open_export(self):
+        """
+        Open the export dialog for the images in the current view.
+        """
+        if self.export_dialog is not None:
+            self.export_dialog.top.lift()
+            return
+        if not self.controller.files:
+            return
+        self.export_dialog = ExportDialog(self)
+
+    def toggle_slideshow(self):
+        """
+        Start (or stop) the slideshow over the current file list.
+        """
+        if self.slideshow is not None:
+            self._stop_slideshow()
+            return
+        if not self.controller.files and not self.loader:
+            return
+        self.slideshow = SlideshowScheduler(
+            self.controller, self.slideshow_interval,
+            self.width, self.display_height
+        )
+        self.slideshow.start(time.monotonic())
+        # animations pause while the slideshow runs
+        self._start_animation()
+        self._schedule_slideshow()
+
+    def _schedule_slideshow(self):
+        delay = self.slideshow.next_delay(time.monotonic())
+        if delay is None:
+            self._stop_slideshow()
+            return
+        self._slideshow_job = self.root.after(
+            max(int(delay * 1000), 1), self._slideshow_tick
+        )
+
+    def _slideshow_tick(self):
+        """
+        Show the next frame once its deadline has come.
+        """
+        self._slideshow_job = None
+        if self.slideshow is None:
+            return
+        shown = self.slideshow.tick(time.monotonic())
+        if shown is not None:
+            index, img = shown
+            self.controller.go_to(index)
+            self._show_image(img)
+            self._update_metadata()
+            self._update_counter()
+        self._schedule_slideshow()
+
+    def _stop_slideshow(self):
+        if self._slideshow_job is not None:
+            self.root.after_cancel(self._slideshow_job)
+            self._slideshow_job = None
+        self.slideshow.stop()
+        print(self.slideshow.summary())
+        self.slideshow = None
+        self._start_animation()
+
+    def apply_filter(self):
+        """
+        Narrow the view to images matching the metadata query in the
+        filter box, e.g. "date >= 2024-01-01 and size > 5MB".
+        """
+        query = self.entry_filter.get().strip()
+        if not query:
+            self.clear_filter()
+            return
+        try:
+            count = self.controller.apply_filter(query)
+        except ValueError as e:
+            print(f"Invalid filter: {e}")
+            return
+        if count == 0:
+            print(f"No images match: {query}")
+            return
+        # the filter replaced any search view
+        self.entry_search.delete(0, tk.END)
+        self.label_search.config(text="")
+        self._search_text = ""
+        self.update_screen()
+
+    def clear_filter(self):
+        """
+        Show the full file list again.
+        """
+        if self.controller.search_query:
+            self.entry_search.delete(0, tk.END)
+            self.label_search.config(text="")
+            self._search_text = ""
+        self.controller.clear_filter()
+        self.update_screen()
+
+    # -------------------------------------------------
+    # Search
+    # -------------------------------------------------
+    def _on_search_key(self):
+        """
+        Search once typing pauses, instead of on every key stroke.
+        """
+        if self.entry_search.get().strip() != self._search_text:
+            self._schedule_search()
+
+    def _schedule_search(self, delay=SEARCH_DELAY_MS):
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(delay, self.run_search)
+
+    def run_search(self):
+        """
+        Show the images whose path contains the search box text.
+        """
+        self._search_job = None
+        text = self.entry_search.get().strip()
+        self._search_text = text
+        if not text:
+            self.label_search.config(text="")
+            if self.controller.search_query:
+                self.clear_filter()
+            return
+        count = self.controller.apply_search(text)
+        status = f"{count} match(es)" if count else "no matches"
+        pending = self.controller.search_index.pending
+        if pending:
+            status += f" (indexing, {pending} left)"
+            self._schedule_search(SEARCH_REFRESH_MS)
+        self.label_search.config(text=status)
+        if count:
+            self.update_screen()
+
+    def clear_search(self):
+        """
+        Empty the search box and leave the search view.
+        """
+        self.entry_search.delete(0, tk.END)
+        self.run_search()
+        self.root.focus_set()
+        # keep the root binding (quit) from seeing this Escape
+        return "break"
+
     def select_date(self):
         """
         Docstring for select_date
@@ -564,6 +1201,12 @@ class PhotoViewerGUI:
         if self.entry_index['state']=='disabled':
             self.delete_f()
 
+    def _typing(self):
+        """
+        True while a text box has keyboard focus, so shortcuts are skipped.
+        """
+        return self.root.focus_get() in (self.entry_filter, self.entry_search)
+
     def _bind_keys(self):
         """
         Docstring for _bind_keys
@@ -571,19 +1214,29 @@ class PhotoViewerGUI:
         :param self: Description
         """
         #root binds
-        self.root.bind('<Right>',lambda e: self.navigate('forward'))
-        self.root.bind('<Left>',lambda e: self.navigate('back'))
-        self.root.bind('<Home>',lambda e: self.home_button())
-        self.root.bind('<End>',lambda e: self.end_button())
-        self.root.bind('<k>',lambda e: self.rotate_image('left'))
-        self.root.bind('<l>',lambda e: self.rotate_image('right'))
-        self.root.bind('<q>',lambda e: self.move_f2())
-        self.root.bind('<m>',lambda e: self.move_f())
-        self.root.bind('<Escape>',lambda e: self.root.destroy())
+        self.root.bind('<Right>',lambda e: self._typing() or self.navigate('forward'))
+        self.root.bind('<Left>',lambda e: self._typing() or self.navigate('back'))
+        self.root.bind('<Home>',lambda e: self._typing() or self.home_button())
+        self.root.bind('<End>',lambda e: self._typing() or self.end_button())
+        self.root.bind('<k>',lambda e: self._typing() or self.rotate_image('left'))
+        self.root.bind('<l>',lambda e: self._typing() or self.rotate_image('right'))
+        self.root.bind('<q>',lambda e: self._typing() or self.move_f2())
+        self.root.bind('<m>',lambda e: self._typing() or self.move_f())
+        self.root.bind('<g>',lambda e: self._typing() or self.toggle_grid())
+        self.root.bind('<z>',lambda e: self._typing() or self.toggle_zoom())
+        self.root.bind('<s>',lambda e: self._typing() or self.toggle_slideshow())
+        self.root.bind('<u>',lambda e: self._typing() or print(governor.report()))
+        self.root.bind('<v>',lambda e: self._typing() or print(self.controller.integrity_report()))
+        self.root.bind('<Escape>',lambda e: self.close_window())
         self.root.bind("<Button-1>", lambda e: self.disable_entry(e))
-        self.root.bind('<Delete>', lambda e: self.delete_key())
+        self.root.bind('<Delete>', lambda e: self._typing() or self.delete_key())
         #entry binds
         self.entry_index.bind("<Button-1>", lambda e: self.enable_entry())
         self.entry_index.bind("<Return>", lambda e: self.return_key2photo_number(e))
+        self.entry_filter.bind("<Return>", lambda e: self.apply_filter())
+        self.entry_search.bind("<KeyRelease>", lambda e: self._on_search_key())
+        self.entry_search.bind("<Return>", lambda e: self.root.focus_set())
+        self.entry_search.bind("<Escape>", lambda e: self.clear_search())
+        self.root.bind('<slash>',lambda e: self._typing() or self.entry_search.focus_set())
         ################## Initially, disable the entry widget
         self.entry_index.config(state="disabled")
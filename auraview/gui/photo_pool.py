@@ -0,0 +1,67 @@
+"""
+auraview/gui/photo_pool.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+from PIL import ImageTk
+
+from auraview.core.lru_cache import LRUCache
+from auraview.core.memory_governor import governor, PRIORITY_DISPLAY
+
+# window sizes kept (a resize back and forth reuses both)
+POOL_SIZES = 4
+
+
+def photo_mode(img):
+    """
+    PhotoImage mode for a PIL image: RGBA when it can be transparent.
+    """
+    if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+        return "RGBA"
+    return "RGB"
+
+
+class PhotoPool:
+    """
+    Tk photo images reused across updates of one label.
+
+    ImageTk.PhotoImage(img) creates a new Tk image every time and the old
+    one is deleted when Python collects it. The pool keeps one PhotoImage
+    per (mode, size) and paste()s new pixels into it, so a new Tk image
+    is only created when the displayed size changes.
+
+    :param dispatcher: TkDispatcher; pooled images are then only released
+        on the Tk thread, even when a worker goes over the memory budget
+    """
+
+    def __init__(self, max_sizes=POOL_SIZES, dispatcher=None):
+        self.photos = LRUCache(
+            max_sizes, governor, name="display", priority=PRIORITY_DISPLAY,
+            dispatcher=dispatcher
+        )
+        self.allocated = 0
+        self.reused = 0
+
+    def photo_for(self, img):
+        """
+        Return a PhotoImage holding the pixels of img.
+
+        :param img: PIL image, already sized for display
+        """
+        key = (photo_mode(img), img.size)
+        photo = self.photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(key[0], img.size)
+            self.photos.put(key, photo)
+            self.allocated += 1
+        else:
+            self.reused += 1
+        photo.paste(img)
+        return photo
+
+    def clear(self):
+        """
+        Drop every pooled PhotoImage.
+        """
+        self.photos.clear()
@@ -0,0 +1,54 @@
+"""
+auraview/gui/tk_dispatch.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import queue
+
+# how often the Tk thread drains results posted by workers (ms)
+POLL_MS = 15
+
+
+class TkDispatcher:
+    """
+    Run callbacks posted from worker threads on the Tk thread.
+
+    Tk is not thread safe, so background workers call post() and the
+    callbacks are executed from a root.after polling loop.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._queue = queue.Queue()
+        self._running = True
+        self.root.after(POLL_MS, self._drain)
+
+    def post(self, fn, *args):
+        """
+        Schedule fn(*args) on the Tk thread. Safe to call from any thread.
+
+        :param fn: Callable
+        :param args: Positional arguments
+        """
+        self._queue.put((fn, args))
+
+    def stop(self):
+        """
+        Stop polling; pending callbacks are dropped.
+        """
+        self._running = False
+
+    def _drain(self):
+        if not self._running:
+            return
+        try:
+            while True:
+                try:
+                    fn, args = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                fn(*args)
+        finally:
+            # keep polling even if a callback raised
+            self.root.after(POLL_MS, self._drain)
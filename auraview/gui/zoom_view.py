@@ -0,0 +1,217 @@
+"""
+auraview/gui/zoom_view.py
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import ImageTk
+
+from auraview.core.tile_pyramid import TilePyramid, TILE, MAX_STEP
+from auraview.core.memory_governor import governor
+from auraview.application.config import settings
+
+# tiles decoded around the viewport ahead of panning
+PREFETCH_RING = 1
+
+
+class ZoomView:
+    """
+    Zoom and pan over one image using a TilePyramid.
+
+    Only tiles intersecting the viewport get canvas items. Panning moves
+    the canvas and adds items for tiles that are already decoded; missing
+    tiles (and a one-tile ring around the viewport) are decoded by a
+    small worker pool and appear as they arrive, so the Tk thread never
+    waits on a decode.
+    """
+
+    def __init__(self, gui, path):
+        self.gui = gui
+        self.pyramid = TilePyramid(path)
+        self.items = {}
+        self.pending = {}
+        self.pool = ThreadPoolExecutor(max_workers=settings.tile_workers)
+        self.last_update_ms = 0.0
+
+        self.top = tk.Toplevel(gui.root)
+        self.top.title(f"AuraView - Zoom - {path}")
+        self.top.geometry(f"{gui.width}x{gui.height}")
+        self.canvas = tk.Canvas(self.top, background="#101010", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.top.update_idletasks()
+
+        self.step = self.pyramid.fit_step(*self._canvas_size())
+        self._set_step(self.step, None)
+
+        self.canvas.bind("<Configure>", lambda e: self.update_tiles())
+        self.canvas.bind("<ButtonPress-1>", self._on_press)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.zoom(1, e))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom(-1, e))
+        self.top.bind("<plus>", lambda e: self.zoom(1))
+        self.top.bind("<equal>", lambda e: self.zoom(1))
+        self.top.bind("<minus>", lambda e: self.zoom(-1))
+        self.top.bind("<Key-1>", lambda e: self._set_step(0, None))
+        self.top.bind("<Key-0>", lambda e: self._set_step(
+            self.pyramid.fit_step(*self._canvas_size()), None
+        ))
+        self.top.bind("<Escape>", lambda e: self.close())
+        self.top.bind("<z>", lambda e: self.close())
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+    # -------------------------------------------------
+    # Zoom
+    # -------------------------------------------------
+    def zoom(self, direction, event=None):
+        """
+        Zoom in (direction > 0) or out by a factor of two around the
+        pointer (or the window centre).
+        """
+        step = max(min(self.step + direction, MAX_STEP), -self.pyramid.max_level)
+        if step != self.step:
+            self._set_step(step, event)
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            # not mapped yet
+            return self.gui.width, self.gui.height
+        return width, height
+
+    def _set_step(self, step, event):
+        width, height = self._canvas_size()
+        if event is not None:
+            px, py = event.x, event.y
+        else:
+            px, py = width / 2, height / 2
+
+        # keep the source pixel under the pointer in place
+        factor = 2.0 ** (step - self.step)
+        cx = (self.canvas.canvasx(px)) * factor - px
+        cy = (self.canvas.canvasy(py)) * factor - py
+
+        self.step = step
+        self._clear()
+        dw, dh = self.pyramid.display_size(step)
+        self.canvas.configure(scrollregion=(
+            min(0, (dw - width) / 2), min(0, (dh - height) / 2),
+            max(dw, (dw + width) / 2), max(dh, (dh + height) / 2)
+        ))
+        if event is None and dw <= width and dh <= height:
+            cx, cy = (dw - width) / 2, (dh - height) / 2
+        self._scroll_to(cx, cy)
+        self.update_tiles()
+
+    def _on_wheel(self, event):
+        self.zoom(1 if event.delta > 0 else -1, event)
+
+    # -------------------------------------------------
+    # Pan
+    # -------------------------------------------------
+    def _on_press(self, event):
+        self.canvas.scan_mark(event.x, event.y)
+
+    def _on_drag(self, event):
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        self.update_tiles()
+
+    def _scroll_to(self, x, y):
+        x0, y0, x1, y1 = (float(v) for v in self.canvas.cget("scrollregion").split())
+        self.canvas.xview_moveto((x - x0) / max(x1 - x0, 1))
+        self.canvas.yview_moveto((y - y0) / max(y1 - y0, 1))
+
+    # -------------------------------------------------
+    # Tiles
+    # -------------------------------------------------
+    def _viewport(self, ring=0):
+        x0 = self.canvas.canvasx(0) - ring * TILE
+        y0 = self.canvas.canvasy(0) - ring * TILE
+        width, height = self._canvas_size()
+        x1 = x0 + width + 2 * ring * TILE
+        y1 = y0 + height + 2 * ring * TILE
+        return (x0, y0, x1, y1)
+
+    def update_tiles(self):
+        """
+        Show cached tiles in view and queue decoding of the missing ones.
+        """
+        start = time.perf_counter()
+        step = self.step
+        visible = self.pyramid.tile_range(step, self._viewport())
+        # no ring ahead of panning while memory is tight
+        prefetch = 0 if governor.pressure() else PREFETCH_RING
+        ring = self.pyramid.tile_range(step, self._viewport(prefetch))
+        wanted = set(ring)
+
+        for key in [k for k in self.items if k not in wanted]:
+            self.canvas.delete(self.items.pop(key)[0])
+        for key in [k for k in self.pending if k not in wanted]:
+            self.pending.pop(key).cancel()
+
+        for key in visible:
+            if key in self.items:
+                continue
+            tile = self.pyramid.tiles.get((step,) + key)
+            if tile is not None:
+                self._place(key, tile)
+            else:
+                self._queue(key)
+        for key in ring:
+            if key in self.items or key in self.pending:
+                continue
+            # already decoded: placed from the cache once it scrolls in
+            if (step,) + key not in self.pyramid.tiles:
+                self._queue(key)
+
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+
+    def _queue(self, key):
+        if key in self.pending:
+            return
+        step = self.step
+        future = self.pool.submit(self.pyramid.tile, step, *key)
+        future.add_done_callback(
+            lambda f: self.gui.dispatcher.post(self._on_tile, step, key, f)
+        )
+        self.pending[key] = future
+
+    def _on_tile(self, step, key, future):
+        if step != self.step or future.cancelled():
+            return
+        if self.pending.get(key) is future:
+            del self.pending[key]
+        if future.exception() is not None or key in self.items:
+            return
+        if key in self.pyramid.tile_range(step, self._viewport()):
+            self._place(key, future.result())
+
+    def _place(self, key, tile):
+        tx, ty = key
+        photo = ImageTk.PhotoImage(tile)
+        item = self.canvas.create_image(tx * TILE, ty * TILE, image=photo, anchor="nw")
+        self.items[key] = (item, photo)
+
+    def _clear(self):
+        for item, _ in self.items.values():
+            self.canvas.delete(item)
+        self.items.clear()
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    def close(self):
+        """
+        Close the window and release decoded levels and tiles.
+        """
+        self._clear()
+        self.pool.shutdown(wait=False)
+        self.pyramid.close()
+        if self.top.winfo_exists():
+            self.top.destroy()
+        self.gui.zoom_view = None
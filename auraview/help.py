@@ -20,8 +20,47 @@ Options:
     --help, -h         Show this help message and exit
     --email, -e        Show email and exit
     --author, -a       Show author and exit
+    --logfile FILE     Read image paths (one per line) from FILE;
+                       .gz/.bz2/.xz accepted, '-' reads stdin
+    --manifest FILE    Read image paths from a column of a CSV or Excel sheet
+                       (read in chunks; relative paths are to FILE's folder)
+    --path-column COL  Manifest column with the paths (default: path)
+    --where QUERY      Only manifest rows matching QUERY,
+                       e.g. "rating >= 4 and client == acme"
+    --sheet NAME       Excel sheet to read (default: the active one)
+    --sort ORDER       Sort by name, folder, date, mtime, size or pixels
+    --reverse          Reverse the sort order
+    --slideshow SECS   Start a slideshow, SECS per image (key 's' toggles)
+    --memory MB        Memory budget for decoded images (key 'u' prints usage)
+    --profile NAME     Performance profile: kiosk, workstation or nas
+    --set KEY=VALUE    Override a setting (repeatable), e.g. decode_workers=4,
+                       resample=bilinear, scan_depth=2, image_ext=.jpg,.png
+                       decode_processes=4 (decode in worker processes)
+                       verify_workers=0 (no background corruption check;
+                       key 'v' lists the corrupt files found)
+                       Defaults live in config.json in the user config dir
+    --shared-decoder   Decode through one daemon shared by all open viewers
+                       (Unix; it starts on demand and exits when idle)
+    --resume           Reopen the last session (folder, image, window size);
+                       reopening the same folder resumes it too
+                       (restore_session=false turns this off)
     (No arguments)     Launch the GUI application
     [folder_path]  or [filelist/single file]
+
+A first argument naming a subcommand runs it, unless a file or folder of
+that name exists in the current directory (./export always opens it).
+
+Export (convert / resize, EXIF kept):
+    auraview export SRC... -o FOLDER [--format jpeg|png|webp]
+                   [--max-size PIXELS] [--quality 1-100] [--workers N]
+
+Metadata export (path, format, size, dimensions, dates; cached records reused):
+    auraview export-metadata SRC... [-o FILE.csv|FILE.parquet|-]
+                   [--format csv|parquet] [--workers N] [--chunk-rows N]
+
+Previews (screen-sized copies of large images, used when the window fits):
+    auraview previews SRC... [--workers N]
+    Settings: preview_size=2560 (0 = off), preview_cache_mb=1024
     """
     print(help_message)
     sys.exit(0)
@@ -10,6 +10,16 @@ import os
 import argparse
 
 from auraview.gui.gui import PhotoViewerGUI
+from auraview.core.image_controller import SORT_ORDERS
+from auraview.core.file_loader import iter_path_lines
+from auraview.core.memory_governor import governor
+from auraview.application.config import settings, ConfigError, PROFILES
+from auraview.core.exporter import ExportPipeline, EXPORT_FORMATS
+from auraview.core.preview_cache import PreviewCache, build_previews
+from auraview.core.session import load_session
+from auraview.core.metadata_export import MetadataExport, METADATA_FORMATS
+from auraview.core.manifest import Manifest
+from auraview.basic_functions.os_funs import open_text_stream
 from auraview.version import (
     __version__, __email__, __release_date__, __author__
 )
@@ -37,7 +47,90 @@ def parse_arguments():
     parser.add_argument(
         "--logfile",
         type=str,
-        help="Path to a logfile containing full image paths (one per line)"
+        help=(
+            "Path to a logfile containing full image paths (one per line); "
+            "may be gzip/bz2/xz compressed, '-' reads stdin"
+        )
+    )
+
+    # Manifest support
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        metavar="FILE",
+        help="CSV or Excel sheet listing the images in one column"
+    )
+    parser.add_argument(
+        "--path-column",
+        default="path",
+        metavar="COL",
+        help="Manifest column holding the image paths (default: path)"
+    )
+    parser.add_argument(
+        "--where",
+        metavar="QUERY",
+        help="Only manifest rows matching QUERY, e.g. \"rating >= 4 and client == acme\""
+    )
+    parser.add_argument(
+        "--sheet",
+        metavar="NAME",
+        help="Excel sheet to read (default: the active one)"
+    )
+
+    # Sort order
+    parser.add_argument(
+        "--sort",
+        choices=SORT_ORDERS,
+        help="Sort order of the file list"
+    )
+    parser.add_argument(
+        "--reverse",
+        action="store_true",
+        help="Reverse the sort order"
+    )
+
+    # Slideshow
+    parser.add_argument(
+        "--slideshow",
+        type=float,
+        metavar="SECONDS",
+        help="Start a slideshow showing each image for SECONDS"
+    )
+
+    # Memory budget of all image caches
+    parser.add_argument(
+        "--memory",
+        type=int,
+        metavar="MB",
+        help="Memory budget for decoded images (default: a share of RAM)"
+    )
+
+    # Performance configuration
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        help="Performance profile (overrides the one in the config file)"
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override one setting, e.g. --set decode_workers=4"
+    )
+
+    # Decode daemon shared by all open viewers
+    parser.add_argument(
+        "--shared-decoder",
+        action="store_true",
+        help="Decode through one background daemon shared by all viewers (Unix)"
+    )
+
+    # Warm restart
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reopen the last session: its folder, image and window"
     )
 
     # Positional argument (file or directory)
@@ -50,10 +143,301 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def parse_export_arguments(argv):
+    """
+    Parse the arguments of `auraview export`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="auraview export",
+        description="Convert and resize images, keeping their EXIF data."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Image files or folders (folders are scanned recursively)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        required=True,
+        help="Output folder"
+    )
+    parser.add_argument(
+        "--format",
+        default="jpeg",
+        type=str.lower,
+        choices=sorted({f.lower() for f in EXPORT_FORMATS} | {"jpg"}),
+        help="Output format (default: jpeg)"
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        metavar="PIXELS",
+        help="Shrink so the longest edge is at most PIXELS"
+    )
+    parser.add_argument(
+        "--quality",
+        type=int,
+        default=85,
+        help="JPEG/WebP quality 1-100 (default: 85)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: export_workers setting)"
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES))
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE")
+    return parser.parse_args(argv)
+
+
+def parse_previews_arguments(argv):
+    """
+    Parse the arguments of `auraview previews`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="auraview previews",
+        description="Pre-render the screen-sized previews of large images."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Image files or folders (folders are scanned recursively)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: export_workers setting)"
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES))
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE")
+    return parser.parse_args(argv)
+
+
+def parse_export_metadata_arguments(argv):
+    """
+    Parse the arguments of `auraview export-metadata`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="auraview export-metadata",
+        description="Write the header metadata of images to CSV or Parquet."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Image files or folders (folders are scanned recursively)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="-",
+        help="Output file (default: CSV on standard output)"
+    )
+    parser.add_argument(
+        "--format",
+        type=str.lower,
+        choices=METADATA_FORMATS,
+        help="Output format (default: from the output extension, else csv)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Header parsing processes (default: export_workers setting)"
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=20000,
+        help="Rows held in memory and written at a time (default: 20000)"
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES))
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE")
+    return parser.parse_args(argv)
+
+
+def load_settings(profile, overrides):
+    """
+    Load the configuration or exit with a message.
+    """
+    try:
+        settings.load(profile=profile, overrides=overrides)
+    except ConfigError as e:
+        print(f"Invalid configuration: {e}")
+        sys.exit(1)
+    governor.set_budget(settings.memory_mb * 2**20 or None)
+
+
+def iter_export_sources(sources, image_ext):
+    """
+    Yield image files named on the command line or found in folders.
+    """
+    for source in sources:
+        if os.path.isdir(source):
+            for path, _, files in os.walk(source):
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in image_ext:
+                        yield os.path.join(path, name)
+        elif os.path.isfile(source):
+            yield source
+        else:
+            print(f"Skipping missing path: {source}", file=sys.stderr)
+
+
+def export_main(argv):
+    """
+    Entry point of `auraview export`.
+    """
+    args = parse_export_arguments(argv)
+    load_settings(args.profile, args.set)
+    if not 1 <= args.quality <= 100:
+        print("Quality must be between 1 and 100")
+        sys.exit(1)
+
+    image_ext = {ext.lower() for ext in settings.image_ext}
+    paths = list(iter_export_sources(args.sources, image_ext))
+    if not paths:
+        print("No images to export")
+        sys.exit(1)
+
+    pipeline = ExportPipeline(
+        paths, args.output, fmt=args.format, max_size=args.max_size,
+        quality=args.quality,
+        workers=args.workers or settings.export_workers or None
+    )
+    total = len(paths)
+
+    def progress(stats, result, error):
+        count = stats.done + len(stats.failed)
+        if error is not None:
+            print(f"[{count}/{total}] {stats.failed[-1][0]} failed: {error}")
+        else:
+            print(f"[{count}/{total}] {result[0]} -> {result[1]}")
+
+    try:
+        stats = pipeline.run(on_progress=progress)
+    except KeyboardInterrupt:
+        print("Export interrupted")
+        sys.exit(130)
+    print(stats.report())
+    if stats.failed:
+        sys.exit(1)
+
+
+def export_metadata_main(argv):
+    """
+    Entry point of `auraview export-metadata`.
+    """
+    args = parse_export_metadata_arguments(argv)
+    load_settings(args.profile, args.set)
+    if args.chunk_rows <= 0:
+        print("Chunk rows must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    image_ext = {ext.lower() for ext in settings.image_ext}
+    # paths are streamed from the folder walk, never listed in full
+    export = MetadataExport(
+        iter_export_sources(args.sources, image_ext), args.output,
+        fmt=args.format,
+        workers=args.workers or settings.export_workers or None,
+        stat_workers=settings.stat_workers,
+        chunk_rows=args.chunk_rows
+    )
+
+    def progress(export):
+        print(f"{export.rows} record(s) written...", file=sys.stderr)
+
+    try:
+        export.run(on_chunk=progress)
+    except KeyboardInterrupt:
+        print("Metadata export interrupted", file=sys.stderr)
+        sys.exit(130)
+    except OSError as e:
+        print(f"Cannot write {args.output}: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(export.report(), file=sys.stderr)
+
+
+def previews_main(argv):
+    """
+    Entry point of `auraview previews`.
+    """
+    args = parse_previews_arguments(argv)
+    load_settings(args.profile, args.set)
+    if settings.preview_size <= 0:
+        print("Previews are off (preview_size=0)")
+        sys.exit(1)
+
+    image_ext = {ext.lower() for ext in settings.image_ext}
+    paths = list(iter_export_sources(args.sources, image_ext))
+    total = len(paths)
+    written = failed = 0
+    try:
+        results = build_previews(
+            paths, workers=args.workers or settings.export_workers or None
+        )
+        for count, (path, made, error) in enumerate(results, 1):
+            if error is not None:
+                failed += 1
+                print(f"[{count}/{total}] {path} failed: {error}")
+            elif made:
+                written += 1
+                print(f"[{count}/{total}] {path}")
+    except KeyboardInterrupt:
+        print("Interrupted")
+        sys.exit(130)
+    # workers only prune now and then; leave the cache within its cap
+    cache = PreviewCache(settings.preview_size, settings.preview_cache_mb * 2**20)
+    cache.disk.prune()
+    cache.close()
+    print(f"{written} preview(s) written, {total - written - failed} up to date "
+          f"or small, {failed} failed")
+    if failed:
+        sys.exit(1)
+
+
+def find_session(path, resume):
+    """
+    Return the saved session to resume, or None.
+
+    A session resumes when --resume is given, or when the folder being
+    opened (the current one without a path) is the one it was saved for.
+
+    :param path: Positional path argument or None
+    :param resume: --resume was given
+    """
+    if not settings.restore_session:
+        return None
+    state = load_session()
+    if state is None:
+        if resume:
+            print("No saved session to resume")
+        return None
+    if resume:
+        return state
+    if path is not None and not os.path.isdir(path):
+        return None
+    loc = os.path.abspath(os.path.expanduser(path or "."))
+    if state.get("loc") == loc and state.get("recursive"):
+        return state
+    return None
+
+
 def main():
     """
     Docstring for main
     """
+    # a file or folder named like a subcommand is still opened
+    command = None
+    if len(sys.argv) > 1 and not os.path.exists(sys.argv[1]):
+        command = sys.argv[1]
+    if command == "export":
+        export_main(sys.argv[2:])
+        return
+    if command == "export-metadata":
+        export_metadata_main(sys.argv[2:])
+        return
+    if command == "previews":
+        previews_main(sys.argv[2:])
+        return
+
     args = parse_arguments()
 
     # --- Meta info flags ---
@@ -77,28 +461,84 @@ def main():
         print(f"Release Date {__release_date__}")
         sys.exit(0)
 
+    if args.slideshow is not None and args.slideshow <= 0:
+        print("Slideshow interval must be positive")
+        sys.exit(1)
+
+    overrides = list(args.set)
+    if args.memory is not None:
+        if args.memory <= 0:
+            print("Memory budget must be positive")
+            sys.exit(1)
+        overrides.append(f"memory_mb={args.memory}")
+    if args.shared_decoder:
+        overrides.append("shared_decoder=true")
+
+    load_settings(args.profile, overrides)
+
+    gui_args = {
+        "sort_order": args.sort,
+        "sort_reverse": args.reverse,
+        "slideshow": args.slideshow
+    }
+
+    if args.logfile and args.manifest:
+        print("Use either --logfile or --manifest")
+        sys.exit(1)
+
+    # --- Manifest mode ---
+    if args.manifest:
+        if not os.path.isfile(args.manifest):
+            print("Invalid manifest path")
+            sys.exit(1)
+
+        try:
+            manifest = Manifest(
+                args.manifest, args.path_column, args.where, args.sheet
+            )
+        except ValueError as e:
+            print(f"Cannot read manifest: {e}")
+            sys.exit(1)
+
+        # rows are read and filtered chunk by chunk while the window is open
+        obj = PhotoViewerGUI(stream=iter(manifest), **gui_args)
+        obj.run()
+        return
+
     # --- Logfile mode ---
     if args.logfile:
-        if not os.path.isfile(args.logfile):
+        if args.logfile != "-" and not os.path.isfile(args.logfile):
             print("Invalid logfile path")
             sys.exit(1)
 
-        with open(args.logfile, "r") as f:
-            files = [line.strip() for line in f if line.strip()]
+        try:
+            stream = open_text_stream(args.logfile)
+        except OSError as e:
+            print(f"Cannot read logfile: {e}")
+            sys.exit(1)
+
+        # paths are streamed in the background; the window opens at once
+        obj = PhotoViewerGUI(stream=iter_path_lines(stream), **gui_args)
+        obj.run()
+        return
 
-        PhotoViewerGUI(files=files)
+    # --- Resumed session ---
+    session = find_session(args.path, args.resume)
+    if session is not None:
+        obj = PhotoViewerGUI(session=session, **gui_args)
+        obj.run()
         return
 
     # --- Normal mode ---
     if args.path:
         if os.path.isdir(args.path):
-            obj=PhotoViewerGUI(loc=args.path)
+            obj=PhotoViewerGUI(loc=args.path, **gui_args)
             obj.run()
         else:
-            obj = PhotoViewerGUI(files=args.path)
+            obj = PhotoViewerGUI(files=args.path, **gui_args)
             obj.run()
     else:
-        obj = PhotoViewerGUI()
+        obj = PhotoViewerGUI(**gui_args)
         obj.run()
 
 
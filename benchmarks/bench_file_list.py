@@ -0,0 +1,69 @@
+"""
+benchmarks/bench_file_list.py
+
+Memory and deletion latency of FileList against a plain list of paths.
+
+    python -m benchmarks.bench_file_list [N]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import sys
+import time
+import random
+import tracemalloc
+
+from auraview.core.file_list import FileList
+
+
+def make_paths(n):
+    """
+    Synthetic camera dump: 1000 folders with long shared prefixes.
+    """
+    return [
+        f"/mnt/nas/photos/archive/{2000 + i % 25}/card_{i % 1000:04d}/IMG_{i:07d}.JPG"
+        for i in range(n)
+    ]
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def measure_deletes(seq, count=2000):
+    random.seed(0)
+    timings = []
+    for _ in range(count):
+        i = random.randrange(len(seq))
+        t0 = time.perf_counter()
+        seq.pop(i)
+        timings.append(time.perf_counter() - t0)
+    timings.sort()
+    return sum(timings) / count, timings[int(count * 0.99)]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    plain, plain_bytes = measure_memory(lambda: make_paths(n))
+    compact, compact_bytes = measure_memory(lambda: FileList(make_paths(n)))
+
+    print(f"{n:,} paths")
+    print(f"list      memory {plain_bytes / 2**20:8.1f} MiB")
+    print(f"FileList  memory {compact_bytes / 2**20:8.1f} MiB")
+
+    for name, seq in (("list", plain), ("FileList", compact)):
+        mean, p99 = measure_deletes(seq)
+        print(f"{name:9} pop(i)  mean {mean * 1e6:7.1f} us   p99 {p99 * 1e6:7.1f} us")
+
+    t0 = time.perf_counter()
+    for i in range(0, len(compact), max(len(compact) // 10000, 1)):
+        compact[i]
+    print(f"FileList  random index  {(time.perf_counter() - t0) / 10000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
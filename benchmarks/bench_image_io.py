@@ -0,0 +1,82 @@
+"""
+benchmarks/bench_image_io.py
+
+Syscalls and bytes copied for one image visit (decode + metadata panel),
+path based helpers vs. one shared ImageSource mapping. Linux only
+(reads /proc/self/io).
+
+    python -m benchmarks.bench_image_io [IMAGE]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+from auraview.core.image_source import ImageSource
+from auraview.core.photo_module import (
+    create_image_obj, get_pic_wh, get_dpi_text, get_image_ext,
+    image_datetime_original, image_datetime_digitized, image_datetime
+)
+
+OPENS = [0]
+
+
+def audit(event, _args):
+    if event == "open":
+        OPENS[0] += 1
+
+
+def proc_io():
+    with open("/proc/self/io") as f:
+        fields = dict(line.split(": ") for line in f.read().splitlines())
+    return int(fields["syscr"]), int(fields["rchar"])
+
+
+def visit(file):
+    create_image_obj(file, 1920, 1080)
+    get_pic_wh(file)
+    get_dpi_text(file)
+    get_image_ext(file)
+    image_datetime_original(file)
+    image_datetime_digitized(file)
+    image_datetime(file)
+
+
+def measure(label, fn, runs=10):
+    fn()  # warm the page cache
+    opens0 = OPENS[0]
+    syscr0, rchar0 = proc_io()
+    for _ in range(runs):
+        fn()
+    syscr1, rchar1 = proc_io()
+    # the two /proc reads themselves are subtracted
+    syscr = (syscr1 - syscr0 - 2) / runs
+    rchar = (rchar1 - rchar0) / runs
+    opens = (OPENS[0] - opens0 - 2) / runs
+    print(f"{label:12} opens {opens:5.1f}   read syscalls {syscr:7.1f}   "
+          f"bytes via read() {rchar / 2**20:7.2f} MiB")
+
+
+def main():
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "bench.jpg")
+        Image.effect_noise((6000, 4000), 64).convert("RGB").save(path, quality=95)
+    print(f"{path}: {os.path.getsize(path) / 2**20:.1f} MiB")
+
+    sys.addaudithook(audit)
+    measure("path based", lambda: visit(path))
+
+    def mapped():
+        with ImageSource(path) as src:
+            visit(src)
+    measure("ImageSource", mapped)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+benchmarks/bench_listing_cache.py
+
+Time to list a large folder tree: os.walk + natsorted (the old scan) vs.
+ListingCache on a first scan, an unchanged reopen and a reopen after one
+folder changed.
+
+    python -m benchmarks.bench_listing_cache [FOLDERS] [FILES_PER_FOLDER]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import time
+import tempfile
+
+from natsort import natsorted
+
+from auraview.core.listing_cache import ListingCache, RACY_NS
+
+IMAGE_EXT = {".jpg", ".jpeg", ".png", ".heic"}
+
+
+def old_scan(root):
+    out = []
+    for path, _, files in os.walk(root):
+        for name in files:
+            if os.path.splitext(name)[1].lower() in IMAGE_EXT:
+                out.append(os.path.join(path, name))
+    return natsorted(out, key=os.path.basename)
+
+
+def measure(label, fn):
+    start = time.perf_counter()
+    out = fn()
+    print(f"{label:22} {time.perf_counter() - start:7.3f} s   {len(out)} files")
+    return out
+
+
+def main():
+    folders = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_folder = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    root = tempfile.mkdtemp()
+    for d in range(folders):
+        sub = os.path.join(root, f"2024-{d:04d}")
+        os.makedirs(sub)
+        for i in range(per_folder):
+            ext = ".jpg" if i % 3 else ".png"
+            open(os.path.join(sub, f"IMG_{(i * 7919 + d) % 100000}{ext}"), "w").close()
+    cache = ListingCache(os.path.join(tempfile.mkdtemp(), "listings.sqlite"))
+
+    expected = measure("os.walk + natsorted", lambda: old_scan(root))
+    measure("cache, first scan", lambda: cache.walk(root, IMAGE_EXT))
+    # listings taken right after a change are not trusted; let them age
+    time.sleep(RACY_NS / 1e9 + 0.1)
+    measure("cache, settle", lambda: cache.walk(root, IMAGE_EXT))
+    out = measure("cache, unchanged", lambda: cache.walk(root, IMAGE_EXT))
+    assert out == expected
+
+    open(os.path.join(root, "2024-0003", "IMG_new.jpg"), "w").close()
+    time.sleep(RACY_NS / 1e9 + 0.1)
+    out = measure("cache, one folder new", lambda: cache.walk(root, IMAGE_EXT))
+    assert out == old_scan(root)
+
+
+if __name__ == "__main__":
+    main()
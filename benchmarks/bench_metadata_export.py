@@ -0,0 +1,56 @@
+"""
+benchmarks/bench_metadata_export.py
+
+Throughput of MetadataExport over small synthetic JPEGs: a cold run
+(every header parsed) and a warm run (records from the metadata cache).
+
+    python -m benchmarks.bench_metadata_export [N_FILES] [WORKERS]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+from auraview.core.metadata_cache import MetadataCache
+from auraview.core.metadata_export import MetadataExport
+
+
+def make_files(root, count):
+    exif = Image.Exif()
+    exif[0x8769] = {36867: "2024:05:06 07:08:09"}
+    img = Image.new("RGB", (64, 48), "gray")
+    paths = []
+    for i in range(count):
+        folder = os.path.join(root, f"{i // 1000:04d}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"IMG_{i:07d}.jpg")
+        img.save(path, exif=exif.tobytes())
+        paths.append(path)
+    return paths
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    root = tempfile.mkdtemp()
+    paths = make_files(root, count)
+    cache = MetadataCache(os.path.join(tempfile.mkdtemp(), "metadata.sqlite"))
+
+    for label, fmt in (("cold", "csv"), ("warm", "csv"), ("warm", "parquet")):
+        output = os.path.join(root, f"metadata.{fmt}")
+        export = MetadataExport(paths, output, workers=workers, cache=cache)
+        try:
+            export.run()
+        except OSError as e:
+            print(f"{label:5} {fmt:8} skipped: {e}")
+            continue
+        print(f"{label:5} {fmt:8} {export.report()}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+benchmarks/bench_photo_pool.py
+
+Display latency and allocation churn of showing a new frame in a Tk label:
+a fresh ImageTk.PhotoImage per update vs. pasting into a pooled one.
+Needs a display; on a headless box run it under Xvfb:
+
+    python -m benchmarks.bench_photo_pool [WIDTH HEIGHT]
+    xvfb-run -s "-screen 0 1920x1080x24" python -m benchmarks.bench_photo_pool
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import sys
+import time
+import tracemalloc
+import tkinter as tk
+
+from PIL import Image, ImageTk
+
+from auraview.gui.photo_pool import PhotoPool
+
+FRAMES = 100
+
+
+def fresh(label, img, state):
+    photo = ImageTk.PhotoImage(img)
+    label.config(image=photo)
+    state["photo"] = photo  # the previous one is collected here
+
+
+def pooled(label, img, state):
+    photo = state["pool"].photo_for(img)
+    if photo is not state.get("photo"):
+        label.config(image=photo)
+        state["photo"] = photo
+
+
+def measure(name, root, label, frames, show):
+    state = {"pool": PhotoPool()}
+    show(label, frames[0], state)
+    root.update()
+    created0 = len(root.tk.call("image", "names"))
+
+    tracemalloc.start()
+    times = []
+    peak_images = 0
+    for img in frames:
+        start = time.perf_counter()
+        show(label, img, state)
+        root.update_idletasks()
+        times.append(time.perf_counter() - start)
+        peak_images = max(peak_images, len(root.tk.call("image", "names")))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times.sort()
+    print(
+        f"{name:8} median {times[len(times) // 2] * 1000:6.2f} ms   "
+        f"p95 {times[int(len(times) * 0.95)] * 1000:6.2f} ms   "
+        f"Tk images alive (peak) {peak_images - created0 + 1:3d}   "
+        f"python peak {peak / 2**20:6.2f} MiB   "
+        f"allocated {state['pool'].allocated if show is pooled else len(frames)}"
+    )
+
+
+def main():
+    width, height = (int(v) for v in sys.argv[1:3]) if len(sys.argv) > 2 else (1920, 1080)
+    frames = [
+        Image.effect_noise((width, height), 32 + i % 64).convert("RGB")
+        for i in range(FRAMES)
+    ]
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"{e}: run under a display, e.g. xvfb-run python -m benchmarks.bench_photo_pool")
+    label = tk.Label(root)
+    label.pack()
+    print(f"{FRAMES} updates of {width}x{height}")
+    measure("fresh", root, label, frames, fresh)
+    measure("pooled", root, label, frames, pooled)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
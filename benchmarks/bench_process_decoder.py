@@ -0,0 +1,75 @@
+"""
+benchmarks/bench_process_decoder.py
+
+Frames per second decoding and resizing a batch of large images, with a
+thread pool (GIL shared with the viewer) vs. ProcessDecoder workers
+returning pixels through shared memory. Also reports how long the main
+thread is stalled by a tight Python loop meanwhile, a stand-in for Tk.
+
+    python -m benchmarks.bench_process_decoder [N_IMAGES] [WORKERS]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import os
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from auraview.core.photo_module import create_image_obj
+from auraview.core.process_decoder import ProcessDecoder
+
+WIDTH, HEIGHT = 1920, 1080
+
+
+def main_thread_lag(futures):
+    """
+    Worst gap between iterations of a 1 ms loop until futures finish.
+    """
+    worst = 0.0
+    last = time.perf_counter()
+    while not all(f.done() for f in futures):
+        time.sleep(0.001)
+        now = time.perf_counter()
+        worst = max(worst, now - last)
+        last = now
+    return worst
+
+
+def measure(label, submit, paths):
+    start = time.perf_counter()
+    futures = [submit(path) for path in paths]
+    lag = main_thread_lag(futures)
+    for f in futures:
+        f.result()
+    elapsed = time.perf_counter() - start
+    print(f"{label:10} {len(paths) / elapsed:7.1f} frames/s   "
+          f"worst main thread stall {lag * 1000:6.1f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 2)
+    folder = tempfile.mkdtemp()
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"{i}.jpg")
+        Image.effect_noise((4000, 3000), 40 + i).convert("RGB").save(path, quality=90)
+        paths.append(path)
+    print(f"{count} images 4000x3000 -> {WIDTH}x{HEIGHT}, {workers} workers")
+
+    with ThreadPoolExecutor(workers) as pool:
+        measure("threads", lambda p: pool.submit(create_image_obj, p, WIDTH, HEIGHT), paths)
+
+    decoder = ProcessDecoder(workers)
+    # start the workers outside the measurement
+    decoder.frame(paths[0], 16, 16).result()
+    measure("processes", lambda p: decoder.frame(p, WIDTH, HEIGHT), paths)
+    decoder.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+benchmarks/bench_search_index.py
+
+Indexing time and query latency of SearchIndex over synthetic paths,
+checked against a linear scan.
+
+    python -m benchmarks.bench_search_index [N_PATHS]
+
+Author: Benevant Mathew
+Date: 2026-10-19
+"""
+import sys
+import time
+import random
+
+from auraview.core.search_index import SearchIndex
+
+WORDS = ["beach", "party", "wedding", "IMG", "DSC", "holiday", "Paris", "snow"]
+QUERIES = ["0012345", "paris_0001", "dog", "IMG_99", "2013/snow", "e_10/dsc", "x", "99"]
+
+
+def make_paths(n):
+    random.seed(1)
+    return [
+        f"/data/photos/{2000 + i % 25}/{random.choice(WORDS)}_{i // 500}/"
+        f"{random.choice(WORDS)}_{i:07d}.{random.choice(['jpg', 'HEIC', 'png'])}"
+        for i in range(n)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    paths = make_paths(count)
+    index = SearchIndex()
+
+    start = time.perf_counter()
+    index.add(paths)
+    while index.pending:
+        time.sleep(0.05)
+    print(f"indexed {len(index)} paths in {time.perf_counter() - start:.1f} s (background)")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        found = index.search(query)
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        expected = {p for p in paths if query.lower() in p.lower()}
+        linear = time.perf_counter() - start
+        assert found == expected, query
+        print(f"{query!r:14} {len(found):8d} matches  index {indexed * 1000:7.1f} ms  "
+              f"scan {linear * 1000:7.1f} ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()